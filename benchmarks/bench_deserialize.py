@@ -0,0 +1,60 @@
+"""Transactions per second deserialized reflectively and by compiled deserializers.
+
+Run from the repository root::
+
+    python benchmarks/bench_deserialize.py
+"""
+import os
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import deserialize  # noqa: E402
+from stand_in import transactions_page  # noqa: E402
+
+from fractal_python.banking.accounts import BankTransaction  # noqa: E402
+from fractal_python.deserializer import deserialize_list, project_list  # noqa: E402
+
+TRANSACTIONS = 100_000
+
+
+def per_second(func, page) -> float:
+    r"""Deserialize the page once and measure the rate.
+
+    :param func: function taking the page and returning the models
+    :param page: list of transaction dicts
+    :return: transactions per second
+    """
+    start = time.perf_counter()
+    func(page)
+    return len(page) / (time.perf_counter() - start)
+
+
+def main():
+    page = transactions_page(TRANSACTIONS)
+    before = per_second(
+        lambda data: deserialize.deserialize(List[BankTransaction], data), page
+    )
+    after = per_second(lambda data: deserialize_list(BankTransaction, data), page)
+    lazy = per_second(
+        lambda data: [
+            transaction.id
+            for transaction in deserialize_list(BankTransaction, data, lazy=True)
+        ],
+        page,
+    )
+    projected = per_second(
+        lambda data: project_list(BankTransaction, ("id", "amount"), data), page
+    )
+    print(f"deserialize.deserialize: {before:10.0f} transactions/s")
+    print(f"compiled deserializer:   {after:10.0f} transactions/s")
+    print(f"speed up:                {after / before:10.2f}x")
+    print(f"lazy, reading only ids:  {lazy:10.0f} transactions/s")
+    print(f"lazy speed up:           {lazy / after:10.2f}x over compiled")
+    print(f"projected id and amount: {projected:10.0f} transactions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Rows per second joining transactions to reference data.
+
+Run from the repository root::
+
+    python benchmarks/bench_enrich.py
+
+The linear join scans the lists of banks, merchants and categories for each
+transaction, as callers did before ReferenceIndex.
+"""
+import os
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stand_in import transactions_page  # noqa: E402
+
+from fractal_python.banking import ReferenceIndex, new_bank  # noqa: E402
+from fractal_python.banking.accounts import BankTransaction  # noqa: E402
+from fractal_python.banking.categories import Category  # noqa: E402
+from fractal_python.banking.merchants import Merchant  # noqa: E402
+from fractal_python.deserializer import deserialize_list  # noqa: E402
+
+TRANSACTIONS = 200_000
+BANKS = [new_bank(i, f"Bank {i}") for i in range(50)]
+MERCHANTS = [Merchant(f"merchantId{i}", f"Merchant {i}", "", "") for i in range(300)]
+CATEGORIES = [Category(f"categoryId{i}", f"Category {i}") for i in range(40)]
+
+
+def linear(transactions: List[BankTransaction]) -> int:
+    r"""Join by scanning the reference lists.
+
+    :param transactions: transactions to join
+    :return: rows joined
+    """
+    rows = 0
+    for transaction in transactions:
+        next(x for x in BANKS if x.id == transaction.bank_id)
+        next(x for x in MERCHANTS if x.id == transaction.merchant.id)
+        next(x for x in CATEGORIES if x.id == transaction.category.id)
+        rows += 1
+    return rows
+
+
+def rows_per_second(join: Callable[[List[BankTransaction]], int], data) -> float:
+    r"""Time a join.
+
+    :param join: function joining the transactions
+    :param data: transactions
+    :return: rows joined per second
+    """
+    start = time.perf_counter()
+    rows = join(data)
+    return rows / (time.perf_counter() - start)
+
+
+def main():
+    transactions = deserialize_list(BankTransaction, transactions_page(TRANSACTIONS))
+    index = ReferenceIndex(BANKS, CATEGORIES, MERCHANTS)
+    before = rows_per_second(linear, transactions[: TRANSACTIONS // 10])
+    after = rows_per_second(
+        lambda data: sum(1 for _ in index.enrich(data)), transactions
+    )
+    print(f"linear scan:    {before:12.0f} rows/s")
+    print(f"ReferenceIndex: {after:12.0f} rows/s")
+    print(f"speed up:       {after / before:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Memory, allocations and rate building transactions with and without interning.
+
+Run from the repository root::
+
+    python benchmarks/bench_interning.py
+
+The transactions have 300 distinct merchants and 40 distinct categories.
+"""
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stand_in import transactions_page  # noqa: E402
+
+from fractal_python.banking.accounts import BankTransaction  # noqa: E402
+from fractal_python.deserializer import deserializer  # noqa: E402
+from fractal_python.interning import Interner  # noqa: E402
+
+TRANSACTIONS = 100_000
+
+
+def measure(build: Callable, page) -> Tuple[float, float, float]:
+    r"""Build every transaction of a page.
+
+    :param build: function from a JSON record to a BankTransaction
+    :param page: JSON records
+    :return: bytes and allocated blocks held per transaction, transactions/s
+    """
+    start = time.perf_counter()
+    [build(record) for record in page]  # pylint: disable=W0106
+    rate = len(page) / (time.perf_counter() - start)
+    tracemalloc.start()
+    models = [build(record) for record in page]
+    snapshot = tracemalloc.take_snapshot()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return held / len(models), blocks / len(models), rate
+
+
+def main():
+    page = transactions_page(TRANSACTIONS)
+    build = deserializer(BankTransaction)
+    plain = measure(build, page)
+    interned = measure(Interner().wrap(build), page)
+    for name, (held, blocks, rate) in (("plain", plain), ("interned", interned)):
+        print(
+            f"{name:9} {held:7.0f} bytes/transaction {blocks:5.1f} blocks/transaction"
+            f" {rate:9.0f} transactions/s"
+        )
+    print(f"memory saved: {1 - interned[0] / plain[0]:.1%}")
+
+
+if __name__ == "__main__":
+    main()
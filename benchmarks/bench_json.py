@@ -0,0 +1,48 @@
+"""Decode and encode rates of each installed JSON backend.
+
+Run from the repository root::
+
+    python benchmarks/bench_json.py
+
+Each backend decodes pages of transactions as the API returns them, from the
+UTF-8 bytes of the response body, and encodes them back.
+"""
+import os
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stand_in import transactions_page  # noqa: E402
+
+from fractal_python import json_backend  # noqa: E402
+
+PAGES = 50
+PAGE_SIZE = 1000
+
+
+def mib_per_second(func: Callable[[], object], size: int) -> float:
+    r"""Time func over PAGES runs.
+
+    :param func: function handling one page
+    :param size: bytes in the page
+    :return: MiB of JSON handled per second
+    """
+    start = time.perf_counter()
+    for _ in range(PAGES):
+        func()
+    return PAGES * size / 2**20 / (time.perf_counter() - start)
+
+
+def main():
+    page = {"results": transactions_page(PAGE_SIZE), "links": {}}
+    body = json_backend.BACKENDS["json"].dumps(page, None).encode("utf-8")
+    for name, backend in json_backend.BACKENDS.items():
+        loads = mib_per_second(lambda: backend.loads(body), len(body))
+        dumps = mib_per_second(lambda: backend.dumps(page, None), len(body))
+        print(f"{name:8} loads {loads:8.1f} MiB/s  dumps {dumps:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Bytes per model object with slotted classes and with dict-backed objects.
+
+Run from the repository root::
+
+    python benchmarks/bench_memory.py
+
+The dict-backed figure holds the same values, nested objects included, in
+objects with a ``__dict__``, as the models did before they were slotted.
+"""
+import os
+import sys
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import attr  # noqa: E402
+from stand_in import transactions_page  # noqa: E402
+
+from fractal_python.banking.accounts import BankTransaction  # noqa: E402
+from fractal_python.deserializer import deserialize_list  # noqa: E402
+
+TRANSACTIONS = 50_000
+
+
+def bytes_per_object(build: Callable[[], List[Any]]) -> float:
+    r"""Measure the memory held by the objects build returns.
+
+    :param build: function making the objects
+    :return: bytes allocated per object and still held
+    """
+    tracemalloc.start()
+    objects = build()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held / len(objects)
+
+
+def with_dict(value: Any) -> Any:
+    r"""Copy a model into dict-backed objects.
+
+    :param value: model or attribute value
+    :return: the value with every model replaced by a SimpleNamespace
+    """
+    if attr.has(type(value)):
+        return SimpleNamespace(
+            **{
+                field.name: with_dict(getattr(value, field.name))
+                for field in attr.fields(type(value))
+            }
+        )
+    return value
+
+
+def main():
+    page = transactions_page(TRANSACTIONS)
+    slotted = bytes_per_object(lambda: deserialize_list(BankTransaction, page))
+    dicts = bytes_per_object(
+        lambda: [with_dict(model) for model in deserialize_list(BankTransaction, page)]
+    )
+    print(f"dict-backed BankTransaction: {dicts:8.0f} bytes/object")
+    print(f"slotted BankTransaction:     {slotted:8.0f} bytes/object")
+    print(f"saving:                      {1 - slotted / dicts:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Pages per second with and without connection reuse.
+
+Run from the repository root::
+
+    python benchmarks/bench_pooling.py
+
+``keep_alive=0`` recycles the session before every request, which matches the
+old behaviour of calling ``requests.request`` for each page.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stand_in import StandIn  # noqa: E402
+
+from fractal_python.api_client import ApiClient  # noqa: E402
+from fractal_python.banking import retrieve_bank_transactions  # noqa: E402
+
+PAGES = 500
+
+
+def pages_per_second(url: str, keep_alive) -> float:
+    r"""Walk every page of transactions and measure the rate.
+
+    :param url: base url of the stand-in
+    :param keep_alive: keep_alive setting for the client
+    :return: pages per second
+    """
+    with ApiClient(url, url, "key", "partner", keep_alive=keep_alive) as client:
+        start = time.perf_counter()
+        pages = sum(1 for _ in retrieve_bank_transactions(client, "company"))
+        return pages / (time.perf_counter() - start)
+
+
+def main():
+    with StandIn(pages=PAGES) as server:
+        before = pages_per_second(server.url, keep_alive=0)
+        after = pages_per_second(server.url, keep_alive=None)
+    print(f"new connection per page: {before:8.1f} pages/s")
+    print(f"pooled keep-alive:       {after:8.1f} pages/s")
+    print(f"speed up:                {after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
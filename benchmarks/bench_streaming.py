@@ -0,0 +1,75 @@
+"""Peak memory and rate walking large pages with and without streaming.
+
+Run from the repository root::
+
+    python benchmarks/bench_streaming.py
+
+Each transaction is counted and dropped, so the peak is what the client held
+to read one page: the whole body and every model built from it when
+buffered, one chunk and one record when streamed. The stand-in runs in its
+own process so its allocations are not counted.
+"""
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+from typing import Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stand_in import StandIn  # noqa: E402
+
+from fractal_python.api_client import ApiClient  # noqa: E402
+from fractal_python.banking import iter_bank_transactions  # noqa: E402
+
+PAGES = 4
+PAGE_SIZE = 20_000
+
+
+def walk(url: str, stream: bool) -> Tuple[float, float]:
+    r"""Count every transaction, measuring peak memory and rate.
+
+    :param url: base url of the stand-in
+    :param stream: parse pages as they are read
+    :return: peak MiB allocated and transactions per second
+    """
+    with ApiClient(url, url, "key", "partner") as client:
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = sum(1 for _ in iter_bank_transactions(client, "company", stream=stream))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return peak / 2**20, count / elapsed
+
+
+def serve(urls: multiprocessing.Queue, stop):
+    r"""Run the stand-in until stop is set.
+
+    :param urls: queue to put the url of the stand-in on
+    :param stop: event set when the benchmark is done
+    """
+    with StandIn(pages=PAGES, page_size=PAGE_SIZE) as server:
+        urls.put(server.url)
+        stop.wait()
+
+
+def main():
+    urls: multiprocessing.Queue = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    server = multiprocessing.Process(target=serve, args=(urls, stop))
+    server.start()
+    try:
+        url = urls.get()
+        buffered = walk(url, stream=False)
+        streamed = walk(url, stream=True)
+    finally:
+        stop.set()
+        server.join()
+    print(f"buffered: {buffered[0]:8.1f} MiB peak {buffered[1]:10.0f} transactions/s")
+    print(f"streamed: {streamed[0]:8.1f} MiB peak {streamed[1]:10.0f} transactions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Transactions built per second under each validation policy.
+
+Run from the repository root::
+
+    python benchmarks/bench_validation.py
+
+Sampled validates 1% of the transactions, the default sample rate.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stand_in import transactions_page  # noqa: E402
+
+from fractal_python.banking.accounts import BankTransaction  # noqa: E402
+from fractal_python.deserializer import deserializer  # noqa: E402
+from fractal_python.validation import MODES, ValidationPolicy  # noqa: E402
+
+TRANSACTIONS = 100_000
+ROUNDS = 5
+
+
+def rate(mode: str, page) -> float:
+    r"""Build every transaction of a page under a policy.
+
+    :param mode: full, sampled or off
+    :param page: JSON records
+    :return: best transactions per second over ROUNDS
+    """
+    build = ValidationPolicy(mode, seed=0).wrap(deserializer(BankTransaction))
+    best = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for record in page:
+            build(record)
+        best = max(best, len(page) / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    page = transactions_page(TRANSACTIONS)
+    rates = {mode: rate(mode, page) for mode in MODES}
+    for mode, per_second in rates.items():
+        print(
+            f"{mode:8} {per_second:9.0f} transactions/s"
+            f" {per_second / rates['full']:5.2f}x full"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Local HTTP stand-in for the Fractal API used by the benchmarks."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    r"""HTTPServer handling each request on a thread.
+
+    http.server only has ThreadingHTTPServer from Python 3.7.
+    """
+
+    daemon_threads = True
+
+
+TOKEN = {
+    "access_token": "benchmark-token",
+    "partner_id": "benchmark-partner",
+    "expires_in": 1800,
+    "token_type": "Bearer",
+}
+
+
+def transaction(index: int) -> Dict[str, Any]:
+    r"""Make a realistic bank transaction record.
+
+    :param index: sequence number used to vary the record
+    :return: transaction as the API returns it
+    """
+    day = 1 + index % 28
+    return {
+        "id": f"transactionId{index}",
+        "bankId": 6,
+        "accountId": f"accountId{index % 7}",
+        "bookingDate": f"2020-10-{day:02d}T00:00Z",
+        "valueDate": f"2020-10-{day:02d}T00:00Z",
+        "reference": f"REF{index}",
+        "transactionCode": "",
+        "transactionSubCode": "",
+        "proprietaryCode": "",
+        "proprietarySubCode": "",
+        "description": f"Card payment {index}",
+        "amount": f"{index % 1000}.{index % 100:02d}",
+        "currency": "GBP",
+        "type": "DEBIT" if index % 3 else "CREDIT",
+        "status": "BOOKED",
+        "merchant": {
+            "id": f"merchantId{index % 300}",
+            "name": f"Merchant {index % 300}",
+            "categoryCode": "",
+            "addressLine": "",
+            "source": "MODEL",
+        },
+        "category": {
+            "id": f"categoryId{index % 40}",
+            "name": f"Category {index % 40}",
+            "source": "MODEL",
+        },
+        "externalId": "",
+        "source": "OPENBANKING",
+    }
+
+
+def transactions_page(size: int, offset: int = 0) -> List[Dict[str, Any]]:
+    r"""Make a page of transaction records.
+
+    :param size: number of records
+    :param offset: index of the first record
+    :return: list of transactions
+    """
+    return [transaction(offset + i) for i in range(size)]
+
+
+class StandIn:
+    r"""Threaded keep-alive HTTP server serving paged transactions.
+
+    :attr pages: number of pages in a full walk
+    :attr page_size: records per page
+    :attr url: base url of the running server
+    """
+
+    def __init__(self, pages: int = 100, page_size: int = 10):
+        self.pages = pages
+        self.page_size = page_size
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):  # pylint: disable=W0221
+                pass
+
+            def _send(self, body: Dict[str, Any]):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):  # skipcq: PYL-R0201
+                self._send(TOKEN)
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                page = int(query.get("pageId", ["1"])[0])
+                links = {}
+                if page < stand_in.pages:
+                    path = f"/banking/v2/transactions?pageId={page + 1}"
+                    links["next"] = stand_in.url + path
+                results = transactions_page(
+                    stand_in.page_size, (page - 1) * stand_in.page_size
+                )
+                self._send({"results": results, "links": links})
+
+        self._server = _ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        host, port = self._server.server_address[:2]
+        self.url = f"http://{host}:{port}"
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    def __enter__(self) -> "StandIn":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,185 @@
+"""Asyncio interface to the Fractal API.
+
+Calls are made by the pooled :class:`~fractal_python.api_client.ApiClient` on a
+bounded thread pool, so the event loop is never blocked and many companies can
+be downloaded concurrently while sharing the same models as the sync API.
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Callable
+
+import requests
+
+from fractal_python import api_client
+from fractal_python.api_client import ApiClient
+
+DEFAULT_MAX_WORKERS = 64
+
+# Python 3.6 has no get_running_loop, but there get_event_loop returns the
+# running loop when called from a coroutine.
+_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+class AsyncApiClient:
+    r"""Asyncio client for Fractal API.
+
+    :attr client: the ApiClient that makes the calls
+    :attr max_workers: maximum number of calls in flight at once
+    """
+
+    def __init__(self, client: ApiClient, max_workers: int = DEFAULT_MAX_WORKERS):
+        r"""Fractal API asyncio Client.
+
+        :param client: sync client used to make the calls
+        :param max_workers: maximum number of calls in flight at once
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fractal-aio"
+        )
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        r"""Use the client as an async context manager.
+
+        :return: this client
+        :rtype: AsyncApiClient
+        """
+        return self
+
+    async def __aexit__(self, *args):
+        r"""Close the client on leaving the context.
+
+        :param *args: exception details, ignored
+        """
+        await self.aclose()
+
+    async def aclose(self):
+        r"""Close pooled connections and stop the worker threads."""
+        await self.run(self.client.close)
+        self._executor.shutdown(wait=False)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        r"""Run a blocking call on the worker threads.
+
+        :param func: function to call
+        :param *args: positional arguments for func
+        :param **kwargs: keyword arguments for func
+        :return: result of func
+        """
+        loop = _running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def call_api(
+        self, resource_path: str, method: str, **kwargs
+    ) -> requests.Response:
+        r"""Call the Fractal API.
+
+        :param resource_path: path to the resource
+        :type resource_path: str
+        :param method: GET, DELETE, PUT, POST
+        :type method: str
+        :param **kwargs: as for ApiClient.call_api
+        :return: response
+        :rtype: requests.Response
+        """
+        return await self.run(self.client.call_api, resource_path, method, **kwargs)
+
+    async def call_url(self, url: str, method: str, **kwargs) -> requests.Response:
+        r"""Call a Fractal API URL.
+
+        :param url: full url of the resource
+        :type url: str
+        :param method: GET, DELETE, PUT, POST
+        :type method: str
+        :param **kwargs: as for ApiClient.call_url
+        :return: response
+        :rtype: requests.Response
+        """
+        return await self.run(self.client.call_url, url, method, **kwargs)
+
+
+def sandbox(
+    api_key: str, partner_id: str, max_workers: int = DEFAULT_MAX_WORKERS, **kwargs
+) -> AsyncApiClient:
+    r"""Make an asyncio client for the sandbox api.
+
+    :param api_key: secret key issued to the partner
+    :param partner_id: unique if of the partner
+    :param max_workers: maximum number of calls in flight at once
+    :param **kwargs: optional ApiClient settings such as keep_alive
+    :return: an AsyncApiClient for the sandbox
+    :rtype: AsyncApiClient
+
+    Usage::
+
+      >>> from fractal_python import aio
+      >>> client = aio.sandbox('secret key', 'partner id')
+    """
+    kwargs.setdefault("pool_maxsize", max_workers)
+    client = api_client.sandbox(api_key, partner_id, **kwargs)
+    return AsyncApiClient(client, max_workers=max_workers)
+
+
+def live(
+    api_key: str, partner_id: str, max_workers: int = DEFAULT_MAX_WORKERS, **kwargs
+) -> AsyncApiClient:
+    r"""Make an asyncio client for the live api.
+
+    :param api_key: secret key issued to the partner
+    :param partner_id: unique if of the partner
+    :param max_workers: maximum number of calls in flight at once
+    :param **kwargs: optional ApiClient settings such as keep_alive
+    :return: an AsyncApiClient for the live system
+    :rtype: AsyncApiClient
+
+    Usage::
+
+      >>> from fractal_python import aio
+      >>> client = aio.live('secret key', 'partner id')
+    """
+    kwargs.setdefault("pool_maxsize", max_workers)
+    client = api_client.live(api_key, partner_id, **kwargs)
+    return AsyncApiClient(client, max_workers=max_workers)
+
+
+_END_OF_PAGES = object()
+
+
+async def _iterate(client: AsyncApiClient, pages) -> AsyncGenerator:
+    try:
+        while True:
+            page = await client.run(next, pages, _END_OF_PAGES)
+            if page is _END_OF_PAGES:
+                return
+            yield page if isinstance(page, list) else _stream(client, page)
+    finally:
+        await client.run(pages.close)
+
+
+async def _stream(client: AsyncApiClient, page) -> AsyncGenerator:
+    while True:
+        item = await client.run(next, page, _END_OF_PAGES)
+        if item is _END_OF_PAGES:
+            return
+        yield item
+
+
+async def _items(pages: AsyncGenerator) -> AsyncGenerator:
+    try:
+        async for page in pages:
+            if isinstance(page, list):
+                for item in page:
+                    yield item
+            else:
+                async for item in page:
+                    yield item
+    finally:
+        await pages.aclose()
+
+
+def _paged(client: AsyncApiClient, func: Callable, *args, **kwargs) -> AsyncGenerator:
+    return _iterate(client, func(client.client, *args, **kwargs))
@@ -0,0 +1,318 @@
+"""Asyncio Fractal Banking API service."""
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+
+from fractal_python import banking
+from fractal_python.aio import AsyncApiClient, _items, _paged
+from fractal_python.banking.accounts import BankAccount, BankBalance, BankTransaction
+from fractal_python.banking.banks import Bank, BankConsent, CreateBankConsentResponse
+from fractal_python.banking.categories import Category
+from fractal_python.banking.merchants import Merchant
+
+
+def retrieve_banks(
+    client: AsyncApiClient, **kwargs
+) -> AsyncGenerator[List[Union[Bank, Dict[str, Any]]], None]:
+    r"""Retrieve all banks.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param **kwargs: as for banking.retrieve_banks
+    :return: async generator of pages of Banks
+    :rtype: AsyncGenerator[List[Union[Bank, Dict[str, Any]]], None]
+    """
+    return _paged(client, banking.retrieve_banks, **kwargs)
+
+
+def iter_banks(
+    client: AsyncApiClient, **kwargs
+) -> AsyncGenerator[Union[Bank, Dict[str, Any]], None]:
+    r"""Iterate over all banks one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param **kwargs: as for banking.retrieve_banks, such as page_size
+    :return: async generator of Banks
+    :rtype: AsyncGenerator[Union[Bank, Dict[str, Any]], None]
+    """
+    return _items(retrieve_banks(client, **kwargs))
+
+
+async def create_bank_consent(
+    client: AsyncApiClient, bank_id: int, redirect: str, company_id: str
+) -> CreateBankConsentResponse:
+    r"""Create a bank consent.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param bank_id: the unique id of the bank
+    :type bank_id: int
+    :param redirect: the urk to redirect the account owner to
+    :type redirect: str
+    :param company_id: the unique id of the company
+    :type company_id: str
+    :return: response from the bank
+    :rtype: CreateBankConsentResponse
+    """
+    return await client.run(
+        banking.create_bank_consent, client.client, bank_id, redirect, company_id
+    )
+
+
+def retrieve_bank_consents(
+    client: AsyncApiClient, bank_id: int, company_id: Optional[str] = None, **kwargs
+) -> AsyncGenerator[List[Union[BankConsent, Dict[str, Any]]], None]:
+    r"""Retrieve consents by bank id and company id.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param bank_id: the id of the bank to filter on
+    :type bank_id: int
+    :param company_id: the id of the company to filter on, defaults to None
+    :type company_id: str, optional
+    :param **kwargs: as for banking.retrieve_bank_consents
+    :return: async generator of pages of Bank Consents
+    :rtype: AsyncGenerator[List[Union[BankConsent, Dict[str, Any]]], None]
+    """
+    return _paged(
+        client,
+        banking.retrieve_bank_consents,
+        bank_id=bank_id,
+        company_id=company_id,
+        **kwargs,
+    )
+
+
+def iter_bank_consents(
+    client: AsyncApiClient, bank_id: int, company_id: Optional[str] = None, **kwargs
+) -> AsyncGenerator[Union[BankConsent, Dict[str, Any]], None]:
+    r"""Iterate over consents by bank id and company id one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param bank_id: the id of the bank to filter on
+    :type bank_id: int
+    :param company_id: the id of the company to filter on, defaults to None
+    :type company_id: str, optional
+    :param **kwargs: as for banking.retrieve_bank_consents, such as page_size
+    :return: async generator of BankConsents
+    :rtype: AsyncGenerator[Union[BankConsent, Dict[str, Any]], None]
+    """
+    return _items(retrieve_bank_consents(client, bank_id, company_id, **kwargs))
+
+
+async def put_bank_consent(
+    client: AsyncApiClient,
+    code: str,
+    id_token: str,
+    state: str,
+    bank_id: int,
+    consent_id: str,
+    company_id: str,
+):
+    r"""Put a Bank Consent for a Company.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param code: to be exchanged for access token with the bank
+    :type code: str
+    :param id_token: base64 encoded JSON for verifying
+    :type id_token: str
+    :param state: base64b encoded JSON to persist the state
+    :type state: str
+    :param bank_id: the id of the bank to filter on
+    :type bank_id: int
+    :param consent_id: id returned from create_bank_consent
+    :type consent_id: str
+    :param company_id:  the id of the company
+    :type company_id: str
+    """
+    await client.run(
+        banking.put_bank_consent,
+        client.client,
+        code=code,
+        id_token=id_token,
+        state=state,
+        bank_id=bank_id,
+        consent_id=consent_id,
+        company_id=company_id,
+    )
+
+
+async def delete_bank_consent(
+    client: AsyncApiClient, bank_id: int, consent_id: str, company_id: str
+):
+    r"""Delete a bank consent.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param bank_id: the id of the bank to filter on
+    :type bank_id: int
+    :param consent_id: id returned from create_bank_consent
+    :type consent_id: str
+    :param company_id:  the id of the company
+    :type company_id: str
+    """
+    await client.run(
+        banking.delete_bank_consent,
+        client.client,
+        bank_id=bank_id,
+        consent_id=consent_id,
+        company_id=company_id,
+    )
+
+
+def retrieve_bank_accounts(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[List[Union[BankAccount, Dict[str, Any]]], None]:
+    r"""Retrieve pages of all connected bank accounts for a business.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :param **kwargs: as for banking.retrieve_bank_accounts
+    :return: async generator of pages of BankAccounts
+    :rtype: AsyncGenerator[List[Union[BankAccount, Dict[str, Any]]], None]
+    """
+    return _paged(
+        client, banking.retrieve_bank_accounts, company_id=company_id, **kwargs
+    )
+
+
+def iter_bank_accounts(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[Union[BankAccount, Dict[str, Any]], None]:
+    r"""Iterate over the connected bank accounts for a business one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for banking.retrieve_bank_accounts, such as page_size
+    :return: async generator of BankAccounts
+    :rtype: AsyncGenerator[Union[BankAccount, Dict[str, Any]], None]
+    """
+    return _items(retrieve_bank_accounts(client, company_id, **kwargs))
+
+
+def retrieve_bank_balances(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[List[Union[BankBalance, Dict[str, Any]]], None]:
+    r"""Get pages of cash balances for all the connected bank accounts.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for banking.retrieve_bank_balances
+    :return: async generator of pages of BankBalances
+    :rtype: AsyncGenerator[List[Union[BankBalance, Dict[str, Any]]], None]
+    """
+    return _paged(
+        client, banking.retrieve_bank_balances, company_id=company_id, **kwargs
+    )
+
+
+def iter_bank_balances(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[Union[BankBalance, Dict[str, Any]], None]:
+    r"""Iterate over the cash balances of the connected bank accounts one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for banking.retrieve_bank_balances, such as page_size
+    :return: async generator of BankBalances
+    :rtype: AsyncGenerator[Union[BankBalance, Dict[str, Any]], None]
+    """
+    return _items(retrieve_bank_balances(client, company_id, **kwargs))
+
+
+def retrieve_bank_transactions(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[List[Union[BankTransaction, Dict[str, Any]]], None]:
+    r"""Retrieve pages of bank transactions for all connected accounts.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for banking.retrieve_bank_transactions
+    :return: async generator of pages of BankTransactions
+    :rtype: AsyncGenerator[List[Union[BankTransaction, Dict[str, Any]]], None]
+    """
+    return _paged(
+        client, banking.retrieve_bank_transactions, company_id=company_id, **kwargs
+    )
+
+
+def iter_bank_transactions(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[Union[BankTransaction, Dict[str, Any]], None]:
+    r"""Iterate over the transactions of the connected bank accounts one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for banking.retrieve_bank_transactions, such as page_size
+    :return: async generator of BankTransactions
+    :rtype: AsyncGenerator[Union[BankTransaction, Dict[str, Any]], None]
+    """
+    return _items(retrieve_bank_transactions(client, company_id, **kwargs))
+
+
+def retrieve_categories(
+    client: AsyncApiClient, **kwargs
+) -> AsyncGenerator[List[Union[Category, Dict[str, Any]]], None]:
+    r"""Retrieve pages of all the categories that Fractal currently supports.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param **kwargs: as for banking.retrieve_categories
+    :return: async generator of pages of categories
+    :rtype: AsyncGenerator[List[Union[Category, Dict[str, Any]]], None]
+    """
+    return _paged(client, banking.retrieve_categories, **kwargs)
+
+
+def iter_categories(
+    client: AsyncApiClient, **kwargs
+) -> AsyncGenerator[Union[Category, Dict[str, Any]], None]:
+    r"""Iterate over the categories that Fractal supports one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param **kwargs: as for banking.retrieve_categories, such as page_size
+    :return: async generator of Categories
+    :rtype: AsyncGenerator[Union[Category, Dict[str, Any]], None]
+    """
+    return _items(retrieve_categories(client, **kwargs))
+
+
+def retrieve_merchants(
+    client: AsyncApiClient, **kwargs
+) -> AsyncGenerator[List[Union[Merchant, Dict[str, Any]]], None]:
+    r"""Retrieve pages of all the merchants that are currently categorised by Fractal.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param **kwargs: as for banking.retrieve_merchants
+    :return: async generator of pages of Merchants
+    :rtype: AsyncGenerator[List[Union[Merchant, Dict[str, Any]]], None]
+    """
+    return _paged(client, banking.retrieve_merchants, **kwargs)
+
+
+def iter_merchants(
+    client: AsyncApiClient, **kwargs
+) -> AsyncGenerator[Union[Merchant, Dict[str, Any]], None]:
+    r"""Iterate over the merchants categorised by Fractal one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param **kwargs: as for banking.retrieve_merchants, such as page_size
+    :return: async generator of Merchants
+    :rtype: AsyncGenerator[Union[Merchant, Dict[str, Any]], None]
+    """
+    return _items(retrieve_merchants(client, **kwargs))
@@ -0,0 +1,84 @@
+"""Asyncio Fractal Company API service."""
+from typing import Any, AsyncGenerator, Dict, List, Union
+
+from fractal_python import company
+from fractal_python.aio import AsyncApiClient, _items, _paged
+from fractal_python.company import Company, CreateResponse, NewCompany
+
+
+def get_companies(
+    client: AsyncApiClient, **kwargs
+) -> AsyncGenerator[List[Union[Company, Dict[str, Any]]], None]:
+    r"""Retrieve existing companies.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param **kwargs: as for company.get_companies
+    :return: async generator of pages of Companies
+    :rtype: AsyncGenerator[List[Union[Company, Dict[str, Any]]], None]
+    """
+    return _paged(client, company.get_companies, **kwargs)
+
+
+def iter_companies(
+    client: AsyncApiClient, **kwargs
+) -> AsyncGenerator[Union[Company, Dict[str, Any]], None]:
+    r"""Iterate over existing companies one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param **kwargs: as for company.get_companies, such as page_size
+    :return: async generator of Companies
+    :rtype: AsyncGenerator[Union[Company, Dict[str, Any]], None]
+    """
+    return _items(get_companies(client, **kwargs))
+
+
+async def get_company(client: AsyncApiClient, company_id: str) -> Company:
+    r"""Get an existing companies.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :return: company matching the unique id
+    :rtype: Company
+    """
+    return await client.run(company.get_company, client.client, company_id)
+
+
+def create_companies(
+    client: AsyncApiClient, companies: List[NewCompany]
+) -> AsyncGenerator[List[CreateResponse], None]:
+    r"""Create new companies.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param companies: new companies to add
+    :type companies: List[NewCompany]
+    :return: async generator of responses from fractal with new companies
+    :rtype: AsyncGenerator[List[CreateResponse], None]
+    """
+    return _paged(client, company.create_companies, companies)
+
+
+async def delete_company(client: AsyncApiClient, company_id: str):
+    r"""Delete an existing Company.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    """
+    await client.run(company.delete_company, client.client, company_id)
+
+
+async def update_company(client: AsyncApiClient, updated: Company):
+    r"""Update an existing Company.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param updated: updated company object
+    :type updated: Company
+    """
+    await client.run(company.update_company, client.client, updated)
@@ -0,0 +1,113 @@
+"""Asyncio Fractal Forecasting API service."""
+from typing import Any, AsyncGenerator, Dict, List, Union
+
+from fractal_python import forecasting
+from fractal_python.aio import AsyncApiClient, _items, _paged
+from fractal_python.forecasting import (
+    Forecast,
+    ForecastedBalance,
+    ForecastedTransaction,
+)
+
+
+def get_forecasts(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[List[Union[Forecast, Dict[str, Any]]], None]:
+    r"""Get all forecasts for the company.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for forecasting.get_forecasts
+    :return: async generator of pages of Forecast objects
+    :rtype: AsyncGenerator[List[Union[Forecast, Dict[str, Any]]], None]
+    """
+    return _paged(client, forecasting.get_forecasts, company_id=company_id, **kwargs)
+
+
+def iter_forecasts(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[Union[Forecast, Dict[str, Any]], None]:
+    r"""Iterate over the forecasts for the company one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for forecasting.get_forecasts, such as page_size
+    :return: async generator of Forecasts
+    :rtype: AsyncGenerator[Union[Forecast, Dict[str, Any]], None]
+    """
+    return _items(get_forecasts(client, company_id, **kwargs))
+
+
+def get_forecasted_transactions(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[List[Union[ForecastedTransaction, Dict[str, Any]]], None]:
+    r"""Get all forecasted transactions linked to the provided forecast id.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for forecasting.get_forecasted_transactions
+    :return: async generator of pages of ForecastedTransaction objects
+    :rtype: AsyncGenerator[List[Union[ForecastedTransaction, Dict[str, Any]]], None]
+    """
+    return _paged(
+        client,
+        forecasting.get_forecasted_transactions,
+        company_id=company_id,
+        **kwargs,
+    )
+
+
+def iter_forecasted_transactions(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[Union[ForecastedTransaction, Dict[str, Any]], None]:
+    r"""Iterate over forecasted transactions one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for forecasting.get_forecasted_transactions, such as page_size
+    :return: async generator of ForecastedTransactions
+    :rtype: AsyncGenerator[Union[ForecastedTransaction, Dict[str, Any]], None]
+    """
+    return _items(get_forecasted_transactions(client, company_id, **kwargs))
+
+
+def get_forecasted_balances(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[List[Union[ForecastedBalance, Dict[str, Any]]], None]:
+    r"""Get all forecasted balances linked to the provided forecast id.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for forecasting.get_forecasted_balances
+    :return: async generator of pages of ForecastedBalance objects
+    :rtype: AsyncGenerator[List[Union[ForecastedBalance, Dict[str, Any]]], None]
+    """
+    return _paged(
+        client, forecasting.get_forecasted_balances, company_id=company_id, **kwargs
+    )
+
+
+def iter_forecasted_balances(
+    client: AsyncApiClient, company_id: str, **kwargs
+) -> AsyncGenerator[Union[ForecastedBalance, Dict[str, Any]], None]:
+    r"""Iterate over forecasted balances one at a time.
+
+    :param client: the client to use for the api call
+    :type client: AsyncApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for forecasting.get_forecasted_balances, such as page_size
+    :return: async generator of ForecastedBalances
+    :rtype: AsyncGenerator[Union[ForecastedBalance, Dict[str, Any]], None]
+    """
+    return _items(get_forecasted_balances(client, company_id, **kwargs))
@@ -1,12 +1,50 @@
-import json
+"""Client for the Fractal API and the paging its endpoints share.
+
+Every function that retrieves pages, such as retrieve_bank_transactions or
+get_forecasts, accepts its own filters and these paging options:
+
+    *page_size* ('int') items per page to ask the server for
+    *prefetch* ('int') pages to fetch ahead on a worker thread
+    *deadline* ('float') seconds allowed for the whole iteration
+    *next_page* ('str') DeadlineExceeded.next_page to resume from
+    *lazy* ('bool') parse dates and amounts when first read
+    *raw* ('bool') yield the JSON dicts instead of models
+    *fields* ('List[str]') yield dicts of only these attributes
+    *stream* ('bool') parse each page from the socket as it is read
+    *checkpoint* ('CheckpointStore') resume from and record the next unread page
+    *cache* ('ResponseCache') serve unchanged pages without downloading them,
+    meant for reference data such as banks, categories and merchants
+    *validation* ('str') full, sampled or off, defaults to the client's policy
+
+Each has an iter_* twin taking the same arguments that yields the items one
+at a time. Only the page being read, and any pages prefetched, are held in
+memory.
+"""
+import queue
+import threading
+import time
+from datetime import datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Any, Collection, Generator, List, Optional, Type
+from typing import Any, Callable, Collection, Generator, List, Optional, Type, Union
 
 import arrow
 import deserialize
 import requests
+from requests.adapters import HTTPAdapter
 from stringcase import camelcase
 
+from fractal_python import json_backend
+from fractal_python.cache import ResponseCache
+from fractal_python.checkpoint import CheckpointStore, checkpoint_key
+from fractal_python.concurrency import AdaptiveLimit
+from fractal_python.deserializer import deserializer, lazy_parser, projection
+from fractal_python.interning import Interner
+from fractal_python.rate_limit import RateLimiter
+from fractal_python.retry import RetryPolicy, RetryStats
+from fractal_python.streaming import PageStream
+from fractal_python.token_store import Token, TokenStore, token_key
+from fractal_python.validation import ValidationPolicy, validation_policy
+
 SANDBOX = "https://sandbox.askfractal.com"
 SANDBOX_AUTH = "https://sandbox.askfractal.com"
 LIVE = "https://apis.askfractal.com"
@@ -15,24 +53,88 @@ API_KEY_HEADER = "X-Api-Key"
 PARTNER_ID_HEADER = "X-Partner-Id"
 COMPANY_ID_HEADER = "X-Company-Id"
 AUTHORIZATION_HEADER = "Authorization"
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEP_ALIVE = 300.0
+DEFAULT_REFRESH_MARGIN = 60.0
+DEFAULT_CONNECT_TIMEOUT = 3.05
+DEFAULT_READ_TIMEOUT = 30.0
+
+
+class DeadlineExceeded(TimeoutError):
+    r"""A paged retrieval ran out of its time budget.
+
+    Pass next_page back to the same retrieve function to carry on from the
+    first page that was not yielded.
+
+    :attr next_page: url of the next page, None if no page had been fetched
+    """
+
+    def __init__(self, next_page: Optional[str]):
+        r"""Make the error.
+
+        :param next_page: url of the next page, None if no page had been fetched
+        """
+        super().__init__(f"deadline exceeded before fetching {next_page or 'page 1'}")
+        self.next_page = next_page
 
 
 class ApiClient:
     r"""Client for Fractal API.
 
+    Requests are sent through a pooled :class:`requests.Session` so that
+    successive pages reuse kept-alive connections. Close the client when done,
+    or use it as a context manager.
+
     :attr auth_url: URL of the authorisation endpoint
     :attr base_url: URL for the API Version
     :attr api_key: secret api key
     :attr partner_id: unique id of the partner
     """
 
-    def __init__(self, auth_url: str, base_url: str, api_key: str, partner_id: str):
+    def __init__(
+        self,
+        auth_url: str,
+        base_url: str,
+        api_key: str,
+        partner_id: str,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: Optional[float] = DEFAULT_KEEP_ALIVE,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        token_store: Optional[TokenStore] = None,
+        retry: Optional[RetryPolicy] = RetryPolicy(),
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limit: Optional[AdaptiveLimit] = None,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        validation: Union[str, ValidationPolicy] = "off",
+    ):
         r"""Fractal API Client.
 
         :param auth_url: url for authorisation
         :param base_url: url for the API
         :param api_key: Secret API Key
         :param partner_id: Unique partner id
+        :param pool_connections: number of per host connection pools to cache
+        :param pool_maxsize: maximum connections kept open to a single host
+        :param keep_alive: seconds before pooled connections are recycled,
+            None to keep them for the life of the client
+        :param refresh_margin: seconds before expiry to start refreshing the token
+        :param token_store: where tokens are shared with other clients, such as
+            a FileTokenStore shared by every process on the host
+        :param retry: how throttled and failed calls are retried, None to never
+            retry
+        :param rate_limiter: limits the rate of requests, share one between
+            clients to limit them all together
+        :param concurrency_limit: limits the number of requests in flight,
+            usually set by an AdaptiveExecutor
+        :param connect_timeout: seconds to wait for a connection, None to wait
+            forever
+        :param read_timeout: seconds to wait between bytes of a response, None
+            to wait forever
+        :param validation: full, sampled, off or a ValidationPolicy for which
+            models retrieved are checked by their validators
         """
         self.auth_url = auth_url
         self.base_url = base_url
@@ -42,6 +144,78 @@ class ApiClient:
             PARTNER_ID_HEADER: partner_id,
         }
         self.expires_at = arrow.now().shift(seconds=-30)
+        self.refresh_margin = refresh_margin
+        self.token_store = token_store
+        self._token_key = token_key(auth_url, api_key, partner_id)
+        self._auth_lock = threading.Lock()
+        self.retry = retry
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.concurrency_limit = concurrency_limit
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.validation = validation_policy(validation)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self._session_lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._session_expires = 0.0
+
+    def __enter__(self) -> "ApiClient":
+        r"""Use the client as a context manager.
+
+        :return: this client
+        :rtype: ApiClient
+        """
+        return self
+
+    def __exit__(self, *args):
+        r"""Close pooled connections on leaving the context.
+
+        :param *args: exception details, ignored
+        """
+        self.close()
+
+    def close(self):
+        r"""Close all pooled connections.
+
+        The client can still be used afterwards; a new pool is opened on the
+        next request.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def session(self) -> requests.Session:
+        r"""Get the pooled session, recycling it once keep_alive has elapsed.
+
+        :return: the session used for every request made by this client
+        :rtype: requests.Session
+        """
+        with self._session_lock:
+            now = time.monotonic()
+            if self._session is not None and now >= self._session_expires:
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = self._new_session()
+                self._session_expires = (
+                    now + self.keep_alive
+                    if self.keep_alive is not None
+                    else float("inf")
+                )
+            return self._session
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def call_api(self, resource_path: str, method: str, **kwargs) -> requests.Response:
         r"""Call the Fractal API.
@@ -83,29 +257,167 @@ class ApiClient:
         *params* (optional) dictionary of query parameters
         *data* (optional) payload
         *headers* optional headers usually company id
+        *timeout* (optional) seconds or (connect, read) seconds, defaults to
+        the client's connect_timeout and read_timeout
+        *deadline* (optional) time.monotonic() by which the call must finish
+
+        Every attempt waits for the rate limiter and the concurrency limit.
+        Throttled and failed attempts are retried according to the retry policy,
+        and counted in retry_stats. Timeouts are capped to the time left before
+        the deadline, and no retry is made that would wait past it.
+
+        :raises DeadlineExceeded: when the call failed and a retry would finish
+            after the deadline, with next_page set to url
         """
+        headers = kwargs.pop("headers", None) or {}
+        deadline = kwargs.pop("deadline", None)
+        timeout = kwargs.pop("timeout", (self.connect_timeout, self.read_timeout))
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._send(
+                    method, url, headers, timeout=_cap(timeout, deadline), **kwargs
+                )
+            except (requests.ConnectionError, requests.Timeout) as ex:
+                retry = self._retry(method, attempt, None)
+                if retry is None:
+                    raise
+                delay = retry.delay(attempt)
+                if _past(deadline, delay):
+                    raise DeadlineExceeded(url) from ex
+            else:
+                retry = self._retry(method, attempt, response.status_code)
+                if retry is None:
+                    return response
+                delay = retry.delay(attempt, response)
+                if _past(deadline, delay):
+                    response.close()
+                    raise DeadlineExceeded(url)
+                response.close()
+            self.retry_stats.record_retry(delay)
+            time.sleep(delay)
+
+    def _send(self, method: str, url: str, headers, **kwargs) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
         self._authorise()
-        kwargs.setdefault("headers", {}).update(self.headers)
-        return requests.request(method, url, **kwargs)
+        self.retry_stats.record_request()
+        limit = self.concurrency_limit
+        if limit is not None:
+            limit.acquire()
+        start = time.monotonic()
+        status_code = None
+        try:
+            response = self.session().request(
+                method, url, headers={**headers, **self.headers}, **kwargs
+            )
+            status_code = response.status_code
+            return response
+        finally:
+            if limit is not None:
+                limit.release(status_code, time.monotonic() - start)
+
+    def _retry(
+        self, method: str, attempt: int, status_code: Optional[int]
+    ) -> Optional[RetryPolicy]:
+        retry = self.retry
+        if retry is None or not retry.retryable(method, status_code):
+            return None
+        if attempt >= retry.max_attempts or not self.retry_stats.within_budget(retry):
+            self.retry_stats.record_gave_up()
+            return None
+        return retry
 
     def _authorise(self):
+        r"""Make sure a valid token is in the headers.
+
+        Only one thread fetches a new token. Once the token is within
+        refresh_margin of expiring, the first caller refreshes it while the
+        others carry on with the current token; once it has expired they wait
+        for the refresh. The headers dict is replaced, never mutated, so
+        concurrent requests always see a complete set of headers.
+
+        A token_store is checked before asking for a new token, and holds its
+        lock while the new token is fetched so that other clients sharing the
+        store wait for it rather than fetching their own.
+        """
+        if self._fresh(self.expires_at):
+            return
+        expired = arrow.now() > self.expires_at
+        if not self._auth_lock.acquire(blocking=expired):
+            return
+        try:
+            if self._fresh(self.expires_at):
+                return
+            if self.token_store is None:
+                self._use_token(self._request_token())
+                return
+            token = self.token_store.load(self._token_key)
+            if token is None or not self._fresh(token.expires_at):
+                with self.token_store.lock(self._token_key):
+                    token = self.token_store.load(self._token_key)
+                    if token is None or not self._fresh(token.expires_at):
+                        token = self._request_token()
+                        self.token_store.save(self._token_key, token)
+            self._use_token(token)
+        finally:
+            self._auth_lock.release()
+
+    def _fresh(self, expires_at: arrow.Arrow) -> bool:
+        return arrow.now() <= expires_at.shift(seconds=-self.refresh_margin)
+
+    def _request_token(self) -> Token:
         now = arrow.now()
-        if now > self.expires_at:
-            url = self.auth_url + "/token"
-            self.headers.pop(AUTHORIZATION_HEADER, None)
-            response = requests.request("POST", url, headers=self.headers)
-            json_response = json.loads(response.text)
-            self.expires_at = now.shift(seconds=int(json_response["expires_in"]))
-            token_type = json_response["token_type"]
-            access_token = json_response["access_token"]
-            self.headers["Authorization"] = f"{token_type} {access_token}"
-
-
-def sandbox(api_key: str, partner_id: str) -> ApiClient:
+        url = self.auth_url + "/token"
+        headers = {
+            key: value
+            for key, value in self.headers.items()
+            if key != AUTHORIZATION_HEADER
+        }
+        response = self.session().request(
+            "POST",
+            url,
+            headers=headers,
+            timeout=(self.connect_timeout, self.read_timeout),
+        )
+        json_response = json_backend.loads(response.content)
+        return Token(
+            token_type=json_response["token_type"],
+            access_token=json_response["access_token"],
+            expires_at=now.shift(seconds=int(json_response["expires_in"])),
+        )
+
+    def _use_token(self, token: Token):
+        headers = dict(self.headers)
+        headers[AUTHORIZATION_HEADER] = token.authorization
+        self.headers = headers
+        self.expires_at = token.expires_at
+
+
+def _cap(timeout: Any, deadline: Optional[float]) -> Any:
+    if deadline is None:
+        return timeout
+    remaining = max(0.001, deadline - time.monotonic())
+    if isinstance(timeout, tuple):
+        return tuple(_shorter(part, remaining) for part in timeout)
+    return _shorter(timeout, remaining)
+
+
+def _shorter(timeout: Optional[float], remaining: float) -> float:
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _past(deadline: Optional[float], delay: float) -> bool:
+    return deadline is not None and time.monotonic() + delay >= deadline
+
+
+def sandbox(api_key: str, partner_id: str, **kwargs) -> ApiClient:
     r"""Make a client for the sandbox api.
 
     :param api_key: secret key issued to the partner
     :param partner_id: unique if of the partner
+    :param **kwargs: optional ApiClient settings such as pool_maxsize
     :return: an ApiClient for the sandbox
     :rtype: ApiClient
 
@@ -114,14 +426,15 @@ def sandbox(api_key: str, partner_id: str) -> ApiClient:
       >>> from fractal_python import api_client
       >>> client = api_client.sandbox('secret key', 'partner id')
     """
-    return ApiClient(SANDBOX_AUTH, SANDBOX, api_key, partner_id)
+    return ApiClient(SANDBOX_AUTH, SANDBOX, api_key, partner_id, **kwargs)
 
 
-def live(api_key: str, partner_id: str) -> ApiClient:
+def live(api_key: str, partner_id: str, **kwargs) -> ApiClient:
     r"""Make a client for the live api.
 
     :param api_key: secret key issued to the partner
     :param partner_id: unique if of the partner
+    :param **kwargs: optional ApiClient settings such as pool_maxsize
     :return: an ApiClient for the live system
     :rtype: ApiClient
 
@@ -130,7 +443,7 @@ def live(api_key: str, partner_id: str) -> ApiClient:
       >>> from fractal_python import api_client
       >>> client = api_client.sandbox('secret key', 'partner id')
     """
-    return ApiClient(LIVE_AUTH, LIVE, api_key, partner_id)
+    return ApiClient(LIVE_AUTH, LIVE, api_key, partner_id, **kwargs)
 
 
 def _call_api(
@@ -143,9 +456,47 @@ def _call_api(
     return response
 
 
-def _handle_get_response(response, cls):
-    json_response = json.loads(response.text)
-    results = deserialize.deserialize(List[cls], json_response.get("results", None))
+def _item_builder(
+    cls: Type,
+    lazy: bool = False,
+    raw: bool = False,
+    fields: Optional[Collection[str]] = None,
+    intern: Union[bool, Interner] = False,
+    validation: ValidationPolicy = ValidationPolicy(),
+) -> Optional[Callable[[Any], Any]]:
+    r"""Choose how each JSON record of a page is turned into an item.
+
+    :param cls: model class of the items
+    :param lazy: parse dates and amounts when first read
+    :param raw: keep the JSON dicts as they are
+    :param fields: build dicts of only these attributes instead of models
+    :param intern: share identical nested models, through this Interner if
+        one is given
+    :param validation: which of the models built are validated
+    :return: function from a JSON record to its item, None to keep the record
+    :rtype: Optional[Callable[[Any], Any]]
+    """
+    if raw:
+        return None
+    if fields:
+        return projection(cls, tuple(fields))
+    build = deserializer(cls, lazy)
+    if intern is not False:
+        build = (Interner() if intern is True else intern).wrap(build)
+    return validation.wrap(build)
+
+
+def _build_page(build: Optional[Callable[[Any], Any]], results: Any) -> List:
+    if not isinstance(results, list):
+        raise deserialize.DeserializeException(
+            f"Cannot deserialize '{type(results)}' to 'List'"
+        )
+    return results if build is None else [build(record) for record in results]
+
+
+def _handle_get_response(response, build):
+    json_response = json_backend.loads(response.content)
+    results = _build_page(build, json_response.get("results", None))
     next_page = json_response.get("links", {}).get("next", None)
     return results, next_page
 
@@ -158,32 +509,288 @@ def _get_paged_response(
     company_id: Optional[str] = None,
     **kwargs,
 ) -> Generator:
+    r"""Retrieve the pages of an endpoint.
+
+    :param client: Live or Sandbox API Client
+    :param url: path of the endpoint
+    :param cls: model class of the items
+    :param param_keys: filters taken from kwargs and sent as query parameters
+    :param company_id: Identifier of the Company, if any
+    :param **kwargs: the filters, the paging options listed in the module
+        docstring, and intern and method
+    :yield: the pages
+    :rtype: Generator
+    :raises ValueError: when stream is combined with prefetch or cache
+    """
+    prefetch = kwargs.pop("prefetch", 0)
+    stream = kwargs.pop("stream", False)
+    if prefetch and stream:
+        raise ValueError("prefetch cannot be combined with stream")
+    deadline = kwargs.pop("deadline", None)
+    next_page = kwargs.pop("next_page", None)
+    checkpoint = kwargs.pop("checkpoint", None)
+    cache = kwargs.pop("cache", None)
+    if cache is not None and stream:
+        raise ValueError("cache cannot be combined with stream")
+    build = _item_builder(
+        cls,
+        lazy=kwargs.pop("lazy", False),
+        raw=kwargs.pop("raw", False),
+        fields=kwargs.pop("fields", None),
+        intern=kwargs.pop("intern", True),
+        validation=validation_policy(kwargs.pop("validation", client.validation)),
+    )
     params = (
         {camelcase(key): kwargs.pop(key) for key in param_keys if key in kwargs}
         if param_keys
         else {}
     )
+    page_size = kwargs.pop("page_size", None)
+    if page_size is not None:
+        params["pageSize"] = page_size
     method = kwargs.pop("method", "GET")
-    response = _call_api(
+    key = ""
+    if checkpoint is not None:
+        key = checkpoint_key(
+            client.base_url,
+            client.headers[PARTNER_ID_HEADER],
+            url,
+            company_id,
+            params,
+        )
+        if next_page is None:
+            next_page = checkpoint.load(key)
+    pages = _pages(
         client=client,
         url=url,
+        build=build,
         method=method,
         company_id=company_id,
+        deadline=time.monotonic() + deadline if deadline is not None else None,
+        next_page=next_page,
+        stream=stream,
+        links=checkpoint is not None,
+        cache=cache,
         params=params,
         **kwargs,
     )
+    if prefetch:
+        pages = _prefetch(pages, prefetch)
+    if checkpoint is not None:
+        pages = _checkpointed(pages, checkpoint, key)
+    yield from pages
+
+
+def _checkpointed(pages: Generator, checkpoint: CheckpointStore, key: str):
+    r"""Save the link to the next page each time the caller moves on.
+
+    :param pages: generator of (page, link to the next page) pairs
+    :param checkpoint: where the links are saved
+    :param key: key from checkpoint_key
+    :yield: the pages
+    """
+    try:
+        for page, next_page in pages:
+            yield page
+            if isinstance(page, PageStream):
+                next_page = page.finish()
+            if next_page:
+                checkpoint.save(key, next_page)
+            else:
+                checkpoint.clear(key)
+    finally:
+        pages.close()
+
+
+def _pages(
+    client: ApiClient,
+    url: str,
+    build: Optional[Callable[[Any], Any]],
+    method: str,
+    company_id: Optional[str],
+    deadline: Optional[float] = None,
+    next_page: Optional[str] = None,
+    stream: bool = False,
+    links: bool = False,
+    cache: Optional[ResponseCache] = None,
+    **kwargs,
+) -> Generator:
     headers = {COMPANY_ID_HEADER: company_id} if company_id else {}
-    results, next_page = _handle_get_response(response, cls)
-    yield results
+    call_api, call_url = client.call_api, client.call_url
+    if cache is not None:
+        call_api = cache.wrap(call_api, company_id, client.base_url)
+        call_url = cache.wrap(call_url, company_id)
+    if stream:
+        kwargs["stream"] = True
+    if next_page is None:
+        response = _before_deadline(
+            deadline,
+            None,
+            call_api,
+            url,
+            method,
+            headers=headers,
+            **kwargs,
+        )
+        next_page = yield from _page(response, build, stream, links)
     while next_page:
-        response = client.call_url(next_page, "GET", headers=headers)
-        results, next_page = _handle_get_response(response, cls)
-        yield results
+        response = _before_deadline(
+            deadline,
+            next_page,
+            call_url,
+            next_page,
+            "GET",
+            headers=headers,
+            **({"stream": True} if stream else {}),
+        )
+        next_page = yield from _page(response, build, stream, links)
+
+
+def _page(
+    response: requests.Response,
+    build: Optional[Callable[[Any], Any]],
+    stream: bool,
+    links: bool = False,
+) -> Generator[Any, None, Optional[str]]:
+    r"""Yield one page and return the link to the next.
+
+    :param response: response holding the page
+    :param build: function from a JSON record to an item, None to keep the record
+    :param stream: yield a PageStream parsing the body as it is read
+    :param links: yield the page paired with the link to the next page, which
+        is None for a PageStream until it is finished
+    :yield: the items of the page, as a list or a PageStream
+    :return: url of the next page, or None on the last page
+    :rtype: Generator[Any, None, Optional[str]]
+    :raises requests.HTTPError: when the response is an error, such as a
+        throttled or failed call that ran out of retries
+    """
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+    if not stream:
+        results, next_page = _handle_get_response(response, build)
+        yield (results, next_page) if links else results
+        return next_page
+    page = PageStream(response, build)
+    try:
+        yield (page, None) if links else page
+        return page.finish()
+    finally:
+        page.close()
+
+
+def _before_deadline(
+    deadline: Optional[float], next_page: Optional[str], call, *args, **kwargs
+) -> requests.Response:
+    r"""Make a call that must finish by the deadline.
+
+    :param deadline: time.monotonic() by which the call must finish, or None
+    :param next_page: url to resume from if the deadline is exceeded
+    :param call: ApiClient.call_api or ApiClient.call_url
+    :param *args: positional arguments for call
+    :param **kwargs: keyword arguments for call
+    :return: response
+    :rtype: requests.Response
+    :raises DeadlineExceeded: when the deadline passes before the call finishes
+    """
+    if deadline is None:
+        return call(*args, **kwargs)
+    if time.monotonic() >= deadline:
+        raise DeadlineExceeded(next_page)
+    try:
+        return call(*args, deadline=deadline, **kwargs)
+    except DeadlineExceeded as ex:
+        raise DeadlineExceeded(next_page) from ex
+    except (requests.ConnectionError, requests.Timeout) as ex:
+        if time.monotonic() >= deadline:
+            raise DeadlineExceeded(next_page) from ex
+        raise
+
+
+def _items(pages: Generator) -> Generator:
+    r"""Yield the items of each page in turn.
+
+    :param pages: generator of pages
+    :yield: the items, closing pages when the caller stops early
+    """
+    try:
+        for page in pages:
+            yield from page
+    finally:
+        pages.close()
 
 
-def _arrow_or_none(value: Any):
-    return arrow.get(value) if value else None
+_END_OF_PAGES = object()
+
+
+def _prefetch(pages: Generator, depth: int) -> Generator:
+    r"""Fetch and deserialize up to depth pages ahead on a worker thread.
 
+    Closing the returned generator stops the worker after the page it is
+    currently fetching. An exception raised fetching a page on the worker is
+    raised again here, in place of the page.
 
+    :param pages: generator of pages
+    :param depth: maximum number of pages held ahead of the consumer
+    :yield: the pages in order
+
+    # noqa: DAR401 error
+    """
+    pending: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def fetch():
+        try:
+            for page in pages:
+                pending.put((page, None))
+                if stop.is_set():
+                    break
+            else:
+                pending.put((_END_OF_PAGES, None))
+        except Exception as ex:  # skipcq: PYL-W0703
+            pending.put((_END_OF_PAGES, ex))
+        finally:
+            pages.close()
+
+    worker = threading.Thread(target=fetch, name="fractal-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            page, error = pending.get()
+            if error is not None:
+                raise error
+            if page is _END_OF_PAGES:
+                return
+            yield page
+    finally:
+        stop.set()
+        while not pending.empty():
+            pending.get_nowait()
+
+
+@lazy_parser
+def _arrow_or_none(value: Any):
+    if not value:
+        return None
+    if isinstance(value, str):
+        if value.endswith("Z"):
+            # fromisoformat only accepts the Z suffix from Python 3.11
+            value = value[:-1] + "+00:00"
+        try:
+            when = datetime.fromisoformat(value)
+        except (AttributeError, ValueError):
+            # Python 3.6 has no fromisoformat, leave those to arrow
+            pass
+        else:
+            if when.tzinfo is None or not when.utcoffset():
+                return arrow.Arrow.fromdatetime(when, timezone.utc)
+            return arrow.Arrow.fromdatetime(when)
+    return arrow.get(value)
+
+
+@lazy_parser
 def _money_amount(value: Any):
     return Decimal(value).quantize(Decimal("0.01"), ROUND_HALF_UP) if value else None
@@ -2,9 +2,14 @@
 from fractal_python.banking.accounts import (
     accounts,
     balances,
+    iter_bank_accounts,
+    iter_bank_balances,
+    iter_bank_transactions,
     retrieve_bank_accounts,
     retrieve_bank_balances,
+    retrieve_bank_balances_sharded,
     retrieve_bank_transactions,
+    retrieve_bank_transactions_sharded,
     transactions,
 )
 from fractal_python.banking.banks import (
@@ -14,10 +19,13 @@ from fractal_python.banking.banks import (
     consents,
     create_bank_consent,
     delete_bank_consent,
+    iter_bank_consents,
+    iter_banks,
     new_bank,
     put_bank_consent,
     retrieve_bank_consents,
     retrieve_banks,
 )
-from fractal_python.banking.categories import retrieve_categories
-from fractal_python.banking.merchants import retrieve_merchants
+from fractal_python.banking.categories import iter_categories, retrieve_categories
+from fractal_python.banking.merchants import iter_merchants, retrieve_merchants
+from fractal_python.banking.reference import EnrichedTransaction, ReferenceIndex
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Union
 
 import arrow
 import attr
@@ -9,9 +9,13 @@ from fractal_python.api_client import (
     ApiClient,
     _arrow_or_none,
     _get_paged_response,
+    _items,
     _money_amount,
 )
 from fractal_python.banking.api import BANKING_ENDPOINT
+from fractal_python.deserializer import deserialize_list, deserializer
+from fractal_python.interning import intern_string, interned
+from fractal_python.sharding import retrieve_sharded
 
 accounts = BANKING_ENDPOINT + "/accounts"
 balances = BANKING_ENDPOINT + "/balances"
@@ -21,7 +25,7 @@ SOURCES = ("MANUALIMPORT", "OPENBANKING")
 SOURCES_RE = "|".join(SOURCES)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
 class AccountInformation:
     r"""Open Banking Read/Write API Account Information such as OBReadAccount6.
@@ -45,12 +49,14 @@ class AccountInformation:
 
 
 def _account_information(value: str) -> AccountInformation:
-    return deserialize.deserialize(List[AccountInformation], value)
+    return deserialize_list(AccountInformation, value)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
 @deserialize.parser("account", _account_information)
+@deserialize.parser("currency", intern_string)
+@deserialize.parser("source", intern_string)
 class BankAccount:
     r"""A Bank Account with a unique id.
 
@@ -70,14 +76,14 @@ class BankAccount:
     source: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(SOURCES_RE),
+            attr.validators.in_(frozenset(SOURCES)),
         ]
     )
 
 
 def retrieve_bank_accounts(
     client: ApiClient, company_id: str, **kwargs
-) -> Generator[List[BankAccount], None, None]:
+) -> Generator[List[Union[BankAccount, Dict[str, Any]]], None, None]:
     r"""Retrieve pages of all connected bank accounts for a business.
 
     Can be filtered by providing a bank_id.
@@ -89,8 +95,9 @@ def retrieve_bank_accounts(
 
     :Keyword Arguments:
         *bank_id* (('int'')) Unique identifier for the bank
+        and the paging options of fractal_python.api_client
     :yield: Pages of BankAccounts
-    :rtype: Generator[List[BankAccount], None, None]
+    :rtype: Generator[List[Union[BankAccount, Dict[str, Any]]], None, None]
     """
     yield from _get_paged_response(
         client=client,
@@ -102,6 +109,22 @@ def retrieve_bank_accounts(
     )
 
 
+def iter_bank_accounts(
+    client: ApiClient, company_id: str, **kwargs
+) -> Generator[Union[BankAccount, Dict[str, Any]], None, None]:
+    r"""Iterate over the connected bank accounts for a business one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for retrieve_bank_accounts, such as page_size
+    :yield: BankAccounts
+    :rtype: Generator[Union[BankAccount, Dict[str, Any]], None, None]
+    """
+    yield from _items(retrieve_bank_accounts(client, company_id, **kwargs))
+
+
 BALANCE_STATUS = (
     "CLOSINGAVAILABLE",
     "CLOSINGBOOKED",
@@ -119,9 +142,11 @@ BALANCE_TYPES = ("DEBIT", "CREDIT")
 BALANCE_TYPES_RE = "|".join(BALANCE_TYPES)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
 @deserialize.parser("amount", _money_amount)
+@deserialize.parser("currency", intern_string)
+@deserialize.parser("type", intern_string)
 class MoneyAmount:
     r"""Amount with currency and credit/debit.
 
@@ -134,12 +159,12 @@ class MoneyAmount:
     type: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(BALANCE_TYPES_RE),
+            attr.validators.in_(frozenset(BALANCE_TYPES)),
         ]
     )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class AccountEntity:
     r"""A uniquely identifiable Account related entity.
 
@@ -152,11 +177,31 @@ class AccountEntity:
     account_id: str
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
+class AccountAmount(MoneyAmount):
+    r"""A MoneyAmount with the fields of an AccountEntity.
+
+    Slotted classes can only inherit slots along one line, so balances and
+    transactions extend this rather than both MoneyAmount and AccountEntity.
+
+    :attr id: unique within the bank at least identifier.
+    :attr bank_id: unique id of the bank that operates the account.
+    :attr account_id: account that this amount is for.
+    """
+    id: str
+    bank_id: int
+    account_id: str
+
+
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
 @deserialize.parser("date", _arrow_or_none)
 @deserialize.parser("amount", _money_amount)
-class BankBalance(MoneyAmount, AccountEntity):
+@deserialize.parser("currency", intern_string)
+@deserialize.parser("type", intern_string)
+@deserialize.parser("status", intern_string)
+@deserialize.parser("source", intern_string)
+class BankBalance(AccountAmount):
     r"""A Bank Account Balance with a unique id.
 
     :attr date: date of the balance
@@ -168,21 +213,21 @@ class BankBalance(MoneyAmount, AccountEntity):
     status: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(BALANCE_STATUS_RE),
+            attr.validators.in_(frozenset(BALANCE_STATUS)),
         ]
     )
     external_id: str
     source: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(SOURCES_RE),
+            attr.validators.in_(frozenset(SOURCES)),
         ]
     )
 
 
 def retrieve_bank_balances(
     client: ApiClient, company_id: str, **kwargs
-) -> Generator[List[BankBalance], None, None]:
+) -> Generator[List[Union[BankBalance, Dict[str, Any]]], None, None]:
     r"""Get pages of cash balances for all the connected bank accounts.
 
     Balances can be filtered by bank_id and account_id.
@@ -198,8 +243,9 @@ def retrieve_bank_balances(
         *account_id* (('str''))  String Unique identifier for the bank account
         *from* filter transactions posted on or after from date
         *to* filter transactions posted on or before to date
+        and the paging options of fractal_python.api_client
     :yield: Pages of BankBalances
-    :rtype: Generator[List[BankBalance], None, None]
+    :rtype: Generator[List[Union[BankBalance, Dict[str, Any]]], None, None]
     """
     yield from _get_paged_response(
         client=client,
@@ -211,12 +257,57 @@ def retrieve_bank_balances(
     )
 
 
-MERCHANT_SOURCE_TYPES = ("MODEL", "USER", "PROVIDER")
+def iter_bank_balances(
+    client: ApiClient, company_id: str, **kwargs
+) -> Generator[Union[BankBalance, Dict[str, Any]], None, None]:
+    r"""Iterate over the cash balances of the connected bank accounts one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for retrieve_bank_balances, such as page_size
+    :yield: BankBalances
+    :rtype: Generator[Union[BankBalance, Dict[str, Any]], None, None]
+    """
+    yield from _items(retrieve_bank_balances(client, company_id, **kwargs))
+
+
+def retrieve_bank_balances_sharded(
+    client: ApiClient, company_id: str, start: Any, end: Any, **kwargs
+) -> Generator[List[BankBalance], None, None]:
+    r"""Retrieve the balances between two dates as windows fetched concurrently.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param start: earliest date, anything arrow.get accepts
+    :type start: Any
+    :param end: latest date, anything arrow.get accepts
+    :type end: Any
+    :param **kwargs: See below
+
+    :Keyword Arguments:
+        *window* ('timedelta') length of each window, or the first if adaptive
+        *target_size* ('int') balances per window to size windows adaptively
+        *max_workers* ('int') windows fetched at once
+        and the keyword arguments of retrieve_bank_balances except raw and fields
+    :yield: Pages of BankBalances in date order, one per window
+    :rtype: Generator[List[BankBalance], None, None]
+    """
+    yield from retrieve_sharded(
+        retrieve_bank_balances, client, company_id, start, end, "date", **kwargs
+    )
+
+
+MERCHANT_SOURCE_TYPES = ("MODEL", "USER", "PROVIDER", "BANK")
 MERCHANT_SOURCE_TYPES_RE = "|".join(MERCHANT_SOURCE_TYPES)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
+@deserialize.parser("source", intern_string)
 class Merchant:
     r"""Merchant.
 
@@ -226,7 +317,7 @@ class Merchant:
     :attr name: name of the merchant.
     :attr category_code: category.
     :attr address_line: address if known
-    :attr source: either MODEL or USER or PROVIDER
+    :attr source: either MODEL or USER or PROVIDER or BANK
     """
     id: str
     name: str
@@ -235,21 +326,22 @@ class Merchant:
     source: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(MERCHANT_SOURCE_TYPES_RE),
+            attr.validators.in_(frozenset(MERCHANT_SOURCE_TYPES)),
         ]
     )
 
 
 def _merchant(value: str) -> Merchant:
-    return deserialize.deserialize(Merchant, value)
+    return interned(Merchant, value, deserializer(Merchant))
 
 
-CATEGORY_SOURCE_TYPES = ("MANUALIMPORT", "OPENBANKING")
+CATEGORY_SOURCE_TYPES = ("MANUALIMPORT", "OPENBANKING", "MODEL", "USER")
 CATEGORY_SOURCE_TYPES_RE = "|".join(CATEGORY_SOURCE_TYPES)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
+@deserialize.parser("source", intern_string)
 class Category:
     r"""Category of a transaction.
 
@@ -266,26 +358,30 @@ class Category:
     source: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(CATEGORY_SOURCE_TYPES_RE),
+            attr.validators.in_(frozenset(CATEGORY_SOURCE_TYPES)),
         ]
     )
 
 
 def _category(value: str) -> Category:
-    return deserialize.deserialize(Category, value)
+    return interned(Category, value, deserializer(Category))
 
 
 TRANSACTION_STATUS = ("BOOKED", "PENDING")
 TRANSACTION_STATUS_RE = "|".join(TRANSACTION_STATUS)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
 @deserialize.parser("booking_date", _arrow_or_none)
 @deserialize.parser("value_date", _arrow_or_none)
 @deserialize.parser("merchant", _merchant)
 @deserialize.parser("category", _category)
-class BankTransaction(MoneyAmount, AccountEntity):
+@deserialize.parser("currency", intern_string)
+@deserialize.parser("type", intern_string)
+@deserialize.parser("status", intern_string)
+@deserialize.parser("source", intern_string)
+class BankTransaction(AccountAmount):
     r"""Transaction on a bank account.
 
     :attr booking_date: arrow.Arrow
@@ -313,7 +409,7 @@ class BankTransaction(MoneyAmount, AccountEntity):
     status: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(TRANSACTION_STATUS_RE),
+            attr.validators.in_(frozenset(TRANSACTION_STATUS)),
         ]
     )
     merchant: Optional[Merchant]
@@ -322,14 +418,14 @@ class BankTransaction(MoneyAmount, AccountEntity):
     source: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(SOURCES_RE),
+            attr.validators.in_(frozenset(SOURCES)),
         ]
     )
 
 
 def retrieve_bank_transactions(
     client: ApiClient, company_id: str, **kwargs
-) -> Generator[List[BankTransaction], None, None]:
+) -> Generator[List[Union[BankTransaction, Dict[str, Any]]], None, None]:
     r"""Retrieve pages of bank transactions for all connected accounts.
 
     Transactions can be filtered by bank_id, account_id, from and to.
@@ -345,8 +441,11 @@ def retrieve_bank_transactions(
         *account_id* (('str''))  String Unique identifier for the bank account
         *from* filter transactions posted on or after from date
         *to* filter transactions posted on or before to date
+        *intern* ('bool') share identical merchants and categories, default True,
+        or an Interner to share them across retrievals
+        and the paging options of fractal_python.api_client
     :yield: Pages of BankTransactions
-    :rtype: Generator[List[BankTransaction], None, None]
+    :rtype: Generator[List[Union[BankTransaction, Dict[str, Any]]], None, None]
     """
     yield from _get_paged_response(
         client=client,
@@ -361,3 +460,64 @@ def retrieve_bank_transactions(
         company_id=company_id,
         **kwargs,
     )
+
+
+def iter_bank_transactions(
+    client: ApiClient, company_id: str, **kwargs
+) -> Generator[Union[BankTransaction, Dict[str, Any]], None, None]:
+    r"""Iterate over the transactions of the connected bank accounts one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for retrieve_bank_transactions, such as page_size
+    :yield: BankTransactions
+    :rtype: Generator[Union[BankTransaction, Dict[str, Any]], None, None]
+    """
+    yield from _items(retrieve_bank_transactions(client, company_id, **kwargs))
+
+
+def retrieve_bank_transactions_sharded(
+    client: ApiClient, company_id: str, start: Any, end: Any, **kwargs
+) -> Generator[List[BankTransaction], None, None]:
+    r"""Retrieve the transactions between two dates as windows fetched concurrently.
+
+    A multi-year backfill of one account is split into date windows that are
+    fetched in parallel through the client and merged in booking order, with
+    transactions on a window boundary yielded once.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param start: earliest booking date, anything arrow.get accepts
+    :type start: Any
+    :param end: latest booking date, anything arrow.get accepts
+    :type end: Any
+    :param **kwargs: See below
+
+    :Keyword Arguments:
+        *window* ('timedelta') length of each window, or the first if adaptive
+        *target_size* ('int') transactions per window to size windows adaptively
+        *max_workers* ('int') windows fetched at once
+        and the keyword arguments of retrieve_bank_transactions except raw and
+        fields
+    :yield: Pages of BankTransactions in booking order, one per window
+    :rtype: Generator[List[BankTransaction], None, None]
+
+    Usage::
+
+      >>> pages = retrieve_bank_transactions_sharded(
+      ...     client, company_id, "2018-01-01", "2021-01-01",
+      ...     account_id=account_id, target_size=2000, max_workers=8)
+    """
+    yield from retrieve_sharded(
+        retrieve_bank_transactions,
+        client,
+        company_id,
+        start,
+        end,
+        "booking_date",
+        **kwargs,
+    )
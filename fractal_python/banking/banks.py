@@ -1,17 +1,19 @@
-import json
-from typing import Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Union
 
 import arrow
 import attr
 import deserialize
 
+from fractal_python import json_backend
 from fractal_python.api_client import (
     ApiClient,
     _arrow_or_none,
     _call_api,
     _get_paged_response,
+    _items,
 )
 from fractal_python.banking.api import BANKING_ENDPOINT
+from fractal_python.deserializer import deserializer
 
 banks_endpoint = BANKING_ENDPOINT + "/banks"
 consents = "consents"
@@ -55,23 +57,45 @@ def new_bank(
     return Bank(bank_id, name, logo, logo_url)
 
 
-def retrieve_banks(client: ApiClient) -> Generator[List[Bank], None, None]:
+def retrieve_banks(
+    client: ApiClient, **kwargs
+) -> Generator[List[Union[Bank, Dict[str, Any]]], None, None]:
     r"""Retrieve all banks.
 
     :param client: the client to use for the api call
     :type client: ApiClient
+    :param **kwargs: the paging options of fractal_python.api_client
     :yield: Page of Banks
-    :rtype: Generator[List[Bank], None, None]
+    :rtype: Generator[List[Union[Bank, Dict[str, Any]]], None, None]
 
     Usage::
 
       >>> banks =[x for y in banking.retrieve_banks(client) for x in y]
     """
     yield from _get_paged_response(
-        client=client, url=banks_endpoint, cls=Bank, param_keys=None, company_id=None
+        client=client,
+        url=banks_endpoint,
+        cls=Bank,
+        param_keys=None,
+        company_id=None,
+        **kwargs,
     )
 
 
+def iter_banks(
+    client: ApiClient, **kwargs
+) -> Generator[Union[Bank, Dict[str, Any]], None, None]:
+    r"""Iterate over all banks one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param **kwargs: as for retrieve_banks, such as page_size
+    :yield: Banks
+    :rtype: Generator[Union[Bank, Dict[str, Any]], None, None]
+    """
+    yield from _items(retrieve_banks(client, **kwargs))
+
+
 @attr.s(auto_attribs=True)
 @deserialize.auto_snake()
 class CreateBankConsentResponse:
@@ -113,12 +137,10 @@ def create_bank_consent(
         url=f"{banks_endpoint}/{bank_id}/{consents}",
         method="POST",
         company_id=company_id,
-        data=json.dumps(dict(redirect=redirect)),
-    )
-    json_response = json.loads(response.text)
-    bank_consent_response = deserialize.deserialize(
-        CreateBankConsentResponse, json_response
+        data=json_backend.dumps(dict(redirect=redirect)),
     )
+    json_response = json_backend.loads(response.content)
+    bank_consent_response = deserializer(CreateBankConsentResponse)(json_response)
     return bank_consent_response
 
 
@@ -152,8 +174,8 @@ class BankConsent:
 
 
 def retrieve_bank_consents(
-    client: ApiClient, bank_id: int, company_id: Optional[str] = None
-) -> Generator[List[BankConsent], None, None]:
+    client: ApiClient, bank_id: int, company_id: Optional[str] = None, **kwargs
+) -> Generator[List[Union[BankConsent, Dict[str, Any]]], None, None]:
     r"""Retrieve consents by bank id and company id.
 
     :param client: the client to use for the api call
@@ -162,15 +184,39 @@ def retrieve_bank_consents(
     :type bank_id: int
     :param company_id: the id of the company to filter on, defaults to None
     :type company_id: str, optional
+    :param **kwargs: the paging options of fractal_python.api_client
     :yield: Page of Bank Consents
-    :rtype: Generator[List[BankConsent], None, None]
+    :rtype: Generator[List[Union[BankConsent, Dict[str, Any]]], None, None]
     """
     url = f"{banks_endpoint}/{bank_id}/{consents}"
     yield from _get_paged_response(
-        client=client, url=url, cls=BankConsent, param_keys=[], company_id=company_id
+        client=client,
+        url=url,
+        cls=BankConsent,
+        param_keys=[],
+        company_id=company_id,
+        **kwargs,
     )
 
 
+def iter_bank_consents(
+    client: ApiClient, bank_id: int, company_id: Optional[str] = None, **kwargs
+) -> Generator[Union[BankConsent, Dict[str, Any]], None, None]:
+    r"""Iterate over consents by bank id and company id one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param bank_id: the id of the bank to filter on
+    :type bank_id: int
+    :param company_id: the id of the company to filter on, defaults to None
+    :type company_id: str, optional
+    :param **kwargs: as for retrieve_bank_consents, such as page_size
+    :yield: BankConsents
+    :rtype: Generator[Union[BankConsent, Dict[str, Any]], None, None]
+    """
+    yield from _items(retrieve_bank_consents(client, bank_id, company_id, **kwargs))
+
+
 def put_bank_consent(
     client: ApiClient,
     code: str,
@@ -206,7 +252,7 @@ def put_bank_consent(
         f"{banks_endpoint}/{bank_id}/{consents}/{consent_id}",
         "PUT",
         company_id=company_id,
-        data=json.dumps(payload),
+        data=json_backend.dumps(payload),
     )
     if response.status_code != 204:
         raise AssertionError(f"status_code:{response.status_code} {response.text}")
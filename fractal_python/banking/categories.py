@@ -1,9 +1,9 @@
-from typing import Generator, List
+from typing import Any, Dict, Generator, List, Union
 
 import attr
 import deserialize  # type: ignore
 
-from fractal_python.api_client import ApiClient, _get_paged_response
+from fractal_python.api_client import ApiClient, _get_paged_response, _items
 from fractal_python.banking.api import BANKING_ENDPOINT
 
 categories = BANKING_ENDPOINT + "/categories"
@@ -21,16 +21,38 @@ class Category:
     name: str
 
 
-def retrieve_categories(client: ApiClient) -> Generator[List[Category], None, None]:
+def retrieve_categories(
+    client: ApiClient, **kwargs
+) -> Generator[List[Union[Category, Dict[str, Any]]], None, None]:
     r"""Retrieve pages of all the categories that Fractal currently supports.
 
     Category id and the category name are returned in the response.
 
     :param client: Live or Sandbox API Client
     :type client: ApiClient
+    :param **kwargs: the paging options of fractal_python.api_client
     :yield: A generator of pages of categories
-    :rtype: Generator[List[Category], None, None]
+    :rtype: Generator[List[Union[Category, Dict[str, Any]]], None, None]
     """
     yield from _get_paged_response(
-        client=client, url=categories, cls=Category, param_keys=None, company_id=None
+        client=client,
+        url=categories,
+        cls=Category,
+        param_keys=None,
+        company_id=None,
+        **kwargs,
     )
+
+
+def iter_categories(
+    client: ApiClient, **kwargs
+) -> Generator[Union[Category, Dict[str, Any]], None, None]:
+    r"""Iterate over the categories that Fractal supports one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param **kwargs: as for retrieve_categories, such as page_size
+    :yield: Categories
+    :rtype: Generator[Union[Category, Dict[str, Any]], None, None]
+    """
+    yield from _items(retrieve_categories(client, **kwargs))
@@ -1,9 +1,9 @@
-from typing import Generator, List
+from typing import Any, Dict, Generator, List, Union
 
 import attr
 import deserialize  # type: ignore
 
-from fractal_python.api_client import ApiClient, _get_paged_response
+from fractal_python.api_client import ApiClient, _get_paged_response, _items
 from fractal_python.banking.api import BANKING_ENDPOINT
 
 merchants = BANKING_ENDPOINT + "/merchants"
@@ -29,16 +29,38 @@ class Merchant:
     address_line: str
 
 
-def retrieve_merchants(client: ApiClient) -> Generator[List[Merchant], None, None]:
+def retrieve_merchants(
+    client: ApiClient, **kwargs
+) -> Generator[List[Union[Merchant, Dict[str, Any]]], None, None]:
     r"""Retrieve pages of all the merchants that are currently categorised by Fractal.
 
     Merchant id and the merchant name are returned in the response.
 
     :param client: Live or Sandbox API Client
     :type client: ApiClient
+    :param **kwargs: the paging options of fractal_python.api_client
     :yield: Pages of Merchants
-    :rtype: Generator[List[Merchant], None, None]
+    :rtype: Generator[List[Union[Merchant, Dict[str, Any]]], None, None]
     """
     yield from _get_paged_response(
-        client=client, url=merchants, cls=Merchant, param_keys=None, company_id=None
+        client=client,
+        url=merchants,
+        cls=Merchant,
+        param_keys=None,
+        company_id=None,
+        **kwargs,
     )
+
+
+def iter_merchants(
+    client: ApiClient, **kwargs
+) -> Generator[Union[Merchant, Dict[str, Any]], None, None]:
+    r"""Iterate over the merchants categorised by Fractal one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param **kwargs: as for retrieve_merchants, such as page_size
+    :yield: Merchants
+    :rtype: Generator[Union[Merchant, Dict[str, Any]], None, None]
+    """
+    yield from _items(retrieve_merchants(client, **kwargs))
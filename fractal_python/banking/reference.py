@@ -0,0 +1,173 @@
+"""Indexed lookup tables over banks, categories and merchants."""
+import bisect
+from typing import Dict, Generator, Iterable, List, Optional, Tuple, cast
+
+import attr
+
+from fractal_python.api_client import ApiClient
+from fractal_python.banking.accounts import BankTransaction
+from fractal_python.banking.banks import Bank, iter_banks
+from fractal_python.banking.categories import Category, iter_categories
+from fractal_python.banking.merchants import Merchant, iter_merchants
+
+
+@attr.s(auto_attribs=True, slots=True)
+class EnrichedTransaction:
+    r"""A BankTransaction joined to the reference data it refers to.
+
+    :attr transaction: the transaction
+    :attr bank: bank with the transaction's bank_id, if known
+    :attr merchant: merchant with the id of the transaction's merchant, if known
+    :attr category: category with the id of the transaction's category, if known
+    """
+
+    transaction: BankTransaction
+    bank: Optional[Bank]
+    merchant: Optional[Merchant]
+    category: Optional[Category]
+
+
+class ReferenceIndex:
+    r"""Banks, categories and merchants indexed for joins and search.
+
+    Lookups by id are dictionary lookups and merchant name searches are
+    binary searches over the case folded names, so enriching a transaction
+    costs the same however many merchants there are.
+
+    Usage::
+
+      >>> index = ReferenceIndex.load(client, cache=ResponseCache())
+      >>> for row in index.enrich(iter_bank_transactions(client, company_id)):
+      ...     print(row.bank.name, row.merchant and row.merchant.name)
+      >>> index.search_merchants("tes")
+
+    :attr banks: Banks by id
+    :attr categories: Categories by id
+    :attr merchants: Merchants by id
+    """
+
+    def __init__(
+        self,
+        banks: Iterable[Bank] = (),
+        categories: Iterable[Category] = (),
+        merchants: Iterable[Merchant] = (),
+    ):
+        r"""Index reference data already retrieved.
+
+        :param banks: banks to index
+        :param categories: categories to index
+        :param merchants: merchants to index
+        """
+        self.banks: Dict[int, Bank] = {bank.id: bank for bank in banks}
+        self.categories: Dict[str, Category] = {
+            category.id: category for category in categories
+        }
+        self.merchants: Dict[str, Merchant] = {
+            merchant.id: merchant for merchant in merchants
+        }
+        self._names: List[Tuple[str, str]] = sorted(
+            (merchant.name.casefold(), merchant.id)
+            for merchant in self.merchants.values()
+            if merchant.name
+        )
+        self._keys = [name for name, _ in self._names]
+
+    @classmethod
+    def load(cls, client: ApiClient, **kwargs) -> "ReferenceIndex":
+        r"""Retrieve all banks, categories and merchants and index them.
+
+        :param client: Live or Sandbox API Client
+        :type client: ApiClient
+        :param **kwargs: passed to each retrieval, such as cache or page_size
+        :return: the index
+        :rtype: ReferenceIndex
+        """
+        return cls(
+            cast(Iterable[Bank], iter_banks(client, **kwargs)),
+            cast(Iterable[Category], iter_categories(client, **kwargs)),
+            cast(Iterable[Merchant], iter_merchants(client, **kwargs)),
+        )
+
+    def bank(self, bank_id: int) -> Optional[Bank]:
+        r"""Look up a bank.
+
+        :param bank_id: id of the bank
+        :return: the bank, or None when it is unknown
+        :rtype: Optional[Bank]
+        """
+        return self.banks.get(bank_id)
+
+    def category(self, category_id: str) -> Optional[Category]:
+        r"""Look up a category.
+
+        :param category_id: id of the category
+        :return: the category, or None when it is unknown
+        :rtype: Optional[Category]
+        """
+        return self.categories.get(category_id)
+
+    def merchant(self, merchant_id: str) -> Optional[Merchant]:
+        r"""Look up a merchant.
+
+        :param merchant_id: id of the merchant
+        :return: the merchant, or None when it is unknown
+        :rtype: Optional[Merchant]
+        """
+        return self.merchants.get(merchant_id)
+
+    def search_merchants(
+        self, prefix: str, limit: Optional[int] = None
+    ) -> List[Merchant]:
+        r"""Find merchants whose name starts with prefix, ignoring case.
+
+        :param prefix: start of the name, the whole name for an exact match
+        :param limit: most merchants to return, None for all
+        :return: matching merchants ordered by name
+        :rtype: List[Merchant]
+        """
+        prefix = prefix.casefold()
+        found: List[Merchant] = []
+        index = bisect.bisect_left(self._keys, prefix)
+        while index < len(self._names) and (limit is None or len(found) < limit):
+            name, merchant_id = self._names[index]
+            if not name.startswith(prefix):
+                break
+            found.append(self.merchants[merchant_id])
+            index += 1
+        return found
+
+    def merchants_named(self, name: str) -> List[Merchant]:
+        r"""Find merchants with a name, ignoring case.
+
+        :param name: the name
+        :return: merchants with exactly that name
+        :rtype: List[Merchant]
+        """
+        name = name.casefold()
+        start = bisect.bisect_left(self._keys, name)
+        end = bisect.bisect_right(self._keys, name, lo=start)
+        return [
+            self.merchants[merchant_id] for _, merchant_id in self._names[start:end]
+        ]
+
+    def enrich(
+        self, transactions: Iterable[BankTransaction]
+    ) -> Generator[EnrichedTransaction, None, None]:
+        r"""Join transactions to their bank, merchant and category.
+
+        :param transactions: transactions, such as from iter_bank_transactions
+        :yield: the transactions with their reference data
+        :rtype: Generator[EnrichedTransaction, None, None]
+        """
+        bank = self.banks.get
+        merchant = self.merchants.get
+        category = self.categories.get
+        for transaction in transactions:
+            nested_merchant = transaction.merchant
+            nested_category = transaction.category
+            yield EnrichedTransaction(
+                transaction,
+                bank(transaction.bank_id),
+                merchant(nested_merchant.id) if nested_merchant else None,
+                category(nested_category.id) if nested_category else None,
+            )
@@ -0,0 +1,232 @@
+"""Cache of the pages of slow-changing reference data.
+
+Pass ``cache=ResponseCache()`` to retrieve_banks, retrieve_categories or
+retrieve_merchants. Pages fetched within the TTL are served from the cache
+without touching the network. Older pages are revalidated with If-None-Match
+or If-Modified-Since when the server sent an ETag or Last-Modified, and a 304
+reply reuses the cached body.
+"""
+import collections
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+import attr
+import requests
+
+DEFAULT_CACHE_ENTRIES = 1024
+DEFAULT_CACHE_TTL = 3600.0
+NOT_MODIFIED = 304
+
+
+@attr.s(auto_attribs=True, slots=True)
+class CachedPage:
+    r"""Body of a page and what is needed to revalidate it.
+
+    :attr content: body of the response
+    :attr expires: time.time() after which the page must be revalidated
+    :attr etag: ETag header of the response, if any
+    :attr last_modified: Last-Modified header of the response, if any
+    """
+
+    content: bytes
+    expires: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def _cache_key(
+    method: str, url: str, params: Optional[Mapping[str, Any]], scope: Optional[str]
+) -> str:
+    query = urlencode(
+        sorted((key, str(value)) for key, value in (params or {}).items())
+    )
+    return f"{method} {url}?{query}|{scope or ''}"
+
+
+class ResponseCache:
+    r"""LRU cache of response bodies with a TTL and conditional revalidation.
+
+    The cache is thread-safe and can be shared by clients. With a path it is
+    loaded from, and written through to, a JSON file.
+
+    Usage::
+
+      >>> cache = ResponseCache(ttl=24 * 3600, path="reference.json")
+      >>> banks = list(banking.iter_banks(client, cache=cache))
+      >>> print(cache.stats())
+
+    :attr max_entries: pages kept before the least recently used is evicted
+    :attr ttl: seconds a page is served without revalidation
+    :attr path: file the cache is persisted to, or None
+    :attr hits: pages served without a request
+    :attr revalidations: pages confirmed unchanged by a 304
+    :attr misses: pages downloaded
+    :attr evictions: pages dropped to stay within max_entries
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        ttl: float = DEFAULT_CACHE_TTL,
+        path: Optional[str] = None,
+    ):
+        r"""Make a cache.
+
+        :param max_entries: pages kept before the least recently used is evicted
+        :param ttl: seconds a page is served without revalidation
+        :param path: JSON file to persist the cache to, None to keep it in memory
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = os.path.expanduser(path) if path else None
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pages: "collections.OrderedDict[str, CachedPage]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        if self.path:
+            self._pages.update(self._read(self.path))
+
+    def stats(self) -> Dict[str, int]:
+        r"""Count how pages were served.
+
+        :return: hits, revalidations, misses, evictions and pages held
+        :rtype: Dict[str, int]
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._pages),
+            }
+
+    def clear(self):
+        r"""Drop every page."""
+        with self._lock:
+            self._pages.clear()
+            self._write()
+
+    def wrap(
+        self, call: Callable, scope: Optional[str] = None, base_url: str = ""
+    ) -> Callable:
+        r"""Serve GET requests made through call from the cache.
+
+        Pages are cached under their absolute URL, so clients of the sandbox
+        and of the live API can share a cache without seeing each other's data.
+
+        :param call: ApiClient.call_api or ApiClient.call_url
+        :param scope: what else the response depends on, such as a company id
+        :param base_url: the client's base_url, which call_api prefixes to
+            resource paths
+        :return: function with the signature of call
+        :rtype: Callable
+        """
+
+        def cached(url: str, method: str, **kwargs) -> requests.Response:
+            if method != "GET":
+                return call(url, method, **kwargs)
+            absolute = url if "://" in url else base_url + url
+            key = _cache_key(method, absolute, kwargs.get("params"), scope)
+            return self._get(key, call, url, method, kwargs)
+
+        return cached
+
+    def _get(
+        self, key: str, call: Callable, url: str, method: str, kwargs: Dict[str, Any]
+    ) -> requests.Response:
+        with self._lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+                if page.expires > time.time():
+                    self.hits += 1
+                    return _response(url, page)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if page is not None and page.etag:
+            headers["If-None-Match"] = page.etag
+        if page is not None and page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+        response = call(url, method, headers=headers, **kwargs)
+        if response.status_code == NOT_MODIFIED and page is not None:
+            page = attr.evolve(page, expires=time.time() + self.ttl)
+            with self._lock:
+                self.revalidations += 1
+                self._put(key, page)
+            return _response(url, page)
+        with self._lock:
+            self.misses += 1
+            if response.status_code == 200:
+                self._put(
+                    key,
+                    CachedPage(
+                        response.content,
+                        time.time() + self.ttl,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                    ),
+                )
+        return response
+
+    def _put(self, key: str, page: CachedPage):
+        self._pages[key] = page
+        self._pages.move_to_end(key)
+        while len(self._pages) > self.max_entries:
+            self._pages.popitem(last=False)
+            self.evictions += 1
+        self._write()
+
+    def _read(self, path: str) -> Dict[str, CachedPage]:
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                stored = json.load(cache_file)
+            return {
+                key: CachedPage(
+                    page["content"].encode("utf-8"),
+                    page["expires"],
+                    page.get("etag"),
+                    page.get("last_modified"),
+                )
+                for key, page in stored.items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def _write(self):
+        if not self.path:
+            return
+        stored = {
+            key: {
+                "content": page.content.decode("utf-8"),
+                "expires": page.expires,
+                "etag": page.etag,
+                "last_modified": page.last_modified,
+            }
+            for key, page in self._pages.items()
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as cache_file:
+            json.dump(stored, cache_file)
+        os.replace(temporary, self.path)
+
+
+def _response(url: str, page: CachedPage) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = page.content  # pylint: disable=W0212
+    if page.etag:
+        response.headers["ETag"] = page.etag
+    return response
@@ -0,0 +1,170 @@
+"""Checkpoints that let a paged retrieval resume where it stopped.
+
+Pass ``checkpoint=store`` to any retrieve_* or iter_* function. Once the
+caller moves past a page, the link to the following page is saved under a key
+made from the API, the partner, the endpoint, the company and the filters, so
+sandbox and live retrievals never share a checkpoint, and the next retrieval
+with the same key starts from that link instead of the first page. The
+checkpoint is cleared when the last page has been consumed.
+"""
+import abc
+import json
+import os
+import threading
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+DEFAULT_CHECKPOINT_FILE = os.path.join(
+    "~", ".cache", "fractal_python", "checkpoints.json"
+)
+
+
+def checkpoint_key(
+    base_url: str,
+    partner_id: str,
+    url: str,
+    company_id: Optional[str],
+    params: Optional[Mapping[str, Any]],
+) -> str:
+    r"""Make the key a paged retrieval is checkpointed under.
+
+    :param base_url: URL of the API the client retrieves from
+    :param partner_id: unique id of the partner retrieving
+    :param url: endpoint path such as BANKING_ENDPOINT + "/transactions"
+    :param company_id: Identifier of the Company, if any
+    :param params: filters sent with the first page, pageSize is ignored
+    :return: key for the retrieval
+    :rtype: str
+    """
+    filters = sorted(
+        (key, str(value)) for key, value in (params or {}).items() if key != "pageSize"
+    )
+    return f"{partner_id}|{base_url}{url}|{company_id or ''}|{urlencode(filters)}"
+
+
+class CheckpointStore(abc.ABC):
+    r"""Where the link to the next unread page of a retrieval is kept.
+
+    Subclasses implement load, save and clear.
+    """
+
+    @abc.abstractmethod
+    def load(self, key: str) -> Optional[str]:
+        r"""Load the link to resume from.
+
+        :param key: key from checkpoint_key
+        :return: link to the next unread page, or None to start from the first
+        :rtype: Optional[str]
+        """
+        return None
+
+    @abc.abstractmethod
+    def save(self, key: str, next_page: str):
+        r"""Record that every page before next_page has been consumed.
+
+        :param key: key from checkpoint_key
+        :param next_page: link to the next unread page
+        """
+
+    @abc.abstractmethod
+    def clear(self, key: str):
+        r"""Forget the checkpoint once the retrieval is complete.
+
+        :param key: key from checkpoint_key
+        """
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    r"""Keep checkpoints for the life of the process."""
+
+    def __init__(self):
+        r"""Make an empty store."""
+        self._checkpoints: Dict[str, str] = {}
+
+    def load(self, key: str) -> Optional[str]:
+        r"""Load the link to resume from.
+
+        :param key: key from checkpoint_key
+        :return: link to the next unread page, or None to start from the first
+        :rtype: Optional[str]
+        """
+        return self._checkpoints.get(key)
+
+    def save(self, key: str, next_page: str):
+        r"""Record that every page before next_page has been consumed.
+
+        :param key: key from checkpoint_key
+        :param next_page: link to the next unread page
+        """
+        self._checkpoints[key] = next_page
+
+    def clear(self, key: str):
+        r"""Forget the checkpoint once the retrieval is complete.
+
+        :param key: key from checkpoint_key
+        """
+        self._checkpoints.pop(key, None)
+
+
+class FileCheckpointStore(CheckpointStore):
+    r"""Keep checkpoints in a JSON file so they survive a crash.
+
+    The file is replaced atomically on every save, so a crash part way
+    through a write leaves the previous checkpoint in place.
+
+    :attr path: location of the checkpoint file
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        r"""Make a store backed by a file.
+
+        :param path: checkpoint file, defaults to
+            ~/.cache/fractal_python/checkpoints.json
+        """
+        self.path = os.path.expanduser(path or DEFAULT_CHECKPOINT_FILE)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with open(self.path, encoding="utf-8") as checkpoint_file:
+                checkpoints = json.load(checkpoint_file)
+        except (OSError, ValueError):
+            return {}
+        return checkpoints if isinstance(checkpoints, dict) else {}
+
+    def _write(self, checkpoints: Dict[str, str]):
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoints, checkpoint_file)
+        os.replace(temporary, self.path)
+
+    def load(self, key: str) -> Optional[str]:
+        r"""Load the link to resume from.
+
+        :param key: key from checkpoint_key
+        :return: link to the next unread page, or None to start from the first
+        :rtype: Optional[str]
+        """
+        return self._read().get(key)
+
+    def save(self, key: str, next_page: str):
+        r"""Record that every page before next_page has been consumed.
+
+        :param key: key from checkpoint_key
+        :param next_page: link to the next unread page
+        """
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[key] = next_page
+            self._write(checkpoints)
+
+    def clear(self, key: str):
+        r"""Forget the checkpoint once the retrieval is complete.
+
+        :param key: key from checkpoint_key
+        """
+        with self._lock:
+            checkpoints = self._read()
+            if checkpoints.pop(key, None) is not None:
+                self._write(checkpoints)
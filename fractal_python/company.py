@@ -1,12 +1,13 @@
-import json
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Union
 
 import arrow
 import attr
 import deserialize  # type: ignore
 from stringcase import camelcase
 
-from fractal_python.api_client import ApiClient, _get_paged_response
+from fractal_python import json_backend
+from fractal_python.api_client import ApiClient, _get_paged_response, _items
+from fractal_python.deserializer import deserializer
 
 COMPANY_ENDPOINT = "/company/v2/companies"
 
@@ -69,9 +70,8 @@ def new_company(
     return NewCompany(name, description, website, industry, address, external_id, crn)
 
 
-class _NewCompanyEncoder(json.JSONEncoder):
-    def default(self, o: NewCompany) -> Dict[str, Any]:  # pylint: disable=E0202
-        return {camelcase(key): value for key, value in o.__dict__.items() if value}
+def _new_company_json(o: NewCompany) -> Dict[str, Any]:
+    return {camelcase(key): value for key, value in o.__dict__.items() if value}
 
 
 @attr.s(auto_attribs=True)
@@ -87,21 +87,18 @@ class Company(NewCompany):
     created_at: arrow.Arrow
 
 
-class _CompanyEncoder(json.JSONEncoder):
-    def default(self, o: Company) -> Dict[str, Any]:  # pylint: disable=E0202
-        arrow_attrs = [
-            x
-            for x in dir(o)
-            if isinstance(getattr(o, x), arrow.Arrow)
-            and x[:2] != "__"
-            and x[-2:] != "__"
-        ]
-        company = {
-            camelcase(k): v for k, v in o.__dict__.items() if v and k not in arrow_attrs
-        }
-        for x in arrow_attrs:
-            company[camelcase(x)] = getattr(o, x).isoformat()
-        return company
+def _company_json(o: Company) -> Dict[str, Any]:
+    arrow_attrs = [
+        x
+        for x in dir(o)
+        if isinstance(getattr(o, x), arrow.Arrow) and x[:2] != "__" and x[-2:] != "__"
+    ]
+    company = {
+        camelcase(k): v for k, v in o.__dict__.items() if v and k not in arrow_attrs
+    }
+    for x in arrow_attrs:
+        company[camelcase(x)] = getattr(o, x).isoformat()
+    return company
 
 
 @attr.s(auto_attribs=True)
@@ -118,7 +115,9 @@ class CreateResponse:
     status: int
 
 
-def get_companies(client: ApiClient, **kwargs) -> Generator[List[Company], None, None]:
+def get_companies(
+    client: ApiClient, **kwargs
+) -> Generator[List[Union[Company, Dict[str, Any]]], None, None]:
     r"""Retrieve existing companies.
 
     Can be filtered by externa_id and crn.
@@ -130,8 +129,9 @@ def get_companies(client: ApiClient, **kwargs) -> Generator[List[Company], None,
     :Keyword Arguments:
         *external_id* (('str'')) Unique identifier for the bank account
         *crn* (('str')) Unique identifier for the forecast
+        and the paging options of fractal_python.api_client
     :yield: pages of Companies objects
-    :rtype: Generator[List[Company], None, None]
+    :rtype: Generator[List[Union[Company, Dict[str, Any]]], None, None]
 
     Usage::
       >>> from fractal_python import company
@@ -149,6 +149,20 @@ def get_companies(client: ApiClient, **kwargs) -> Generator[List[Company], None,
     )
 
 
+def iter_companies(
+    client: ApiClient, **kwargs
+) -> Generator[Union[Company, Dict[str, Any]], None, None]:
+    r"""Iterate over existing companies one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param **kwargs: as for get_companies, such as page_size
+    :yield: Companies
+    :rtype: Generator[Union[Company, Dict[str, Any]], None, None]
+    """
+    yield from _items(get_companies(client, **kwargs))
+
+
 def get_company(client: ApiClient, company_id: str) -> Company:
     r"""Get an existing companies.
 
@@ -163,8 +177,8 @@ def get_company(client: ApiClient, company_id: str) -> Company:
         f"{COMPANY_ENDPOINT}/{company_id}",
         "GET",
     )
-    json_response = json.loads(response.text)
-    return deserialize.deserialize(Company, json_response)
+    json_response = json_backend.loads(response.content)
+    return deserializer(Company)(json_response)
 
 
 def create_companies(
@@ -185,7 +199,7 @@ def create_companies(
       >>> jr = company.new_company(name="Julia Research", crn="12075072")
       >>>  company.create_companies(client=client, companies=[jl,jr])
     """
-    body = '{"values": ' + json.dumps(companies, cls=_NewCompanyEncoder) + "}"
+    body = '{"values": ' + json_backend.dumps(companies, _new_company_json) + "}"
     yield from _get_paged_response(
         client=client,
         url=f"{COMPANY_ENDPOINT}",
@@ -220,7 +234,7 @@ def update_company(client: ApiClient, company: Company):
     :type company: Company
     :raises AssertionError: When response code not 204
     """
-    body = json.dumps(company, cls=_CompanyEncoder)
+    body = json_backend.dumps(company, _company_json)
     response = client.call_api(
         f"{COMPANY_ENDPOINT}/{company.id}",
         "PUT",
@@ -0,0 +1,203 @@
+"""Adaptive concurrency for fanning calls out across many companies."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fractal_python.api_client import ApiClient
+
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_INITIAL_CONCURRENCY = 4
+TOO_MANY_REQUESTS = 429
+SERVER_ERROR = 500
+
+_INSTALL_LOCK = threading.Lock()
+
+
+class AdaptiveLimit:
+    r"""AIMD limit on the number of requests in flight.
+
+    Each successful request adds 1/limit, so the limit grows by about one per
+    round of requests. A 429, a 5xx, a connection error, or a latency more than
+    latency_tolerance times the best recent latency cuts the limit by
+    decrease_factor, at most once per round so one burst of errors is not
+    punished repeatedly.
+
+    :attr limit: current number of requests allowed in flight
+    :attr settled: moving average of the limit, the concurrency it settled on
+    :attr increases: number of successful requests that raised the limit
+    :attr decreases: number of times the limit was cut
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_limit: int = DEFAULT_MIN_CONCURRENCY,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        r"""Make a limit.
+
+        :param initial: requests allowed in flight to begin with
+        :param min_limit: fewest requests ever allowed in flight
+        :param max_limit: most requests ever allowed in flight
+        :param decrease_factor: multiplier applied to the limit when overloaded
+        :param latency_tolerance: latency over the best recent latency that
+            counts as overloaded
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.settled = self.limit
+        self.increases = 0
+        self.decreases = 0
+        self._in_flight = 0
+        self._since_decrease = 0
+        self._best_latency: Optional[float] = None
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        r"""Wait for a free slot and take it."""
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, status_code: Optional[int], latency: float):
+        r"""Give back a slot and adjust the limit from the outcome.
+
+        :param status_code: response code or None after a connection error
+        :param latency: seconds the request took
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._since_decrease += 1
+            if self._overloaded(status_code, latency):
+                if self._since_decrease >= self.limit:
+                    self.limit = max(
+                        float(self.min_limit), self.limit * self.decrease_factor
+                    )
+                    self.decreases += 1
+                    self._since_decrease = 0
+            elif self.limit < self.max_limit:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+                self.increases += 1
+            self.settled += (self.limit - self.settled) * 0.05
+            self._condition.notify_all()
+
+    def _overloaded(self, status_code: Optional[int], latency: float) -> bool:
+        if status_code is None or status_code == TOO_MANY_REQUESTS:
+            return True
+        if status_code >= SERVER_ERROR:
+            return True
+        if self._best_latency is None or latency < self._best_latency:
+            self._best_latency = latency
+            return False
+        self._best_latency += (latency - self._best_latency) * 0.01
+        return latency > self._best_latency * self.latency_tolerance
+
+    def report(self) -> Dict[str, float]:
+        r"""Summarise how the limit has moved.
+
+        :return: current and settled limits and the adjustment counts
+        :rtype: Dict[str, float]
+        """
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "settled": self.settled,
+                "increases": self.increases,
+                "decreases": self.decreases,
+            }
+
+
+class AdaptiveExecutor:
+    r"""Run a function for many items with adaptive concurrency.
+
+    While the executor is open every request made by the client is gated by
+    an AdaptiveLimit, so the number of requests in flight finds the highest
+    rate the API sustains instead of a hand tuned thread count. The limit is
+    installed on entering the executor and removed on closing it, and a
+    client can only be gated by one limit at a time.
+
+    Usage::
+
+      >>> from fractal_python.banking import retrieve_bank_balances
+      >>> def balances(client, company_id):
+      ...     return [x for y in retrieve_bank_balances(client, company_id) for x in y]
+      >>> with AdaptiveExecutor(client, max_concurrency=32) as executor:
+      ...     all_balances = list(executor.map(balances, company_ids))
+      ...     print(executor.limit.report())
+
+    :attr client: the client that makes the requests
+    :attr limit: the limit on requests in flight
+    """
+
+    def __init__(
+        self,
+        client: "ApiClient",
+        limit: Optional[AdaptiveLimit] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        r"""Make an executor.
+
+        :param client: the client that makes the requests
+        :param limit: limit to use, defaults to an AdaptiveLimit up to max_concurrency
+        :param max_concurrency: most requests in flight and worker threads
+        """
+        self.client = client
+        self.limit = limit or AdaptiveLimit(max_limit=max_concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "AdaptiveExecutor":
+        r"""Gate the client by the limit and start the worker threads.
+
+        :return: this executor
+        :rtype: AdaptiveExecutor
+        :raises RuntimeError: when the executor is already open or the client
+            is already gated by a limit, such as another executor's
+        """
+        with _INSTALL_LOCK:
+            if self._executor is not None:
+                raise RuntimeError("the executor is already open")
+            if self.client.concurrency_limit is not None:
+                raise RuntimeError("the client is already gated by a concurrency limit")
+            self.client.concurrency_limit = self.limit
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.limit.max_limit, thread_name_prefix="fractal-fan-out"
+            )
+        return self
+
+    def __exit__(self, *args):
+        r"""Close the executor on leaving the context.
+
+        :param *args: exception details, ignored
+        """
+        self.close()
+
+    def close(self):
+        r"""Wait for running calls and stop gating the client."""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        executor.shutdown(wait=True)
+        with _INSTALL_LOCK:
+            if self.client.concurrency_limit is self.limit:
+                self.client.concurrency_limit = None
+
+    def map(self, func: Callable[["ApiClient", Any], Any], items: Iterable) -> Iterator:
+        r"""Call func(client, item) for every item.
+
+        :param func: function taking the client and an item
+        :param items: items such as company ids
+        :return: results in the order of items, raising any exception from func
+        :rtype: Iterator
+        :raises RuntimeError: when the executor is not open
+        """
+        if self._executor is None:
+            raise RuntimeError("open the executor with a with statement first")
+        return self._executor.map(lambda item: func(self.client, item), items)
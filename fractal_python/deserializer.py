@@ -0,0 +1,570 @@
+"""Deserializers compiled once per model class.
+
+``deserialize.deserialize`` works out how to build an object from its type
+hints and decorators for every object it builds. The functions here read the
+same ``auto_snake``, ``key``, ``parser``, ``default`` and ``ignore``
+declarations once per class and generate a plain Python function that builds
+instances of it, so each page only pays for the dictionary lookups, parsers
+and type checks.
+
+Lazy deserializers leave the values of fields whose parser is marked with
+:func:`lazy_parser` unparsed until the field is first read, so records that
+are filtered out never pay for parsing their dates and amounts.
+
+Projections skip the model altogether and build a dict of just the fields
+that were asked for.
+"""
+import threading
+import types
+import typing
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import attr
+import deserialize
+from deserialize.conversions import camel_case, pascal_case
+
+# These helpers are private to deserialize, so setup.py caps it at the
+# releases they are known to exist in.
+from deserialize.decorators import (
+    _get_default,
+    _get_key,
+    _get_parser,
+    _has_default,
+    _should_ignore,
+    _uses_auto_snake,
+)
+
+T = TypeVar("T")
+
+_DESERIALIZERS: Dict[Tuple[type, bool], Callable[[Any], Any]] = {}
+_PROJECTIONS: Dict[Tuple[type, Tuple[str, ...]], Callable[[Any], Any]] = {}
+_COMPILING: Dict[type, bool] = {}
+_LOCK = threading.RLock()
+_MISSING = object()
+
+
+def lazy_parser(parser: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    r"""Mark a parser as safe to run on first access instead of up front.
+
+    Only pure parsers whose result depends on nothing but the raw value,
+    such as date and amount parsers, should be marked.
+
+    :param parser: parser used with deserialize.parser
+    :return: the same parser
+    :rtype: Callable[[Any], Any]
+    """
+    parser.__lazy_parser__ = True  # type: ignore[attr-defined]
+    return parser
+
+
+def deserializer(cls: Type[T], lazy: bool = False) -> Callable[[Any], T]:
+    r"""Get the compiled deserializer for a model class.
+
+    The deserializer is generated on first use and cached, so later calls
+    are a dictionary lookup.
+
+    A lazy deserializer builds instances of a subclass of cls that parses
+    fields with a lazy_parser on first access and keeps the parsed value.
+    They compare equal to the eager instances with the same values.
+
+    :param cls: attrs model class declared with the deserialize decorators
+    :param lazy: defer lazy_parser fields until they are read
+    :return: function turning a dict from the API into an instance of cls
+    :rtype: Callable[[Any], T]
+    """
+    try:
+        return _DESERIALIZERS[cls, lazy]
+    except KeyError:
+        pass
+    with _LOCK:
+        if (cls, lazy) not in _DESERIALIZERS:
+            _COMPILING[cls] = True
+            try:
+                _DESERIALIZERS[cls, lazy] = _compile(cls, lazy)
+            finally:
+                del _COMPILING[cls]
+        return _DESERIALIZERS[cls, lazy]
+
+
+def deserialize_list(cls: Type[T], data: Any, lazy: bool = False) -> List[T]:
+    r"""Build a list of models from a list of dicts.
+
+    :param cls: attrs model class declared with the deserialize decorators
+    :param data: list of dicts from the API
+    :param lazy: defer lazy_parser fields until they are read
+    :return: list of instances of cls
+    :rtype: List[T]
+    :raises DeserializeException: when data does not match the model
+    """
+    if not isinstance(data, list):
+        raise deserialize.DeserializeException(
+            f"Cannot deserialize '{type(data)}' to 'List[{cls.__name__}]'"
+        )
+    build = deserializer(cls, lazy)
+    return [build(item) for item in data]
+
+
+def projection(cls: Type, fields: Iterable[str]) -> Callable[[Any], Dict[str, Any]]:
+    r"""Get the compiled projection of a model class onto some of its fields.
+
+    A projection turns a dict from the API into a dict of the listed fields,
+    keyed by attribute name, running only their parsers. No model is built.
+
+    :param cls: attrs model class declared with the deserialize decorators
+    :param fields: attribute names to keep
+    :return: function turning a dict from the API into a dict of the fields
+    :rtype: Callable[[Any], Dict[str, Any]]
+    :raises ValueError: when cls has no attribute with one of the names
+    """
+    key = (cls, tuple(fields))
+    try:
+        return _PROJECTIONS[key]
+    except KeyError:
+        pass
+    hints = typing.get_type_hints(cls)
+    unknown = [name for name in key[1] if name not in hints]
+    if unknown:
+        raise ValueError(f"{cls.__name__} has no fields {', '.join(unknown)}")
+    with _LOCK:
+        if key not in _PROJECTIONS:
+            _PROJECTIONS[key] = _compile_projection(*key)
+        return _PROJECTIONS[key]
+
+
+def project_list(cls: Type, fields: Iterable[str], data: Any) -> List[Dict[str, Any]]:
+    r"""Project a list of dicts from the API onto some fields of a model.
+
+    :param cls: attrs model class declared with the deserialize decorators
+    :param fields: attribute names to keep
+    :param data: list of dicts from the API
+    :return: list of dicts of the fields
+    :rtype: List[Dict[str, Any]]
+    :raises DeserializeException: when data does not match the model
+    """
+    if not isinstance(data, list):
+        raise deserialize.DeserializeException(
+            f"Cannot project '{type(data)}' to 'List[{cls.__name__}]'"
+        )
+    project = projection(cls, fields)
+    return [project(item) for item in data]
+
+
+class _Unparsed:
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: Any):
+        self.raw = raw
+
+
+class _Deferred:
+    r"""Descriptor that parses an _Unparsed value on first access.
+
+    The value is kept in the slot of the model class, or in the instance
+    dict if the model is not slotted, and replaced by the parsed value.
+    """
+
+    __slots__ = ("name", "parser", "slot")
+
+    def __init__(self, name: str, parser: Callable[[Any], Any], slot: Any):
+        self.name = name
+        self.parser = parser
+        self.slot = slot
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        if self.slot is None:
+            try:
+                value = obj.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        else:
+            value = self.slot.__get__(obj, owner)
+        if type(value) is _Unparsed:
+            value = self.parser(value.raw)
+            self.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: Any, value: Any):
+        if self.slot is None:
+            obj.__dict__[self.name] = value
+        else:
+            self.slot.__set__(obj, value)
+
+    def __delete__(self, obj: Any):
+        if self.slot is None:
+            del obj.__dict__[self.name]
+        else:
+            self.slot.__delete__(obj)
+
+
+def _slot(cls: type, name: str) -> Any:
+    for klass in cls.__mro__:
+        member = klass.__dict__.get(name)
+        if isinstance(member, types.MemberDescriptorType):
+            return member
+    return None
+
+
+def _lazy_class(cls: type, parsers: Dict[str, Callable[[Any], Any]]) -> type:
+    r"""Make a subclass of cls that parses the given fields on first access.
+
+    :param cls: attrs model class
+    :param parsers: lazy parser of each field to defer, by attribute name
+    :return: the subclass
+    :rtype: type
+    """
+    names = tuple(field.name for field in attr.fields(cls))
+
+    def values(obj):
+        return tuple(getattr(obj, name) for name in names)
+
+    def __eq__(self, other):
+        if not isinstance(other, cls):
+            return NotImplemented
+        return values(self) == values(other)
+
+    def __ne__(self, other):
+        result = __eq__(self, other)
+        return result if result is NotImplemented else not result
+
+    def __reduce__(self):
+        return _eager, (cls, values(self))
+
+    namespace: Dict[str, Any] = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+        "__eq__": __eq__,
+        "__ne__": __ne__,
+        "__hash__": cls.__hash__,
+        "__reduce__": __reduce__,
+    }
+    for name, parser in parsers.items():
+        namespace[name] = _Deferred(name, parser, _slot(cls, name))
+    return type(cls.__name__, (cls,), namespace)
+
+
+def _eager(cls: type, values: Tuple) -> Any:
+    r"""Rebuild an unpickled lazy instance as an instance of the model.
+
+    :param cls: attrs model class
+    :param values: value of each field, in field order
+    :return: instance of cls
+    :rtype: Any
+    """
+    obj: Any = object.__new__(cls)
+    for field, value in zip(attr.fields(cls), values):
+        object.__setattr__(obj, field.name, value)
+    return obj
+
+
+def _compile_projection(cls: type, fields: Tuple[str, ...]) -> Callable[[Any], Any]:
+    hints = typing.get_type_hints(cls)
+    auto_snake = _uses_auto_snake(cls)
+    namespace: Dict[str, Any] = {
+        "DeserializeException": deserialize.DeserializeException,
+        "MISSING": _MISSING,
+    }
+    lines = [
+        "def project(data):",
+        "    if not isinstance(data, dict):",
+        "        raise DeserializeException(",
+        f"            f\"Cannot project '{{type(data)}}' to '{cls.__name__}'\"",
+        "        )",
+        "    obj = {}",
+    ]
+    for index, (name, hint) in enumerate(hints.items()):
+        if name in fields:
+            lines.extend(_field_lines(cls, index, name, hint, auto_snake, namespace))
+            lines.append(f"    obj[{name!r}] = value")
+    lines.append("    return obj")
+    source = "\n".join(lines)
+    # The source is generated from the model's own field names and types,
+    # never from data received from the API.
+    exec(  # nosec
+        compile(source, f"<projection {cls.__qualname__}>", "exec"), namespace
+    )
+    return namespace["project"]
+
+
+def _compile(cls: type, lazy: bool) -> Callable[[Any], Any]:
+    hints = typing.get_type_hints(cls)
+    if not hints:
+        raise deserialize.DeserializeException(
+            f"Could not deserialize into {cls} due to lack of type hints"
+        )
+    auto_snake = _uses_auto_snake(cls)
+    deferred = (
+        {
+            name: parser
+            for name, parser in (
+                (name, _get_parser(cls, _get_key(cls, name))) for name in hints
+            )
+            if getattr(parser, "__lazy_parser__", False)
+        }
+        if lazy and attr.has(cls)
+        else {}
+    )
+    target = _lazy_class(cls, deferred) if deferred else cls
+    namespace: Dict[str, Any] = {
+        "cls": cls,
+        "target": target,
+        "new": target.__new__,
+        "Unparsed": _Unparsed,
+        "DeserializeException": deserialize.DeserializeException,
+        "constructed": getattr(cls, "__deserialize_constructed__", None),
+        "MISSING": _MISSING,
+    }
+    lines = [
+        "def build(data):",
+        "    if not isinstance(data, dict):",
+        "        if isinstance(data, cls):",
+        "            return data",
+        "        raise DeserializeException(",
+        f"            f\"Cannot deserialize '{{type(data)}}' to '{cls.__name__}'\"",
+        "        )",
+        "    obj = new(target)",
+    ]
+    for index, (name, hint) in enumerate(hints.items()):
+        if _should_ignore(cls, name) or _is_classvar(hint):
+            continue
+        if name in deferred:
+            lines.extend(_deferred_lines(cls, index, name, hint, auto_snake, namespace))
+        else:
+            lines.extend(_field_lines(cls, index, name, hint, auto_snake, namespace))
+            lines.append(f"    obj.{name} = value")
+    lines.append("    if constructed is not None:")
+    lines.append("        constructed(obj)")
+    lines.append("    return obj")
+    source = "\n".join(lines)
+    # The source is generated from the model's own field names and types,
+    # never from data received from the API.
+    exec(  # nosec
+        compile(source, f"<deserializer {cls.__qualname__}>", "exec"), namespace
+    )
+    return namespace["build"]
+
+
+def _keys(cls: type, name: str, auto_snake: bool) -> List[str]:
+    key = _get_key(cls, name)
+    keys = [key]
+    if auto_snake:
+        keys.extend(k for k in (camel_case(key), pascal_case(key)) if k not in keys)
+    return keys
+
+
+def _deferred_lines(
+    cls: type,
+    index: int,
+    name: str,
+    hint: Any,
+    auto_snake: bool,
+    namespace: Dict[str, Any],
+) -> List[str]:
+    keys = _keys(cls, name, auto_snake)
+    namespace[f"parse_{index}"] = _get_parser(cls, keys[0])
+    slot = _slot(cls, name)
+    namespace[f"store_{index}"] = slot.__set__ if slot else None
+    lines = []
+    for position, candidate in enumerate(keys):
+        branch = "if" if position == 0 else "elif"
+        lines.append(f"    {branch} {candidate!r} in data:")
+        lines.append(f"        value = Unparsed(data[{candidate!r}])")
+    lines.append("    else:")
+    if _has_default(cls, name):
+        namespace[f"default_{index}"] = _get_default(cls, name)
+        lines.append(f"        value = default_{index}")
+    elif _optional(hint):
+        lines.append(f"        value = parse_{index}(None)")
+    else:
+        message = f"Unexpected missing value for: {cls.__name__}.{name}"
+        lines.append("        raise DeserializeException(")
+        lines.append(f"            {message!r}")
+        lines.append("        )")
+    if slot is None:
+        lines.append(f"    obj.__dict__[{name!r}] = value")
+    else:
+        lines.append(f"    store_{index}(obj, value)")
+    return lines
+
+
+def _field_lines(
+    cls: type,
+    index: int,
+    name: str,
+    hint: Any,
+    auto_snake: bool,
+    namespace: Dict[str, Any],
+) -> List[str]:
+    keys = _keys(cls, name, auto_snake)
+    key = keys[0]
+    parser = _get_parser(cls, key)
+    identity = parser.__name__ == "identity_parser"
+    namespace[f"parse_{index}"] = parser
+    parse = "{}" if identity else f"parse_{index}({{}})"
+    check, convert = _converter(hint, index, namespace)
+    debug = f"{cls.__name__}.{name}"
+
+    lines = []
+    for position, candidate in enumerate(keys):
+        branch = "if" if position == 0 else "elif"
+        lines.append(f"    {branch} {candidate!r} in data:")
+        lines.append(f"        value = {parse.format(f'data[{candidate!r}]')}")
+    lines.append("    else:")
+    if _has_default(cls, name):
+        namespace[f"default_{index}"] = _get_default(cls, name)
+        lines.append("        value = MISSING")
+        lines.append("    if value is MISSING:")
+        lines.append(f"        value = default_{index}")
+        lines.append("    else:")
+        indent = "        "
+    elif _optional(hint):
+        lines.append(f"        value = {parse.format('None')}")
+        indent = "    "
+    else:
+        lines.append("        raise DeserializeException(")
+        lines.append(f"            {'Unexpected missing value for: ' + debug!r}")
+        lines.append("        )")
+        indent = "    "
+    if check:
+        lines.append(f"{indent}if not ({check}):")
+        lines.append(f"{indent}    raise DeserializeException(")
+        lines.append(
+            f"{indent}        f\"Cannot deserialize '{{type(value)}}' for '{debug}'\""
+        )
+        lines.append(f"{indent}    )")
+    if convert:
+        lines.append(f"{indent}value = {convert}")
+    return lines
+
+
+def _converter(hint: Any, index: int, namespace: Dict[str, Any]):
+    r"""Generate the check and conversion for a field type.
+
+    :param hint: type hint of the field
+    :param index: position of the field, used to name helpers
+    :param namespace: globals of the generated function
+    :return: (check, convert) python expressions over value, either may be None
+    """
+    optional = _optional(hint)
+    if optional:
+        hint = _without_none(hint)
+    if hint is Any:
+        return None, None
+    if isinstance(hint, type) and not _is_model(hint) and _origin(hint) is None:
+        namespace[f"type_{index}"] = hint
+        check = f"isinstance(value, type_{index})"
+        return (f"value is None or {check}" if optional else check), None
+    namespace[f"convert_{index}"] = _value_converter(hint)
+    return None, _maybe_none(f"convert_{index}(value)", optional)
+
+
+def _value_converter(hint: Any) -> Callable[[Any], Any]:
+    if hint is Any:
+        return lambda value: value
+    if _is_model(hint):
+        if hint in _COMPILING:
+            return lambda value: deserializer(hint)(value)
+        return deserializer(hint)
+    if _origin(hint) in (list, List):
+        (item_type,) = _args(hint) or (Any,)
+        convert_item = _value_converter(item_type)
+
+        def convert_list(value):
+            if not isinstance(value, list):
+                raise deserialize.DeserializeException(
+                    f"Cannot deserialize '{type(value)}' to '{hint}'"
+                )
+            return [convert_item(item) for item in value]
+
+        return convert_list
+    if isinstance(hint, type):
+
+        def check(value):
+            if not isinstance(value, hint):
+                raise deserialize.DeserializeException(
+                    f"Cannot deserialize '{type(value)}' to '{hint}'"
+                )
+            return value
+
+        return check
+    return lambda value: _fallback(hint, value)
+
+
+def _fallback(hint: Any, value: Any) -> Any:
+    r"""Deserialize types the generated code does not handle, such as unions.
+
+    :param hint: type hint of the value
+    :param value: value from the API
+    :return: the deserialized value
+    :rtype: Any
+    """
+    return deserialize.deserialize(List[hint], [value])[0]
+
+
+def _maybe_none(expression: str, optional: bool) -> str:
+    return f"None if value is None else {expression}" if optional else expression
+
+
+def _is_model(hint: Any) -> bool:
+    return (
+        isinstance(hint, type)
+        and hint.__module__ != "builtins"
+        and hasattr(hint, "__attrs_attrs__")
+    )
+
+
+def _origin(hint: Any) -> Any:
+    r"""Get the unsubscripted form of a hint, as typing.get_origin does in 3.8.
+
+    :param hint: type hint
+    :return: the unsubscripted form, None if the hint is not subscripted
+    :rtype: Any
+    """
+    return getattr(hint, "__origin__", None)
+
+
+def _args(hint: Any) -> Tuple[Any, ...]:
+    r"""Get the subscripts of a hint, as typing.get_args does in 3.8.
+
+    :param hint: type hint
+    :return: the subscripts, empty if there are none
+    :rtype: Tuple[Any, ...]
+    """
+    if getattr(hint, "_special", False):
+        return ()
+    return getattr(hint, "__args__", None) or ()
+
+
+def _is_classvar(hint: Any) -> bool:
+    return hint is typing.ClassVar or _origin(hint) is typing.ClassVar
+
+
+def _optional(hint: Any) -> bool:
+    return _origin(hint) is typing.Union and type(None) in _args(hint)
+
+
+def _without_none(hint: Any) -> Any:
+    others = tuple(arg for arg in _args(hint) if arg is not type(None))
+    return others[0] if len(others) == 1 else typing.Union[others]
+
+
+__all__ = [
+    "deserializer",
+    "deserialize_list",
+    "lazy_parser",
+    "projection",
+    "project_list",
+]
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Generator, List
+from typing import Any, Dict, Generator, List, Union
 
 import arrow
 import attr
@@ -9,9 +9,11 @@ from fractal_python.api_client import (
     ApiClient,
     _arrow_or_none,
     _get_paged_response,
+    _items,
     _money_amount,
 )
-from fractal_python.banking.accounts import BALANCE_TYPES_RE
+from fractal_python.banking.accounts import BALANCE_TYPES
+from fractal_python.interning import intern_string
 
 BANK_ACCOUNT_PARAMS = [
     "bank_id",
@@ -37,7 +39,7 @@ SOURCES = ("MODEL", "MANUALIMPORT")
 SOURCES_RE = "|".join(SOURCES)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class AccountEntity:
     r"""A uniquely identifiable Account related entity.
 
@@ -50,9 +52,10 @@ class AccountEntity:
     account_id: str
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
 @deserialize.parser("date", _arrow_or_none)
+@deserialize.parser("source", intern_string)
 class Forecast(AccountEntity):
     r"""Forecast of transactions on a bank account.
 
@@ -64,7 +67,7 @@ class Forecast(AccountEntity):
     source: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(SOURCES_RE),
+            attr.validators.in_(frozenset(SOURCES)),
         ]
     )
     name: str
@@ -72,7 +75,7 @@ class Forecast(AccountEntity):
 
 def get_forecasts(
     client: ApiClient, company_id: str, **kwargs
-) -> Generator[List[Forecast], None, None]:
+) -> Generator[List[Union[Forecast, Dict[str, Any]]], None, None]:
     r"""Get all forecasts for the company.
 
     :param client: Live or Sandbox API Client
@@ -84,8 +87,9 @@ def get_forecasts(
     :Keyword Arguments:
         *bank_id* (('int'')) Unique identifier for the bank
         *account_id* (('str'')) Unique identifier for the bank account
+        and the paging options of fractal_python.api_client
     :yield: Pages of Forecast objects
-    :rtype: Generator[List[Forecast], None, None]
+    :rtype: Generator[List[Union[Forecast, Dict[str, Any]]], None, None]
     """
     yield from _get_paged_response(
         client=client,
@@ -97,7 +101,23 @@ def get_forecasts(
     )
 
 
-@attr.s(auto_attribs=True)
+def iter_forecasts(
+    client: ApiClient, company_id: str, **kwargs
+) -> Generator[Union[Forecast, Dict[str, Any]], None, None]:
+    r"""Iterate over the forecasts for the company one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for get_forecasts, such as page_size
+    :yield: Forecasts
+    :rtype: Generator[Union[Forecast, Dict[str, Any]], None, None]
+    """
+    yield from _items(get_forecasts(client, company_id, **kwargs))
+
+
+@attr.s(auto_attribs=True, slots=True)
 class ForecastEntity(AccountEntity):
     r"""An identifiable forecast.
 
@@ -106,9 +126,11 @@ class ForecastEntity(AccountEntity):
     forecast_id: str
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
 @deserialize.parser("amount", _money_amount)
+@deserialize.parser("currency", intern_string)
+@deserialize.parser("type", intern_string)
 class ForecastedAmount:
     r"""Amount with currency and credit/debit.
 
@@ -121,15 +143,44 @@ class ForecastedAmount:
     type: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(BALANCE_TYPES_RE),
+            attr.validators.in_(frozenset(BALANCE_TYPES)),
+        ]
+    )
+
+
+@attr.s(auto_attribs=True, slots=True)
+@deserialize.auto_snake()
+@deserialize.parser("amount", _money_amount)
+@deserialize.parser("currency", intern_string)
+@deserialize.parser("type", intern_string)
+class ForecastedEntityAmount(ForecastEntity):
+    r"""A ForecastEntity with the fields of a ForecastedAmount.
+
+    Slotted classes can only inherit slots along one line, so forecasted
+    transactions and balances extend this rather than both ForecastEntity and
+    ForecastedAmount.
+
+    :attr currency: the currency of the account.
+    :attr amount: decimal amount
+    :attr type: either DEBIT or CREDIT
+    """
+    currency: str
+    amount: Decimal
+    type: str = attr.ib(
+        validator=[
+            attr.validators.instance_of(str),
+            attr.validators.in_(frozenset(BALANCE_TYPES)),
         ]
     )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
 @deserialize.parser("value_date", _arrow_or_none)
-class ForecastedTransaction(ForecastEntity, ForecastedAmount):
+@deserialize.parser("currency", intern_string)
+@deserialize.parser("type", intern_string)
+@deserialize.parser("source", intern_string)
+class ForecastedTransaction(ForecastedEntityAmount):
     r"""Forecasted Transaction on a Bank Account.
 
     :attr value_date: forecast value date
@@ -148,14 +199,14 @@ class ForecastedTransaction(ForecastEntity, ForecastedAmount):
     source: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(SOURCES_RE),
+            attr.validators.in_(frozenset(SOURCES)),
         ]
     )
 
 
 def get_forecasted_transactions(
     client: ApiClient, company_id: str, **kwargs
-) -> Generator[List[ForecastedTransaction], None, None]:
+) -> Generator[List[Union[ForecastedTransaction, Dict[str, Any]]], None, None]:
     r"""Get all forecasted transactions linked to the provided forecast id.
 
     Can be filtered by bank_id, account_id, forecast_od, from and to.
@@ -172,8 +223,9 @@ def get_forecasted_transactions(
         *forecast_id* (('str')) Unique identifier for the forecast
         *from* filter transactions posted on or after from date
         *to* filter transactions posted on or before to date
+        and the paging options of fractal_python.api_client
     :yield: Pages of ForecastedBankTransaction objects
-    :rtype: Generator[List[ForecastedTransaction], None, None]
+    :rtype: Generator[List[Union[ForecastedTransaction, Dict[str, Any]]], None, None]
     """
     yield from _get_paged_response(
         client=client,
@@ -185,10 +237,29 @@ def get_forecasted_transactions(
     )
 
 
-@attr.s(auto_attribs=True)
+def iter_forecasted_transactions(
+    client: ApiClient, company_id: str, **kwargs
+) -> Generator[Union[ForecastedTransaction, Dict[str, Any]], None, None]:
+    r"""Iterate over forecasted transactions one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for get_forecasted_transactions, such as page_size
+    :yield: ForecastedTransactions
+    :rtype: Generator[Union[ForecastedTransaction, Dict[str, Any]], None, None]
+    """
+    yield from _items(get_forecasted_transactions(client, company_id, **kwargs))
+
+
+@attr.s(auto_attribs=True, slots=True)
 @deserialize.auto_snake()
 @deserialize.parser("date", _arrow_or_none)
-class ForecastedBalance(ForecastEntity, ForecastedAmount):
+@deserialize.parser("currency", intern_string)
+@deserialize.parser("type", intern_string)
+@deserialize.parser("source", intern_string)
+class ForecastedBalance(ForecastedEntityAmount):
     r"""Forecasted Balance of a Bank Account.
 
     :attr date: forecast balance date
@@ -198,14 +269,14 @@ class ForecastedBalance(ForecastEntity, ForecastedAmount):
     source: str = attr.ib(
         validator=[
             attr.validators.instance_of(str),
-            attr.validators.matches_re(SOURCES_RE),
+            attr.validators.in_(frozenset(SOURCES)),
         ]
     )
 
 
 def get_forecasted_balances(
     client: ApiClient, company_id: str, **kwargs
-) -> Generator[List[ForecastedBalance], None, None]:
+) -> Generator[List[Union[ForecastedBalance, Dict[str, Any]]], None, None]:
     r"""Get all forecasted balances linked to the provided forecast id.
 
     Can filter on bank_id, account_id, forecast_id, from and to
@@ -222,8 +293,9 @@ def get_forecasted_balances(
         *forecast_id* (('str')) Unique identifier for the forecast
         *from* filter transactions posted on or after from date
         *to* filter transactions posted on or before to date
+        and the paging options of fractal_python.api_client
     :yield: pages of ForecastedBalance objects
-    :rtype: Generator[List[ForecastedBalance], None, None]
+    :rtype: Generator[List[Union[ForecastedBalance, Dict[str, Any]]], None, None]
     """
     yield from _get_paged_response(
         client=client,
@@ -233,3 +305,19 @@ def get_forecasted_balances(
         company_id=company_id,
         **kwargs,
     )
+
+
+def iter_forecasted_balances(
+    client: ApiClient, company_id: str, **kwargs
+) -> Generator[Union[ForecastedBalance, Dict[str, Any]], None, None]:
+    r"""Iterate over forecasted balances one at a time.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param **kwargs: as for get_forecasted_balances, such as page_size
+    :yield: ForecastedBalances
+    :rtype: Generator[Union[ForecastedBalance, Dict[str, Any]], None, None]
+    """
+    yield from _items(get_forecasted_balances(client, company_id, **kwargs))
@@ -0,0 +1,95 @@
+"""JSON encoding and decoding with the fastest library installed.
+
+orjson is used when it is installed, otherwise the standard library. ujson
+is not used: releases before 5.2 reject the default argument and later ones
+encode Decimal amounts as floats.
+``use`` picks a backend by name, for example to compare them.
+"""
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+import attr
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class JsonBackend:
+    r"""A JSON library adapted to one interface.
+
+    :attr name: name of the library
+    :attr loads: function from JSON text or UTF-8 bytes to Python objects
+    :attr dumps: function from a Python object and an optional default function
+        to JSON text
+    """
+
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps: Callable[[Any, Optional[Callable[[Any], Any]]], str]
+
+
+def _stdlib_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    return json.dumps(obj, default=default)
+
+
+BACKENDS: Dict[str, JsonBackend] = {}
+
+try:
+    import orjson  # type: ignore
+
+    def _orjson_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return orjson.dumps(obj, default=default).decode("utf-8")
+
+    BACKENDS["orjson"] = JsonBackend("orjson", orjson.loads, _orjson_dumps)
+except ImportError:  # pragma: no cover
+    pass
+
+BACKENDS["json"] = JsonBackend("json", json.loads, _stdlib_dumps)
+
+_backend = next(iter(BACKENDS.values()))
+
+
+def backend() -> JsonBackend:
+    r"""Get the backend in use.
+
+    :return: the backend loads and dumps call
+    :rtype: JsonBackend
+    """
+    return _backend
+
+
+def use(name: str) -> JsonBackend:
+    r"""Choose the backend loads and dumps call.
+
+    :param name: one of BACKENDS, such as "orjson" or "json"
+    :return: the backend now in use
+    :rtype: JsonBackend
+    :raises ValueError: when the library is not installed
+    """
+    global _backend  # pylint: disable=W0603
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend {name} is not installed, use one of {BACKENDS}")
+    _backend = BACKENDS[name]
+    return _backend
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    r"""Decode JSON.
+
+    Every backend raises a ValueError when data is not valid JSON.
+
+    :param data: JSON text or UTF-8 bytes
+    :return: the decoded value
+    :rtype: Any
+    """
+    return _backend.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    r"""Encode JSON.
+
+    :param obj: value to encode
+    :param default: function turning values the backend cannot encode into
+        ones it can
+    :return: JSON text
+    :rtype: str
+    """
+    return _backend.dumps(obj, default)
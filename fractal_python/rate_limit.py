@@ -0,0 +1,119 @@
+"""Client side rate limiting of calls to the Fractal API."""
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    r"""Thread-safe token bucket.
+
+    Tokens are added at rate per second up to burst. Callers that find the
+    bucket empty reserve their token and sleep until it is due, so waiting
+    callers are served in order without spinning.
+
+    :attr rate: tokens added per second
+    :attr burst: most tokens that can be held
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        r"""Make a full bucket.
+
+        :param rate: tokens added per second
+        :param burst: most tokens that can be held, defaults to one second's worth
+        :raises ValueError: when rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, not {rate}")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        r"""Take tokens, going into debt when there are not enough.
+
+        :param tokens: tokens to take
+        :return: seconds until the tokens are due
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        r"""Wait until tokens are available and take them.
+
+        :param tokens: tokens to take
+        :return: seconds waited
+        :rtype: float
+        """
+        wait = self.reserve(tokens)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    r"""Limit the request rate of one or more ApiClients.
+
+    A request waits for the overall bucket, if there is one, and for the
+    bucket of the longest endpoint prefix its path starts with, such as
+    ``BANKING_ENDPOINT`` or ``COMPANY_ENDPOINT``.
+
+    Usage::
+
+      >>> from fractal_python.banking.api import BANKING_ENDPOINT
+      >>> limiter = RateLimiter(20, 40, endpoints={BANKING_ENDPOINT: (10, 10)})
+      >>> client = api_client.live('secret key', 'partner id', rate_limiter=limiter)
+
+    :attr waited_seconds: total time requests have been held back
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        endpoints: Optional[Dict[str, Tuple[float, float]]] = None,
+    ):
+        r"""Make a rate limiter.
+
+        :param rate: requests per second across all endpoints, None for no limit
+        :param burst: requests allowed at once across all endpoints
+        :param endpoints: (rate, burst) for requests whose path starts with a prefix
+        """
+        self._bucket = TokenBucket(rate, burst) if rate else None
+        self._endpoints: List[Tuple[str, TokenBucket]] = sorted(
+            (
+                (prefix, TokenBucket(*limits))
+                for prefix, limits in (endpoints or {}).items()
+            ),
+            key=lambda endpoint: len(endpoint[0]),
+            reverse=True,
+        )
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def acquire(self, url: str) -> float:
+        r"""Wait until a request to the url is allowed.
+
+        :param url: full url of the request
+        :return: seconds waited
+        :rtype: float
+        """
+        wait = self._bucket.reserve() if self._bucket else 0.0
+        path = urlparse(url).path
+        for prefix, bucket in self._endpoints:
+            if path.startswith(prefix):
+                wait = max(wait, bucket.reserve())
+                break
+        if wait:
+            with self._lock:
+                self.waited_seconds += wait
+            time.sleep(wait)
+        return wait
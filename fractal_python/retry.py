@@ -0,0 +1,171 @@
+"""Retrying throttled and failed calls to the Fractal API."""
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional
+
+import arrow
+import attr
+import requests
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+TOO_MANY_REQUESTS = 429
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RetryPolicy:
+    r"""When and how long to wait before retrying a call.
+
+    Idempotent methods are retried on any of the retry statuses and on
+    connection errors. Other methods, such as POST, are only retried on 429
+    because the server rejected them without acting on them.
+
+    Waits honour a Retry-After header and otherwise back off exponentially
+    from backoff, capped at max_backoff, with full jitter.
+
+    The budget allows budget_minimum retries plus budget_ratio retries per
+    request made by the client, so a failing server is not flooded with
+    retries.
+
+    :attr max_attempts: attempts per call including the first
+    :attr backoff: wait in seconds before the first retry
+    :attr max_backoff: longest wait in seconds between attempts
+    :attr jitter: randomise waits so clients do not retry in step
+    :attr statuses: response codes that are retried
+    :attr idempotent_methods: methods that are safe to send twice
+    :attr budget_ratio: retries allowed per request made
+    :attr budget_minimum: retries always allowed
+    """
+
+    max_attempts: int = 5
+    backoff: float = 0.5
+    max_backoff: float = 60.0
+    jitter: bool = True
+    statuses: FrozenSet[int] = RETRY_STATUSES
+    idempotent_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    budget_ratio: float = 0.2
+    budget_minimum: int = 10
+
+    def retryable(self, method: str, status_code: Optional[int] = None) -> bool:
+        r"""Check whether a failed attempt may be retried.
+
+        :param method: GET, DELETE, PUT, POST
+        :param status_code: response code or None after a connection error
+        :return: True when the attempt can be sent again
+        :rtype: bool
+        """
+        if status_code == TOO_MANY_REQUESTS:
+            return True
+        if method.upper() not in self.idempotent_methods:
+            return False
+        return status_code is None or status_code in self.statuses
+
+    def delay(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> float:
+        r"""Seconds to wait before the next attempt.
+
+        :param attempt: number of the attempt that failed, starting at 1
+        :param response: failed response if there was one
+        :return: seconds to wait
+        :rtype: float
+        """
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay  # nosec
+
+
+def _retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = arrow.get(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - arrow.utcnow()).total_seconds())
+
+
+class RetryStats:
+    r"""Counters for the calls made by a client.
+
+    :attr requests: attempts sent, including retries
+    :attr retries: attempts that were retries
+    :attr backoff_seconds: total time spent waiting to retry
+    :attr gave_up: calls that still failed after the last allowed attempt
+    """
+
+    def __init__(self):
+        r"""Make zeroed counters."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.backoff_seconds = 0.0
+        self.gave_up = 0
+
+    def record_request(self):
+        r"""Count an attempt."""
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, delay: float):
+        r"""Count a retry and the time waited for it.
+
+        :param delay: seconds waited before the retry
+        """
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+
+    def record_gave_up(self):
+        r"""Count a call that could not be retried any further."""
+        with self._lock:
+            self.gave_up += 1
+
+    def within_budget(self, policy: RetryPolicy) -> bool:
+        r"""Check the retry budget.
+
+        :param policy: policy with the budget
+        :return: True while another retry is allowed
+        :rtype: bool
+        """
+        allowed = policy.budget_minimum + policy.budget_ratio * self.requests
+        return self.retries < allowed
+
+    def snapshot(self) -> Dict[str, float]:
+        r"""Read all counters at once.
+
+        :return: counters by name
+        :rtype: Dict[str, float]
+        """
+        with self._lock:
+            return self._counters()
+
+    def reset(self) -> Dict[str, float]:
+        r"""Zero the counters, for example at the start of a run.
+
+        :return: counters before they were reset
+        :rtype: Dict[str, float]
+        """
+        with self._lock:
+            before = self._counters()
+            self.requests = 0
+            self.retries = 0
+            self.backoff_seconds = 0.0
+            self.gave_up = 0
+            return before
+
+    def _counters(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "backoff_seconds": self.backoff_seconds,
+            "gave_up": self.gave_up,
+        }
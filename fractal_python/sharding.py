@@ -0,0 +1,135 @@
+"""Date range sharding of paged retrievals across worker threads."""
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Callable, Generator, List, Optional, Tuple
+
+import arrow
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fractal_python.api_client import ApiClient
+
+DEFAULT_WINDOW = timedelta(days=30)
+DEFAULT_SHARD_WORKERS = 4
+MIN_WINDOW = timedelta(days=1)
+
+Window = Tuple[arrow.Arrow, arrow.Arrow]
+
+
+class _Windows:
+    r"""Split a date range into consecutive windows.
+
+    Without a target_size every window is window long. With one, each new
+    window is sized from the density of the windows fetched so far to hold
+    about target_size items, doubling while none have been seen.
+    """
+
+    def __init__(
+        self,
+        start: arrow.Arrow,
+        end: arrow.Arrow,
+        window: timedelta,
+        target_size: Optional[int] = None,
+    ):
+        self._next = start
+        self._end = end
+        self._window = window
+        self._target_size = target_size
+        self._items = 0
+        self._seconds = 0.0
+
+    def take(self) -> Optional[Window]:
+        if self._next >= self._end:
+            return None
+        size = self._window
+        if self._target_size and self._seconds:
+            if self._items:
+                density = self._items / self._seconds
+                size = timedelta(seconds=self._target_size / density)
+            else:
+                size = max(size, timedelta(seconds=self._seconds))
+        upper = min(self._next + max(size, MIN_WINDOW), self._end)
+        window = (self._next, upper)
+        self._next = upper
+        return window
+
+    def observe(self, window: Window, count: int):
+        self._items += count
+        self._seconds += (window[1] - window[0]).total_seconds()
+
+
+def retrieve_sharded(
+    retrieve: Callable[..., Generator[List[Any], None, None]],
+    client: "ApiClient",
+    company_id: str,
+    start: Any,
+    end: Any,
+    date_attr: str,
+    window: timedelta = DEFAULT_WINDOW,
+    target_size: Optional[int] = None,
+    max_workers: int = DEFAULT_SHARD_WORKERS,
+    **kwargs,
+) -> Generator[List[Any], None, None]:
+    r"""Retrieve a date range as windows fetched concurrently.
+
+    Each window is retrieved with from and to set to its bounds, so windows
+    share their boundary instant and items on it are dropped from the later
+    window. Windows are yielded in date order, each sorted by date_attr.
+
+    :param retrieve: paged retrieval accepting from and to, such as
+        retrieve_bank_transactions
+    :param client: Live or Sandbox API Client
+    :param company_id: Identifier of the Company
+    :param start: start of the range, anything arrow.get accepts
+    :param end: end of the range, anything arrow.get accepts
+    :param date_attr: attribute of the items to order them by
+    :param window: length of each window, or of the first when adaptive
+    :param target_size: items wanted per window to size windows from the
+        density seen so far, None for fixed windows
+    :param max_workers: windows fetched at once
+    :param **kwargs: passed to retrieve, such as account_id or lazy
+    :yield: the items of each window in date order
+    :rtype: Generator[List[Any], None, None]
+    :raises ValueError: when raw or fields are given, as items are merged by
+        their attributes
+    """
+    if kwargs.get("raw") or kwargs.get("fields"):
+        raise ValueError("sharded retrieval merges models, not raw or fields")
+    start, end = arrow.get(start), arrow.get(end)
+    windows = _Windows(start, end, window, target_size)
+
+    def order(item: Any) -> arrow.Arrow:
+        return getattr(item, date_attr) or start
+
+    def fetch(bounds: Window) -> List[Any]:
+        dates = {"from": bounds[0].isoformat(), "to": bounds[1].isoformat()}
+        items = [
+            item
+            for page in retrieve(client, company_id, **dates, **kwargs)
+            for item in page
+        ]
+        items.sort(key=order)
+        return items
+
+    previous_ids: set = set()
+    with ThreadPoolExecutor(max_workers, thread_name_prefix="fractal-shard") as pool:
+        pending: collections.deque = collections.deque()
+        try:
+            while True:
+                while len(pending) < max_workers:
+                    bounds = windows.take()
+                    if bounds is None:
+                        break
+                    pending.append((bounds, pool.submit(fetch, bounds)))
+                if not pending:
+                    return
+                bounds, future = pending.popleft()
+                items = future.result()
+                windows.observe(bounds, len(items))
+                page = [item for item in items if item.id not in previous_ids]
+                previous_ids = {item.id for item in items}
+                if page:
+                    yield page
+        finally:
+            for _, future in pending:
+                future.cancel()
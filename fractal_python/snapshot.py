@@ -0,0 +1,172 @@
+"""Everything needed for one company's cash position, fetched concurrently."""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+import attr
+
+from fractal_python.api_client import ApiClient
+from fractal_python.banking.accounts import (
+    BankAccount,
+    BankBalance,
+    BankTransaction,
+    iter_bank_accounts,
+    iter_bank_balances,
+    iter_bank_transactions,
+)
+from fractal_python.forecasting import (
+    Forecast,
+    ForecastedBalance,
+    iter_forecasted_balances,
+    iter_forecasts,
+)
+
+DEFAULT_SNAPSHOT_WORKERS = 8
+STAGES = (
+    "accounts",
+    "balances",
+    "transactions",
+    "forecasts",
+    "forecasted_balances",
+)
+
+
+@attr.s(auto_attribs=True, slots=True)
+class AccountSnapshot:
+    r"""A bank account with its balances, transactions and forecasts.
+
+    :attr account: the bank account
+    :attr balances: balances of the account
+    :attr transactions: transactions of the account
+    :attr forecasts: forecasts made for the account
+    :attr forecasted_balances: forecasted balances of the account
+    """
+
+    account: BankAccount
+    balances: List[BankBalance]
+    transactions: List[BankTransaction]
+    forecasts: List[Forecast]
+    forecasted_balances: List[ForecastedBalance]
+
+
+@attr.s(auto_attribs=True, slots=True)
+class CompanySnapshot:
+    r"""The bank accounts of a company with everything linked to them.
+
+    :attr company_id: the company
+    :attr accounts: one AccountSnapshot per bank account
+    :attr timings: seconds from the first call of each stage to the end of
+        its last, and the total
+    """
+
+    company_id: str
+    accounts: List[AccountSnapshot]
+    timings: Dict[str, float]
+
+
+class _Timings:
+    r"""Wall clock span of each stage across the calls made for it."""
+
+    def __init__(self):
+        self._spans: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def timed(self, stage: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                first, last = self._spans.get(stage, (start, end))
+                self._spans[stage] = (min(first, start), max(last, end))
+
+    def report(self, total: float) -> Dict[str, float]:
+        timings = {
+            stage: self._spans[stage][1] - self._spans[stage][0]
+            for stage in STAGES
+            if stage in self._spans
+        }
+        timings["total"] = total
+        return timings
+
+
+def get_company_snapshot(
+    client: ApiClient,
+    company_id: str,
+    max_workers: int = DEFAULT_SNAPSHOT_WORKERS,
+    **kwargs,
+) -> CompanySnapshot:
+    r"""Get the bank accounts of a company and everything linked to them.
+
+    The accounts are retrieved first. Then the balances, transactions,
+    forecasts and forecasted balances of every account are retrieved at once,
+    up to max_workers calls at a time, through the same client.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param max_workers: calls made at once
+    :type max_workers: int
+    :param **kwargs: See below
+
+    :Keyword Arguments:
+        *from* only balances, transactions and forecasted balances on or
+        after from date
+        *to* only balances, transactions and forecasted balances on or before
+        to date
+        and other keyword arguments of the retrievals, such as lazy
+    :return: the accounts with their balances, transactions and forecasts
+    :rtype: CompanySnapshot
+
+    Usage::
+
+      >>> snapshot = get_company_snapshot(client, company_id, max_workers=16)
+      >>> for account in snapshot.accounts:
+      ...     print(account.account.nickname, len(account.transactions))
+      >>> print(snapshot.timings)
+    """
+    start = time.perf_counter()
+    timings = _Timings()
+    undated = {k: v for k, v in kwargs.items() if k not in ("from", "to")}
+    accounts = timings.timed(
+        "accounts", list, iter_bank_accounts(client, company_id, **undated)
+    )
+    with ThreadPoolExecutor(max_workers, thread_name_prefix="fractal-snapshot") as pool:
+
+        def submit(stage: str, iterate: Callable, account: BankAccount, **args):
+            items = iterate(
+                client,
+                company_id,
+                bank_id=account.bank_id,
+                account_id=account.id,
+                **args,
+            )
+            return pool.submit(timings.timed, stage, list, items)
+
+        futures: List[Tuple[BankAccount, List[Future]]] = [
+            (
+                account,
+                [
+                    submit("balances", iter_bank_balances, account, **kwargs),
+                    submit("transactions", iter_bank_transactions, account, **kwargs),
+                    submit("forecasts", iter_forecasts, account, **undated),
+                    submit(
+                        "forecasted_balances",
+                        iter_forecasted_balances,
+                        account,
+                        **kwargs,
+                    ),
+                ],
+            )
+            for account in accounts
+        ]
+        snapshots = [
+            AccountSnapshot(account, *(future.result() for future in stages))
+            for account, stages in futures
+        ]
+    return CompanySnapshot(
+        company_id, snapshots, timings.report(time.perf_counter() - start)
+    )
@@ -0,0 +1,180 @@
+"""Incremental parsing of paged responses as they are read from the socket."""
+import codecs
+import json
+from typing import Any, Callable, Iterator, Optional
+
+import deserialize
+import requests
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+_NUMBER = frozenset("0123456789+-.eE")
+_NOT_PARSED = object()
+
+
+class PageStream:
+    r"""Items of one page, parsed from the response body as it arrives.
+
+    The body is read in chunks and each record of the ``results`` array is
+    decoded and built as soon as its closing brace arrives, so only one
+    record and the unread part of one chunk are held at a time. ``links`` is
+    parsed wherever it appears in the body and its ``next`` url is known once
+    the page is exhausted.
+
+    :attr next_page: url of the next page, None until the page is exhausted
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        build: Optional[Callable[[Any], Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        r"""Start parsing a response made with stream=True.
+
+        :param response: response whose body has not been read
+        :param build: function from a JSON record to an item, None to keep the dict
+        :param chunk_size: bytes read from the socket at a time
+        """
+        self.next_page: Optional[str] = None
+        self._response = response
+        self._build = build
+        self._chunks = response.iter_content(chunk_size)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._index = 0
+        self._eof = False
+        self._records = self._parse()
+
+    def __iter__(self) -> Iterator:
+        r"""Iterate over the items of the page.
+
+        :return: this page
+        :rtype: Iterator
+        """
+        return self
+
+    def __next__(self) -> Any:
+        r"""Parse and build the next item, stopping once the results are exhausted.
+
+        :return: the next item
+        :rtype: Any
+        """
+        record = next(self._records)
+        return record if self._build is None else self._build(record)
+
+    def finish(self) -> Optional[str]:
+        r"""Skip the items not yet read to find the link to the next page.
+
+        :return: url of the next page, or None on the last page
+        :rtype: Optional[str]
+        """
+        for _ in self._records:
+            pass
+        return self.next_page
+
+    def close(self):
+        r"""Stop parsing and release the connection."""
+        self._records.close()
+        self._response.close()
+
+    def _parse(self) -> Iterator:
+        try:
+            seen_results = False
+            self._expect("{")
+            if self._peek() == "}":
+                self._index += 1
+            else:
+                while True:
+                    key = self._value()
+                    self._expect(":")
+                    if key == "results" and self._peek() == "[":
+                        seen_results = True
+                        self._index += 1
+                        if self._peek() == "]":
+                            self._index += 1
+                        else:
+                            while True:
+                                yield self._value()
+                                if self._separator("]"):
+                                    break
+                    else:
+                        value = self._value()
+                        if key == "links" and isinstance(value, dict):
+                            self.next_page = value.get("next", None)
+                        elif key == "results":
+                            raise deserialize.DeserializeException(
+                                f"Cannot deserialize '{type(value)}' to 'List'"
+                            )
+                    if self._separator("}"):
+                        break
+        finally:
+            self._response.close()
+        if not seen_results:
+            raise deserialize.DeserializeException(
+                f"Cannot deserialize '{type(None)}' to 'List'"
+            )
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            text = self._text.decode(b"", final=True)
+        else:
+            text = self._text.decode(chunk)
+        self._buffer = self._buffer[self._index :] + text
+        self._index = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while (
+                self._index < len(self._buffer)
+                and self._buffer[self._index] in _WHITESPACE
+            ):
+                self._index += 1
+            if self._index < len(self._buffer):
+                return self._buffer[self._index]
+            if not self._fill():
+                raise json.JSONDecodeError(
+                    "Unexpected end of response", self._buffer, self._index
+                )
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._index)
+        self._index += 1
+
+    def _separator(self, close: str) -> bool:
+        char = self._peek()
+        if char not in (",", close):
+            raise json.JSONDecodeError(
+                f"Expecting ',' or '{close}'", self._buffer, self._index
+            )
+        self._index += 1
+        return char == close
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            value = _NOT_PARSED
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._index)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+            if value is not _NOT_PARSED:
+                if not isinstance(value, (int, float)) or self._number_ends(end):
+                    self._index = end
+                    return value
+                self._fill()
+
+    def _number_ends(self, end: int) -> bool:
+        # a number running to the end of the buffer, even one cut short after
+        # its point or exponent, may continue in the next chunk
+        while end < len(self._buffer) and self._buffer[end] in _NUMBER:
+            end += 1
+        return end < len(self._buffer) or self._eof
@@ -0,0 +1,342 @@
+"""Incremental sync of banking data into a local SQLite database.
+
+Each run of :func:`sync_company` refreshes the accounts of a company and,
+per account, fetches only the balances and transactions dated from that
+account's high-water mark, less an overlap so late arriving and changed
+records are picked up again and upserted.
+"""
+import sqlite3
+import threading
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, cast
+
+import arrow
+import attr
+
+from fractal_python import json_backend
+from fractal_python.api_client import ApiClient
+from fractal_python.banking.accounts import (
+    BankAccount,
+    BankBalance,
+    BankTransaction,
+    retrieve_bank_accounts,
+    retrieve_bank_balances,
+    retrieve_bank_transactions,
+)
+from fractal_python.deserializer import deserializer
+
+DEFAULT_OVERLAP = timedelta(days=7)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    id TEXT PRIMARY KEY,
+    company_id TEXT NOT NULL,
+    bank_id INTEGER,
+    json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS balances (
+    id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    company_id TEXT NOT NULL,
+    date TEXT,
+    json TEXT NOT NULL,
+    PRIMARY KEY (id, account_id)
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    company_id TEXT NOT NULL,
+    date TEXT,
+    json TEXT NOT NULL,
+    PRIMARY KEY (id, account_id)
+);
+CREATE INDEX IF NOT EXISTS balances_by_date
+    ON balances (company_id, account_id, date);
+CREATE INDEX IF NOT EXISTS transactions_by_date
+    ON transactions (company_id, account_id, date);
+CREATE TABLE IF NOT EXISTS high_water (
+    company_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    date TEXT NOT NULL,
+    PRIMARY KEY (company_id, account_id, kind)
+);
+"""
+
+# kind, which is also the name of its table: (model, retrieve, JSON key of the date)
+_KINDS: Dict[str, Tuple[Type, Callable[..., Iterator[List[Any]]], str]] = {
+    "balances": (BankBalance, retrieve_bank_balances, "date"),
+    "transactions": (BankTransaction, retrieve_bank_transactions, "bookingDate"),
+}
+_BY_COMPANY = "company_id = ?"
+_BY_ACCOUNT = "company_id = ? AND account_id = ?"
+
+
+@attr.s(auto_attribs=True, slots=True)
+class SyncReport:
+    r"""What one run of sync_company stored.
+
+    :attr accounts: accounts upserted
+    :attr balances: balances upserted
+    :attr transactions: transactions upserted
+    """
+
+    accounts: int = 0
+    balances: int = 0
+    transactions: int = 0
+
+
+class SyncStore:
+    r"""SQLite database of accounts, balances and transactions.
+
+    Records are stored as the JSON the API returned, keyed by id and
+    account_id, next to the columns needed to query them. The store can be
+    shared by threads.
+
+    Usage::
+
+      >>> with SyncStore("fractal.db") as store:
+      ...     sync_company(client, store, company_id)
+      ...     for transaction in store.bank_transactions(company_id):
+      ...         print(transaction.amount)
+
+    :attr path: location of the database
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        r"""Open or create a database.
+
+        :param path: database file, defaults to an in-memory database
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SyncStore":
+        r"""Use the store as a context manager.
+
+        :return: this store
+        :rtype: SyncStore
+        """
+        return self
+
+    def __exit__(self, *args):
+        r"""Close the store on leaving the context.
+
+        :param *args: exception details, ignored
+        """
+        self.close()
+
+    def close(self):
+        r"""Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def high_water(
+        self, company_id: str, account_id: str, kind: str
+    ) -> Optional[arrow.Arrow]:
+        r"""Get the latest date synced for an account.
+
+        :param company_id: Identifier of the Company
+        :param account_id: Identifier of the bank account
+        :param kind: balances or transactions
+        :return: the latest date stored, None before the first sync
+        :rtype: Optional[arrow.Arrow]
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT date FROM high_water"
+                " WHERE company_id = ? AND account_id = ? AND kind = ?",
+                (company_id, account_id, kind),
+            ).fetchone()
+        return arrow.get(row[0]) if row else None
+
+    def upsert_accounts(self, company_id: str, records: List[Dict[str, Any]]):
+        r"""Insert or replace accounts.
+
+        :param company_id: Identifier of the Company
+        :param records: accounts as the API returns them
+        """
+        rows = [
+            (record["id"], company_id, record.get("bankId"), json_backend.dumps(record))
+            for record in records
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO accounts VALUES (?, ?, ?, ?)", rows
+            )
+
+    def upsert(
+        self,
+        kind: str,
+        company_id: str,
+        account_id: str,
+        records: List[Dict[str, Any]],
+        high_water: Optional[arrow.Arrow] = None,
+    ):
+        r"""Insert or replace balances or transactions in one transaction.
+
+        :param kind: balances or transactions
+        :param company_id: Identifier of the Company
+        :param account_id: Identifier of the bank account
+        :param records: records as the API returns them
+        :param high_water: new latest date synced for the account, if any
+        """
+        table = _table(kind)
+        _, _, date_key = _KINDS[kind]
+        rows = [
+            (
+                record["id"],
+                record.get("accountId") or account_id,
+                company_id,
+                _utc(record.get(date_key)),
+                json_backend.dumps(record),
+            )
+            for record in records
+        ]
+        with self._lock, self._connection:
+            # table is one of the _KINDS, never a value from the caller
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?, ?, ?)",  # nosec
+                rows,
+            )
+            if high_water is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO high_water VALUES (?, ?, ?, ?)",
+                    (company_id, account_id, kind, _utc(high_water)),
+                )
+
+    def _load(self, sql: str, args: tuple, cls: Type) -> Iterator[Any]:
+        with self._lock:
+            rows = self._connection.execute(sql, args).fetchall()
+        build = deserializer(cls)
+        for (text,) in rows:
+            yield build(json_backend.loads(text))
+
+    def bank_accounts(self, company_id: str) -> Iterator[BankAccount]:
+        r"""Read the stored accounts of a company.
+
+        :param company_id: Identifier of the Company
+        :return: BankAccounts ordered by id
+        :rtype: Iterator[BankAccount]
+        """
+        return self._load(
+            "SELECT json FROM accounts WHERE company_id = ? ORDER BY id",
+            (company_id,),
+            BankAccount,
+        )
+
+    def bank_balances(
+        self, company_id: str, account_id: Optional[str] = None
+    ) -> Iterator[BankBalance]:
+        r"""Read the stored balances of a company or one of its accounts.
+
+        :param company_id: Identifier of the Company
+        :param account_id: Identifier of the bank account, None for all
+        :return: BankBalances in date order
+        :rtype: Iterator[BankBalance]
+        """
+        return self._dated("balances", company_id, account_id)
+
+    def bank_transactions(
+        self, company_id: str, account_id: Optional[str] = None
+    ) -> Iterator[BankTransaction]:
+        r"""Read the stored transactions of a company or one of its accounts.
+
+        :param company_id: Identifier of the Company
+        :param account_id: Identifier of the bank account, None for all
+        :return: BankTransactions in booking order
+        :rtype: Iterator[BankTransaction]
+        """
+        return self._dated("transactions", company_id, account_id)
+
+    def _dated(
+        self, kind: str, company_id: str, account_id: Optional[str]
+    ) -> Iterator[Any]:
+        table = _table(kind)
+        cls, _, _ = _KINDS[kind]
+        args: Tuple[str, ...]
+        if account_id is None:
+            where, args = _BY_COMPANY, (company_id,)
+        else:
+            where, args = _BY_ACCOUNT, (company_id, account_id)
+        # table is one of the _KINDS and where one of the _BY_ constants, the
+        # ids are only ever bound as parameters
+        return self._load(
+            f"SELECT json FROM {table} WHERE {where} ORDER BY date, id",  # nosec
+            args,
+            cls,
+        )
+
+
+def _table(kind: str) -> str:
+    if kind not in _KINDS:
+        raise ValueError(f"kind must be one of {', '.join(_KINDS)}, not {kind!r}")
+    return kind
+
+
+def _utc(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return arrow.get(value).to("utc").isoformat()
+
+
+def sync_company(
+    client: ApiClient,
+    store: SyncStore,
+    company_id: str,
+    overlap: timedelta = DEFAULT_OVERLAP,
+    **kwargs,
+) -> SyncReport:
+    r"""Bring the store up to date with the banking data of a company.
+
+    Accounts are always fetched in full. Balances and transactions of each
+    account are fetched from its high-water mark less overlap, or in full the
+    first time, and upserted a page at a time. The mark only moves once every
+    page has been stored, so an interrupted sync never skips records.
+
+    :param client: Live or Sandbox API Client
+    :type client: ApiClient
+    :param store: where the records are kept
+    :type store: SyncStore
+    :param company_id: Identifier of the Company
+    :type company_id: str
+    :param overlap: how far before the high-water mark to fetch again
+    :type overlap: timedelta
+    :param **kwargs: passed to the retrievals, such as page_size
+    :return: counts of the records upserted
+    :rtype: SyncReport
+    """
+    report = SyncReport()
+    pages = cast(
+        Iterator[List[Dict[str, Any]]],
+        retrieve_bank_accounts(client, company_id, raw=True, **kwargs),
+    )
+    accounts = [record for page in pages for record in page]
+    store.upsert_accounts(company_id, accounts)
+    report.accounts = len(accounts)
+    for account in accounts:
+        for kind, (_, retrieve, date_key) in _KINDS.items():
+            since = store.high_water(company_id, account["id"], kind)
+            dates = {"from": (since - overlap).isoformat()} if since else {}
+            pages = retrieve(
+                client,
+                company_id,
+                bank_id=account.get("bankId"),
+                account_id=account["id"],
+                raw=True,
+                **dates,
+                **kwargs,
+            )
+            latest = since
+            for page in pages:
+                store.upsert(kind, company_id, account["id"], page)
+                setattr(report, kind, getattr(report, kind) + len(page))
+                for record in page:
+                    if record.get(date_key):
+                        date = arrow.get(record[date_key])
+                        latest = date if latest is None else max(latest, date)
+            if latest is not None:
+                store.upsert(kind, company_id, account["id"], [], latest)
+    return report
@@ -0,0 +1,240 @@
+"""Token stores that let ApiClients share access tokens.
+
+A store is consulted by :meth:`fractal_python.api_client.ApiClient._authorise`
+before it asks the auth endpoint for a new token, so processes on one host can
+share a single valid token and skip the auth round trip at start up.
+"""
+import abc
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import threading
+from typing import Dict, Iterator, Optional
+
+import arrow
+import attr
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+DEFAULT_TOKEN_FILE = os.path.join("~", ".cache", "fractal_python", "tokens.json")
+
+
+@attr.s(auto_attribs=True)
+class Token:
+    r"""Access token issued by the auth endpoint.
+
+    :attr token_type: usually Bearer
+    :attr access_token: the secret token
+    :attr expires_at: when the token stops being accepted
+    """
+    token_type: str
+    access_token: str
+    expires_at: arrow.Arrow
+
+    @property
+    def authorization(self) -> str:
+        r"""Value for the Authorization header.
+
+        :return: token type and access token
+        :rtype: str
+        """
+        return f"{self.token_type} {self.access_token}"
+
+
+def token_key(auth_url: str, api_key: str, partner_id: str) -> str:
+    r"""Make the key a token is stored under.
+
+    The api key is hashed so it is never written to a store.
+
+    :param auth_url: url for authorisation
+    :param api_key: Secret API Key
+    :param partner_id: Unique partner id
+    :return: opaque key for the token
+    :rtype: str
+    """
+    digest = hashlib.sha256(f"{auth_url}\n{api_key}\n{partner_id}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class TokenStore(abc.ABC):
+    r"""Where tokens are kept between clients.
+
+    Subclasses implement load and save. Override lock to stop several clients
+    fetching a token at the same time; the default does no locking.
+    """
+
+    @abc.abstractmethod
+    def load(self, key: str) -> Optional[Token]:
+        r"""Load a stored token.
+
+        :param key: key from token_key
+        :return: the token or None when there is none
+        :rtype: Optional[Token]
+        """
+        return None
+
+    @abc.abstractmethod
+    def save(self, key: str, token: Token):
+        r"""Store a token.
+
+        :param key: key from token_key
+        :param token: token to store
+        """
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:  # skipcq: PYL-R0201
+        r"""Hold exclusive use of the key while a new token is fetched.
+
+        :param key: key from token_key
+        :yield: while the lock is held
+        """
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    r"""Share tokens between the clients of one process."""
+
+    def __init__(self):
+        r"""Make an empty store."""
+        self._tokens: Dict[str, Token] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[Token]:
+        r"""Load a stored token.
+
+        :param key: key from token_key
+        :return: the token or None when there is none
+        :rtype: Optional[Token]
+        """
+        return self._tokens.get(key)
+
+    def save(self, key: str, token: Token):
+        r"""Store a token.
+
+        :param key: key from token_key
+        :param token: token to store
+        """
+        self._tokens[key] = token
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        r"""Hold exclusive use of the store while a new token is fetched.
+
+        :param key: key from token_key
+        :yield: while the lock is held
+        """
+        with self._lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    r"""Share tokens between processes through a JSON file.
+
+    The file is only readable by its owner and is replaced atomically, so
+    readers never see a partial write. Fetching a token is serialised with an
+    advisory lock on a sibling ``.lock`` file.
+
+    :attr path: location of the token file
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        r"""Make a store backed by a file.
+
+        :param path: token file, defaults to ~/.cache/fractal_python/tokens.json
+        """
+        self.path = os.path.expanduser(path or DEFAULT_TOKEN_FILE)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, encoding="utf-8") as token_file:
+                tokens = json.load(token_file)
+        except (OSError, ValueError):
+            return {}
+        return tokens if isinstance(tokens, dict) else {}
+
+    def load(self, key: str) -> Optional[Token]:
+        r"""Load a stored token.
+
+        :param key: key from token_key
+        :return: the token or None when there is none
+        :rtype: Optional[Token]
+        """
+        stored = self._read().get(key)
+        if stored is None:
+            return None
+        try:
+            return Token(
+                token_type=stored["token_type"],
+                access_token=stored["access_token"],
+                expires_at=arrow.get(stored["expires_at"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, key: str, token: Token):
+        r"""Store a token, replacing the file atomically.
+
+        :param key: key from token_key
+        :param token: token to store
+        """
+        now = arrow.now()
+        tokens = {
+            stored_key: stored
+            for stored_key, stored in self._read().items()
+            if stored_key != key and _unexpired(stored, now)
+        }
+        tokens[key] = {
+            "token_type": token.token_type,
+            "access_token": token.access_token,
+            "expires_at": token.expires_at.isoformat(),
+        }
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as token_file:
+            json.dump(tokens, token_file)
+        os.replace(temporary, self.path)
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        r"""Hold an exclusive lock on the token file.
+
+        :param key: key from token_key
+        :yield: while the lock is held
+        """
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        with self._lock, open(f"{self.path}.lock", "a+b") as lock_file:
+            _lock_file(lock_file.fileno())
+            try:
+                yield
+            finally:
+                _unlock_file(lock_file.fileno())
+
+
+def _unexpired(stored: Dict[str, str], now: arrow.Arrow) -> bool:
+    try:
+        return arrow.get(stored["expires_at"]) > now
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+def _lock_file(descriptor: int):
+    if sys.platform == "win32":  # pragma: no cover
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+
+
+def _unlock_file(descriptor: int):
+    if sys.platform == "win32":  # pragma: no cover
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(descriptor, fcntl.LOCK_UN)
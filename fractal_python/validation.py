@@ -0,0 +1,97 @@
+"""How much of the data retrieved is checked by the models' validators.
+
+The compiled deserializers build models without running their attrs
+validators, which is the ``off`` policy and the default. ``full`` validates
+every model built and ``sampled`` validates a random sample of them, so data
+that breaks the models' rules is still caught at a fraction of the cost.
+
+Set the policy for a client with ``ApiClient(..., validation="sampled")`` or
+for one retrieval with ``validation=ValidationPolicy(SAMPLED, 0.05)``.
+"""
+import random
+from typing import Any, Callable, Optional, Union
+
+import attr
+
+FULL = "full"
+SAMPLED = "sampled"
+OFF = "off"
+MODES = (FULL, SAMPLED, OFF)
+DEFAULT_SAMPLE_RATE = 0.01
+
+
+def validate_model(model: Any):
+    r"""Run the attrs validators of a model and of the models nested in it.
+
+    The validators raise ValueError or TypeError for a value the model does
+    not allow.
+
+    :param model: attrs model, or a list of them
+    """
+    if isinstance(model, list):
+        for item in model:
+            validate_model(item)
+    elif attr.has(type(model)):
+        attr.validate(model)
+        for field in attr.fields(type(model)):
+            value = getattr(model, field.name)
+            if isinstance(value, list) or attr.has(type(value)):
+                validate_model(value)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ValidationPolicy:
+    r"""Which of the models built from a retrieval are validated.
+
+    :attr mode: full, sampled or off
+    :attr sample_rate: fraction of the models validated when sampled
+    :attr seed: seed of the sample, None for a different sample every time
+    """
+
+    mode: str = attr.ib(default=OFF, validator=attr.validators.in_(frozenset(MODES)))
+    sample_rate: float = DEFAULT_SAMPLE_RATE
+    seed: Optional[int] = None
+
+    def wrap(self, build: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        r"""Make build validate the models it builds under this policy.
+
+        :param build: function from a JSON record to a model
+        :return: build itself when off, else a function that also validates
+        :rtype: Callable[[Any], Any]
+        """
+        if self.mode == OFF:
+            return build
+        if self.mode == FULL:
+
+            def validated(record: Any) -> Any:
+                model = build(record)
+                validate_model(model)
+                return model
+
+            return validated
+        sample = random.Random(self.seed).random  # nosec
+        rate = self.sample_rate
+
+        def sampled(record: Any) -> Any:
+            model = build(record)
+            if sample() < rate:
+                validate_model(model)
+            return model
+
+        return sampled
+
+
+def validation_policy(
+    validation: Union[str, ValidationPolicy, None]
+) -> ValidationPolicy:
+    r"""Get the policy for a validation argument.
+
+    ValidationPolicy raises ValueError when validation is not a known mode.
+
+    :param validation: full, sampled, off or a ValidationPolicy, None for off
+    :return: the policy
+    :rtype: ValidationPolicy
+    """
+    if isinstance(validation, ValidationPolicy):
+        return validation
+    return ValidationPolicy(validation or OFF)
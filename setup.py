@@ -13,7 +13,7 @@ with open("HISTORY.rst") as history_file:
 requirements = [
     "requests>=2.25.1",
     "attrs>=20.3.0",
-    "deserialize>=1.8.0",
+    "deserialize>=1.8.0,<2.4",
     "arrow>=1.0.0",
     "stringcase>=1.2.0",
 ]
@@ -45,6 +45,7 @@ setup(
         "Programming Language :: Python :: 3.9",
     ],
     description="Python SDK for Fractal Labs API",
+    extras_require={"fast-json": ["orjson>=3.5.0"]},
     install_requires=requirements,
     license="Apache Software License 2.0",
     long_description=readme + "\n\n" + history,
@@ -0,0 +1,349 @@
+import asyncio
+import json
+
+import pytest
+
+from fractal_python import aio, banking, company, forecasting
+from fractal_python.aio import AsyncApiClient
+from fractal_python.aio import banking as aio_banking
+from fractal_python.aio import company as aio_company
+from fractal_python.aio import forecasting as aio_forecasting
+from fractal_python.aio.banking import (
+    iter_bank_transactions,
+    retrieve_bank_transactions,
+)
+from fractal_python.aio.company import get_company
+from fractal_python.aio.forecasting import get_forecasts
+from fractal_python.api_client import ApiClient
+from fractal_python.banking.accounts import BankTransaction
+from tests.test_api_client import TOKEN_RESPONSE
+from tests.test_bank_data import (
+    BANK_ID,
+    COMPANY_ID,
+    COMPANY_REQUEST_HEADERS,
+    GET_BANK_TRANSACTIONS,
+    GET_BANK_TRANSACTIONS_PAGED,
+    TEST_AUTH_URL,
+    TEST_BASE_URL,
+    TRANSACTIONS_ENDPOINT,
+    TRANSACTIONS_PAGE_1_NEXT_URL,
+)
+from tests.test_company import GET_COMPANY
+from tests.test_forecasting import GET_FORECASTS, GET_FORECASTS_PAGED
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+async def _items(pages):
+    return [item async for page in pages for item in page]
+
+
+@pytest.fixture()
+def async_client(requests_mock) -> AsyncApiClient:
+    requests_mock.register_uri("POST", "/token", text=json.dumps(TOKEN_RESPONSE))
+    requests_mock.register_uri(
+        "GET",
+        f"{TRANSACTIONS_ENDPOINT}?bankId={BANK_ID}",
+        json=GET_BANK_TRANSACTIONS_PAGED,
+        request_headers=COMPANY_REQUEST_HEADERS,
+    )
+    requests_mock.register_uri(
+        "GET",
+        TRANSACTIONS_PAGE_1_NEXT_URL,
+        json=GET_BANK_TRANSACTIONS,
+        request_headers=COMPANY_REQUEST_HEADERS,
+    )
+    requests_mock.register_uri("GET", "/forecasting/v2/forecasts", json=GET_FORECASTS)
+    requests_mock.register_uri(
+        "GET", "/company/v2/companies/CompanyID9890", json=GET_COMPANY
+    )
+    client = ApiClient(TEST_AUTH_URL, TEST_BASE_URL, "sandbox-key", "sandbox-partner")
+    return AsyncApiClient(client, max_workers=4)
+
+
+def test_retrieve_bank_transactions(async_client: AsyncApiClient):
+    pages = retrieve_bank_transactions(
+        async_client, company_id=COMPANY_ID, bank_id=BANK_ID
+    )
+    transactions = _run(_items(pages))
+    assert len(transactions) == 4
+    assert all(isinstance(x, BankTransaction) for x in transactions)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_iter_bank_transactions(async_client: AsyncApiClient, stream: bool):
+    async def collect():
+        items = iter_bank_transactions(
+            async_client, company_id=COMPANY_ID, bank_id=BANK_ID, stream=stream
+        )
+        return [item async for item in items]
+
+    transactions = _run(collect())
+    assert len(transactions) == 4
+    assert all(isinstance(x, BankTransaction) for x in transactions)
+
+
+def test_concurrent_calls(async_client: AsyncApiClient):
+    async def gather():
+        return await asyncio.gather(
+            _items(
+                retrieve_bank_transactions(
+                    async_client, company_id=COMPANY_ID, bank_id=BANK_ID
+                )
+            ),
+            _items(get_forecasts(async_client, company_id=COMPANY_ID)),
+            get_company(async_client, "CompanyID9890"),
+        )
+
+    transactions, forecasts, company = _run(gather())
+    assert len(transactions) == 4
+    assert len(forecasts) == len(GET_FORECASTS["results"])
+    assert company.id == "CompanyID9890"
+
+
+def test_close_pages_early(async_client: AsyncApiClient, requests_mock):
+    requests_mock.register_uri(
+        "GET", "/forecasting/v2/forecasts", json=GET_FORECASTS_PAGED
+    )
+
+    async def first_page():
+        pages = get_forecasts(async_client, company_id=COMPANY_ID)
+        page = await pages.__anext__()
+        await pages.aclose()
+        return page
+
+    assert len(_run(first_page())) == 1
+    assert requests_mock.call_count == 2
+
+
+def test_context_manager(async_client: AsyncApiClient):
+    async def use():
+        async with async_client as client:
+            return await get_company(client, "CompanyID9890")
+
+    assert _run(use()).id == "CompanyID9890"
+
+
+@pytest.mark.parametrize(
+    "paged,module,name,args,expected",
+    [
+        (aio_banking.retrieve_banks, banking, "retrieve_banks", (), {}),
+        (aio_banking.iter_banks, banking, "retrieve_banks", (), {}),
+        (
+            aio_banking.retrieve_bank_consents,
+            banking,
+            "retrieve_bank_consents",
+            (BANK_ID, COMPANY_ID),
+            {"bank_id": BANK_ID, "company_id": COMPANY_ID},
+        ),
+        (
+            aio_banking.iter_bank_consents,
+            banking,
+            "retrieve_bank_consents",
+            (BANK_ID, COMPANY_ID),
+            {"bank_id": BANK_ID, "company_id": COMPANY_ID},
+        ),
+        (
+            aio_banking.retrieve_bank_accounts,
+            banking,
+            "retrieve_bank_accounts",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+        (
+            aio_banking.iter_bank_accounts,
+            banking,
+            "retrieve_bank_accounts",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+        (
+            aio_banking.retrieve_bank_balances,
+            banking,
+            "retrieve_bank_balances",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+        (
+            aio_banking.iter_bank_balances,
+            banking,
+            "retrieve_bank_balances",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+        (aio_banking.retrieve_categories, banking, "retrieve_categories", (), {}),
+        (aio_banking.iter_categories, banking, "retrieve_categories", (), {}),
+        (aio_banking.retrieve_merchants, banking, "retrieve_merchants", (), {}),
+        (aio_banking.iter_merchants, banking, "retrieve_merchants", (), {}),
+        (aio_company.get_companies, company, "get_companies", (), {}),
+        (aio_company.iter_companies, company, "get_companies", (), {}),
+        (
+            aio_forecasting.get_forecasts,
+            forecasting,
+            "get_forecasts",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+        (
+            aio_forecasting.iter_forecasts,
+            forecasting,
+            "get_forecasts",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+        (
+            aio_forecasting.get_forecasted_transactions,
+            forecasting,
+            "get_forecasted_transactions",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+        (
+            aio_forecasting.iter_forecasted_transactions,
+            forecasting,
+            "get_forecasted_transactions",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+        (
+            aio_forecasting.get_forecasted_balances,
+            forecasting,
+            "get_forecasted_balances",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+        (
+            aio_forecasting.iter_forecasted_balances,
+            forecasting,
+            "get_forecasted_balances",
+            (COMPANY_ID,),
+            {"company_id": COMPANY_ID},
+        ),
+    ],
+)
+def test_paged_wrappers(
+    async_client: AsyncApiClient, mocker, paged, module, name, args, expected
+):
+    sync = mocker.patch.object(
+        module, name, return_value=(page for page in [["a", "b"], ["c"]])
+    )
+
+    async def collect():
+        return [x async for x in paged(async_client, *args, page_size=2)]
+
+    flat = paged.__name__.startswith("iter_")
+    assert _run(collect()) == (["a", "b", "c"] if flat else [["a", "b"], ["c"]])
+    sync.assert_called_once_with(async_client.client, page_size=2, **expected)
+
+
+def test_create_companies(async_client: AsyncApiClient, mocker):
+    created = mocker.patch.object(
+        company, "create_companies", return_value=(page for page in [["created"]])
+    )
+    pages = aio_company.create_companies(async_client, ["new"])
+    assert _run(_items(pages)) == ["created"]
+    created.assert_called_once_with(async_client.client, ["new"])
+
+
+@pytest.mark.parametrize(
+    "call,module,name,args,expected_args,expected_kwargs",
+    [
+        (
+            aio_banking.create_bank_consent,
+            banking,
+            "create_bank_consent",
+            (BANK_ID, "redirect", COMPANY_ID),
+            (BANK_ID, "redirect", COMPANY_ID),
+            {},
+        ),
+        (
+            aio_banking.put_bank_consent,
+            banking,
+            "put_bank_consent",
+            ("code", "token", "state", BANK_ID, "consent", COMPANY_ID),
+            (),
+            {
+                "code": "code",
+                "id_token": "token",
+                "state": "state",
+                "bank_id": BANK_ID,
+                "consent_id": "consent",
+                "company_id": COMPANY_ID,
+            },
+        ),
+        (
+            aio_banking.delete_bank_consent,
+            banking,
+            "delete_bank_consent",
+            (BANK_ID, "consent", COMPANY_ID),
+            (),
+            {"bank_id": BANK_ID, "consent_id": "consent", "company_id": COMPANY_ID},
+        ),
+        (
+            aio_company.get_company,
+            company,
+            "get_company",
+            (COMPANY_ID,),
+            (COMPANY_ID,),
+            {},
+        ),
+        (
+            aio_company.delete_company,
+            company,
+            "delete_company",
+            (COMPANY_ID,),
+            (COMPANY_ID,),
+            {},
+        ),
+        (
+            aio_company.update_company,
+            company,
+            "update_company",
+            ("updated",),
+            ("updated",),
+            {},
+        ),
+    ],
+)
+def test_call_wrappers(
+    async_client: AsyncApiClient,
+    mocker,
+    call,
+    module,
+    name,
+    args,
+    expected_args,
+    expected_kwargs,
+):
+    sync = mocker.patch.object(module, name, return_value="done")
+    result = _run(call(async_client, *args))
+    assert result in ("done", None)
+    sync.assert_called_once_with(async_client.client, *expected_args, **expected_kwargs)
+
+
+def test_call_api_and_url(async_client: AsyncApiClient):
+    async def calls():
+        by_path = await async_client.call_api(
+            "/company/v2/companies/CompanyID9890", "GET"
+        )
+        by_url = await async_client.call_url(
+            f"{TEST_BASE_URL}/company/v2/companies/CompanyID9890", "GET"
+        )
+        return by_path.json(), by_url.json()
+
+    assert _run(calls()) == (GET_COMPANY, GET_COMPANY)
+
+
+@pytest.mark.parametrize("factory", [aio.sandbox, aio.live])
+def test_factories(factory):
+    client = factory("key", "partner", max_workers=3)
+    assert client.max_workers == 3
+    assert client.client.pool_maxsize == 3
+    _run(client.aclose())
@@ -1,10 +1,13 @@
 import json
+import threading
+import time
 
 import arrow
 import pytest
+import requests
 
 from fractal_python import api_client
-from fractal_python.api_client import ApiClient
+from fractal_python.api_client import ApiClient, DeadlineExceeded
 
 TOKEN_RESPONSE = {
     "access_token": "access token e.g. knkjkd123ldk",
@@ -53,3 +56,182 @@ def test_authorise(requests_mock, freezer, live):  # skipcq: PYL-W0613
     assert (
         live.expires_at.int_timestamp == arrow.now().shift(seconds=1800).int_timestamp
     )
+
+
+def test_session_reused(sandbox):
+    assert sandbox.session() is sandbox.session()
+
+
+def test_session_pool_settings(requests_mock):
+    client = api_client.sandbox("key", "partner", pool_connections=3, pool_maxsize=7)
+    adapter = client.session().get_adapter("https://sandbox.askfractal.com")
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+
+
+def test_session_recycled_after_keep_alive(requests_mock):
+    client = api_client.sandbox("key", "partner", keep_alive=0)
+    assert client.session() is not client.session()
+
+
+def test_close(sandbox):
+    session = sandbox.session()
+    sandbox.close()
+    assert sandbox.session() is not session
+
+
+def test_context_manager(requests_mock):
+    with api_client.sandbox("key", "partner") as client:
+        session = client.session()
+    assert client.session() is not session
+
+
+def test_calls_use_session(sandbox, requests_mock, mocker):
+    requests_mock.register_uri("GET", "/ping", text="pong")
+    spy = mocker.spy(sandbox.session(), "request")
+    sandbox.call_api("/ping", "GET")
+    assert [call[0][0] for call in spy.call_args_list] == ["POST", "GET"]
+
+
+def test_prefetch_keeps_order():
+    pages = api_client._prefetch((page for page in [[1], [2], [3]]), 2)
+    assert list(pages) == [[1], [2], [3]]
+
+
+def test_prefetch_raises_worker_error():
+    def failing():
+        yield [1]
+        raise ValueError("page 2")
+
+    pages = api_client._prefetch(failing(), 1)
+    assert next(pages) == [1]
+    with pytest.raises(ValueError):
+        next(pages)
+
+
+def test_prefetch_close_stops_worker():
+    closed = threading.Event()
+
+    def endless():
+        try:
+            page = 0
+            while True:
+                page += 1
+                yield [page]
+        finally:
+            closed.set()
+
+    pages = api_client._prefetch(endless(), 2)
+    assert next(pages) == [1]
+    pages.close()
+    assert closed.wait(timeout=5)
+
+
+def _slow_token(request, context):
+    time.sleep(0.05)
+    return json.dumps(TOKEN_RESPONSE)
+
+
+def test_authorise_single_flight(requests_mock):
+    token = requests_mock.register_uri("POST", "/token", text=_slow_token)
+    client = api_client.sandbox("key", "partner")
+    threads = [threading.Thread(target=client._authorise) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert token.call_count == 1
+    assert client.headers["Authorization"] == "Bearer access token e.g. knkjkd123ldk"
+
+
+def test_authorise_refreshes_within_margin(requests_mock):
+    token = requests_mock.register_uri(
+        "POST", "/token", text=json.dumps(TOKEN_RESPONSE)
+    )
+    client = api_client.sandbox("key", "partner", refresh_margin=120)
+    client._authorise()
+    client.expires_at = arrow.now().shift(seconds=100)
+    client._authorise()
+    assert token.call_count == 2
+    client._authorise()
+    assert token.call_count == 2
+
+
+def test_authorise_in_margin_leaves_refresh_to_other_thread(requests_mock):
+    token = requests_mock.register_uri(
+        "POST", "/token", text=json.dumps(TOKEN_RESPONSE)
+    )
+    client = api_client.sandbox("key", "partner", refresh_margin=120)
+    client.expires_at = arrow.now().shift(seconds=100)
+    with client._auth_lock:
+        client._authorise()
+    assert token.call_count == 0
+
+
+def test_authorise_does_not_mutate_headers(requests_mock):
+    requests_mock.register_uri("POST", "/token", text=json.dumps(TOKEN_RESPONSE))
+    client = api_client.sandbox("key", "partner")
+    client._authorise()
+    headers = client.headers
+    before = dict(headers)
+    client.expires_at = arrow.now().shift(seconds=-1)
+    client._authorise()
+    assert headers == before
+    assert client.headers is not headers
+
+
+def test_default_timeouts(sandbox, requests_mock):
+    requests_mock.register_uri("GET", "/banking/v2/banks", json={})
+    sandbox.call_api("/banking/v2/banks", "GET")
+    assert requests_mock.last_request.timeout == (
+        api_client.DEFAULT_CONNECT_TIMEOUT,
+        api_client.DEFAULT_READ_TIMEOUT,
+    )
+
+
+def test_timeouts_capped_by_deadline(requests_mock):
+    requests_mock.register_uri("POST", "/token", text=json.dumps(TOKEN_RESPONSE))
+    requests_mock.register_uri("GET", "/banking/v2/banks", json={})
+    client = api_client.sandbox("key", "partner", connect_timeout=5, read_timeout=None)
+    client.call_api("/banking/v2/banks", "GET", deadline=time.monotonic() + 2)
+    connect, read = requests_mock.last_request.timeout
+    assert 1 < connect <= 2
+    assert 1 < read <= 2
+
+
+def test_single_timeout_capped_by_deadline(sandbox, requests_mock):
+    requests_mock.register_uri("GET", "/banking/v2/banks", json={})
+    deadline = time.monotonic() + 2
+    sandbox.call_api("/banking/v2/banks", "GET", timeout=5, deadline=deadline)
+    assert 1 < requests_mock.last_request.timeout <= 2
+
+
+def test_connection_error_before_and_after_deadline():
+    def refused(*args, **kwargs):
+        raise requests.ConnectionError
+
+    def slow_refused(*args, **kwargs):
+        time.sleep(0.02)
+        raise requests.ConnectionError
+
+    with pytest.raises(requests.ConnectionError):
+        api_client._before_deadline(time.monotonic() + 60, "next", refused)
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        api_client._before_deadline(time.monotonic() + 0.01, "next", slow_refused)
+    assert exc_info.value.next_page == "next"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2021-03-01T09:32:39.831Z", "2021-03-01T09:32:39.831000+00:00"),
+        ("2021-03-01T09:32:39.831+01:00", "2021-03-01T09:32:39.831000+01:00"),
+        ("2021-03-01T09:32:39", "2021-03-01T09:32:39+00:00"),
+        ("2021-060", "2021-03-01T00:00:00+00:00"),
+        (1614591159, "2021-03-01T09:32:39+00:00"),
+        ("", None),
+    ],
+)
+def test_arrow_or_none(value, expected):
+    parsed = api_client._arrow_or_none(value)
+    assert (parsed.isoformat() if parsed else parsed) == expected
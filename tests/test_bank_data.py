@@ -1,11 +1,22 @@
 import json
+import pickle
+import time
 import uuid
+from decimal import Decimal
 from typing import Any, Callable, Dict, List, Type
 
+import attr
 import deserialize  # type: ignore
 import pytest
 
-from fractal_python.api_client import COMPANY_ID_HEADER, PARTNER_ID_HEADER, ApiClient
+from fractal_python.api_client import (
+    COMPANY_ID_HEADER,
+    PARTNER_ID_HEADER,
+    ApiClient,
+    DeadlineExceeded,
+    _arrow_or_none,
+    _money_amount,
+)
 from fractal_python.banking import (
     Bank,
     BankConsent,
@@ -15,6 +26,8 @@ from fractal_python.banking import (
     consents,
     create_bank_consent,
     delete_bank_consent,
+    iter_bank_consents,
+    iter_bank_transactions,
     new_bank,
     put_bank_consent,
     retrieve_bank_accounts,
@@ -24,7 +37,12 @@ from fractal_python.banking import (
     retrieve_banks,
     transactions,
 )
-from fractal_python.banking.accounts import BankAccount, BankBalance, BankTransaction
+from fractal_python.banking.accounts import (
+    BankAccount,
+    BankBalance,
+    BankTransaction,
+    MoneyAmount,
+)
 from tests.test_api_client import TOKEN_RESPONSE
 
 TEST_BASE_URL = "http://test"
@@ -252,6 +270,12 @@ def test_retrieve_all_bank_consents_multiple_page(test_client_paged: ApiClient):
     )
 
 
+def test_iter_bank_consents(test_client_paged: ApiClient):
+    bank_consents = list(iter_bank_consents(test_client_paged, bank_id=BANK_ID))
+    assert len(bank_consents) == 4
+    assert all(isinstance(consent, BankConsent) for consent in bank_consents)
+
+
 GET_BY_ID_BANK_CONSENTS_1_PAGE = {
     "results": [
         {
@@ -348,7 +372,8 @@ def test_put_bank_consent_404(put_consent_client, requests_mock):
         )
 
 
-def test_put_bank_consent_502(put_consent_client, requests_mock):
+def test_put_bank_consent_502(put_consent_client, requests_mock, mocker):
+    sleep = mocker.patch("fractal_python.api_client.time.sleep")
     requests_mock.register_uri(
         "PUT", f"{BANKS_ENDPOINT}/{BANK_ID}/{consents}/Consent502", status_code=502
     )
@@ -362,6 +387,7 @@ def test_put_bank_consent_502(put_consent_client, requests_mock):
             consent_id="Consent502",
             company_id=COMPANY_ID,
         )
+    assert sleep.call_count == put_consent_client.retry.max_attempts - 1
 
 
 @pytest.fixture()
@@ -783,6 +809,142 @@ def test_retrieve_bank_transactions(transactions_client: ApiClient):
     )
 
 
+def test_retrieve_bank_transactions_lazy(transactions_client: ApiClient):
+    _count_paged_items(
+        client=transactions_client,
+        call=retrieve_bank_transactions,
+        count=4,
+        cls=BankTransaction,
+        company_id=COMPANY_ID,
+        bank_id=BANK_ID,
+        lazy=True,
+    )
+
+
+def test_retrieve_bank_transactions_raw(transactions_client: ApiClient):
+    pages = list(
+        retrieve_bank_transactions(
+            transactions_client, company_id=COMPANY_ID, bank_id=BANK_ID, raw=True
+        )
+    )
+    assert pages == [
+        GET_BANK_TRANSACTIONS_PAGED["results"],
+        GET_BANK_TRANSACTIONS["results"],
+    ]
+
+
+def test_retrieve_bank_transactions_fields(transactions_client: ApiClient):
+    pages = list(
+        retrieve_bank_transactions(
+            transactions_client,
+            company_id=COMPANY_ID,
+            bank_id=BANK_ID,
+            fields=["id", "amount", "booking_date"],
+        )
+    )
+    items = [item for page in pages for item in page]
+    assert len(items) == 4
+    first = GET_BANK_TRANSACTIONS_PAGED["results"][0]
+    assert items[0] == {
+        "id": first["id"],
+        "amount": _money_amount(first["amount"]),
+        "booking_date": _arrow_or_none(first["bookingDate"]),
+    }
+
+
+def test_retrieve_bank_transactions_unknown_field(transactions_client: ApiClient):
+    with pytest.raises(ValueError):
+        next(
+            retrieve_bank_transactions(
+                transactions_client, company_id=COMPANY_ID, fields=["colour"]
+            )
+        )
+
+
+def test_iter_bank_transactions(transactions_client: ApiClient):
+    transactions = iter_bank_transactions(
+        transactions_client, company_id=COMPANY_ID, bank_id=BANK_ID
+    )
+    first = next(transactions)
+    assert isinstance(first, BankTransaction)
+    assert len(list(transactions)) == 3
+
+
+def test_iter_bank_transactions_page_size(
+    transactions_client: ApiClient, requests_mock
+):
+    transactions = iter_bank_transactions(
+        transactions_client, company_id=COMPANY_ID, bank_id=BANK_ID, page_size=500
+    )
+    assert len(list(transactions)) == 4
+    assert requests_mock.request_history[1].qs["pagesize"] == ["500"]
+
+
+def test_iter_closes_pages(transactions_client: ApiClient, requests_mock):
+    transactions = iter_bank_transactions(
+        transactions_client, company_id=COMPANY_ID, bank_id=BANK_ID
+    )
+    next(transactions)
+    transactions.close()
+    assert requests_mock.call_count == 2
+
+
+def test_bank_transactions_slotted(transactions_client: ApiClient):
+    transaction = next(
+        retrieve_bank_transactions(
+            transactions_client, company_id=COMPANY_ID, bank_id=BANK_ID
+        )
+    )[0]
+    assert not hasattr(transaction, "__dict__")
+    assert not hasattr(transaction.merchant, "__dict__")
+    assert isinstance(transaction, MoneyAmount)
+    assert attr.evolve(transaction, amount=Decimal("1.00")).amount == Decimal("1.00")
+    assert pickle.loads(pickle.dumps(transaction)) == transaction
+
+
+def test_retrieve_bank_transactions_prefetch(transactions_client: ApiClient):
+    _count_paged_items(
+        client=transactions_client,
+        call=retrieve_bank_transactions,
+        count=4,
+        cls=BankTransaction,
+        company_id=COMPANY_ID,
+        bank_id=BANK_ID,
+        prefetch=2,
+    )
+
+
+def test_retrieve_bank_transactions_deadline(transactions_client: ApiClient, mocker):
+    pages = retrieve_bank_transactions(
+        transactions_client, company_id=COMPANY_ID, bank_id=BANK_ID, deadline=60
+    )
+    assert len(next(pages)) == 2
+    later = time.monotonic() + 120
+    mocker.patch("fractal_python.api_client.time.monotonic", return_value=later)
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        next(pages)
+    assert exc_info.value.next_page == TRANSACTIONS_PAGE_1_NEXT_URL
+    mocker.stopall()
+    _count_paged_items(
+        client=transactions_client,
+        call=retrieve_bank_transactions,
+        count=2,
+        cls=BankTransaction,
+        company_id=COMPANY_ID,
+        next_page=exc_info.value.next_page,
+    )
+
+
+def test_retrieve_bank_transactions_deadline_passed(transactions_client: ApiClient):
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        next(
+            retrieve_bank_transactions(
+                transactions_client, company_id=COMPANY_ID, deadline=0
+            )
+        )
+    assert exc_info.value.next_page is None
+
+
 def _count_paged_items(
     client: ApiClient, call: Callable, count: int, cls: Type, **kwargs
 ):
@@ -790,3 +952,37 @@ def _count_paged_items(
     assert len(items) == count
     for item in items:
         assert isinstance(item, cls)
+
+
+def test_iter_bank_transactions_stream(transactions_client: ApiClient):
+    streamed = list(
+        iter_bank_transactions(
+            transactions_client, company_id=COMPANY_ID, bank_id=BANK_ID, stream=True
+        )
+    )
+    assert streamed == list(
+        iter_bank_transactions(
+            transactions_client, company_id=COMPANY_ID, bank_id=BANK_ID
+        )
+    )
+    assert len(streamed) == 4
+
+
+def test_retrieve_bank_transactions_stream_skips_unread(
+    transactions_client: ApiClient, requests_mock
+):
+    pages = retrieve_bank_transactions(
+        transactions_client, company_id=COMPANY_ID, bank_id=BANK_ID, stream=True
+    )
+    next(pages)
+    assert len(list(next(pages))) == len(GET_BANK_TRANSACTIONS["results"])
+    assert requests_mock.call_count == 3
+
+
+def test_stream_with_prefetch(transactions_client: ApiClient):
+    with pytest.raises(ValueError):
+        next(
+            retrieve_bank_transactions(
+                transactions_client, company_id=COMPANY_ID, stream=True, prefetch=2
+            )
+        )
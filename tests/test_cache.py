@@ -0,0 +1,122 @@
+import pytest
+
+from fractal_python import api_client
+from fractal_python.api_client import LIVE, SANDBOX, ApiClient
+from fractal_python.banking import banks_endpoint, iter_banks, retrieve_banks
+from fractal_python.cache import ResponseCache
+from tests.test_api_client import TOKEN_RESPONSE, make_sandbox
+from tests.test_bank_data import (
+    BANKS_1_PAGE_1,
+    BANKS_PAGE_1_NEXT_URL,
+    GET_BANKS_2_PAGE_1,
+)
+
+ETAG = '"banks-v1"'
+
+
+@pytest.fixture()
+def banks_client(requests_mock) -> ApiClient:
+    requests_mock.register_uri(
+        "GET",
+        banks_endpoint,
+        json=GET_BANKS_2_PAGE_1,
+        headers={"ETag": ETAG, "Last-Modified": "Wed, 21 Oct 2020 07:28:00 GMT"},
+    )
+    requests_mock.register_uri("GET", BANKS_PAGE_1_NEXT_URL, json=BANKS_1_PAGE_1)
+    return make_sandbox(requests_mock)
+
+
+def _bank_calls(requests_mock):
+    return [x for x in requests_mock.request_history if x.method == "GET"]
+
+
+def test_warm_lookup_makes_no_requests(banks_client: ApiClient, requests_mock):
+    cache = ResponseCache()
+    cold = list(iter_banks(banks_client, cache=cache))
+    requests_mock.reset_mock()
+    warm = list(iter_banks(banks_client, cache=cache))
+    assert warm == cold
+    assert len(warm) == 8
+    assert requests_mock.call_count == 0
+    assert cache.stats() == {
+        "hits": 2,
+        "revalidations": 0,
+        "misses": 2,
+        "evictions": 0,
+        "entries": 2,
+    }
+
+
+def test_expired_page_revalidated(banks_client: ApiClient, requests_mock, freezer):
+    cache = ResponseCache(ttl=60)
+    cold = list(iter_banks(banks_client, cache=cache))
+    freezer.tick(61)
+    requests_mock.register_uri("GET", banks_endpoint, status_code=304)
+    requests_mock.register_uri("GET", BANKS_PAGE_1_NEXT_URL, json=BANKS_1_PAGE_1)
+    requests_mock.reset_mock()
+    assert list(iter_banks(banks_client, cache=cache)) == cold
+    first, second = _bank_calls(requests_mock)
+    assert first.headers["If-None-Match"] == ETAG
+    assert first.headers["If-Modified-Since"] == "Wed, 21 Oct 2020 07:28:00 GMT"
+    assert "If-None-Match" not in second.headers
+    assert cache.revalidations == 1
+    assert cache.misses == 3
+
+
+def test_least_recently_used_evicted(banks_client: ApiClient, requests_mock):
+    cache = ResponseCache(max_entries=1)
+    list(iter_banks(banks_client, cache=cache))
+    requests_mock.reset_mock()
+    list(iter_banks(banks_client, cache=cache))
+    assert len(_bank_calls(requests_mock)) == 2
+    assert cache.evictions == 3
+
+
+def test_persisted(banks_client: ApiClient, requests_mock, tmp_path):
+    path = str(tmp_path / "reference.json")
+    list(iter_banks(banks_client, cache=ResponseCache(path=path)))
+    requests_mock.reset_mock()
+    cache = ResponseCache(path=path)
+    assert len(list(iter_banks(banks_client, cache=cache))) == 8
+    assert requests_mock.call_count == 0
+    cache.clear()
+    assert ResponseCache(path=path).stats()["entries"] == 0
+
+
+def test_cache_with_stream(banks_client: ApiClient):
+    with pytest.raises(ValueError):
+        next(retrieve_banks(banks_client, cache=ResponseCache(), stream=True))
+
+
+def test_sandbox_and_live_cached_apart(requests_mock):
+    for base_url, name in ((SANDBOX, "SANDBOX"), (LIVE, "LIVE")):
+        requests_mock.register_uri(
+            "GET",
+            base_url + banks_endpoint,
+            json={"results": [{"id": 1, "name": name, "logo": ""}], "links": {}},
+        )
+    requests_mock.register_uri("POST", "/token", json=TOKEN_RESPONSE)
+    cache = ResponseCache()
+    sandbox = api_client.sandbox("sandbox-key", "sandbox-partner")
+    live = api_client.live("live-key", "live-partner")
+    assert [x.name for x in iter_banks(sandbox, cache=cache)] == ["SANDBOX"]
+    assert [x.name for x in iter_banks(live, cache=cache)] == ["LIVE"]
+    assert [x.name for x in iter_banks(sandbox, cache=cache)] == ["SANDBOX"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_only_successful_gets_cached(banks_client: ApiClient, requests_mock):
+    requests_mock.register_uri("POST", banks_endpoint, status_code=201)
+    requests_mock.register_uri("GET", f"{banks_endpoint}/404", status_code=404)
+    cache = ResponseCache()
+    call_api = cache.wrap(banks_client.call_api, base_url=banks_client.base_url)
+    assert call_api(banks_endpoint, "POST").status_code == 201
+    assert call_api(f"{banks_endpoint}/404", "GET").status_code == 404
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_persisted_in_working_directory(banks_client: ApiClient, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    list(iter_banks(banks_client, cache=ResponseCache(path="reference.json")))
+    assert ResponseCache(path="reference.json").stats()["entries"] == 2
@@ -0,0 +1,161 @@
+import pytest
+
+from fractal_python.api_client import LIVE, SANDBOX, ApiClient
+from fractal_python.banking import (
+    iter_bank_transactions,
+    retrieve_bank_transactions,
+    transactions,
+)
+from fractal_python.checkpoint import (
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    checkpoint_key,
+)
+from tests.test_api_client import make_sandbox
+from tests.test_bank_data import (
+    BANK_ID,
+    COMPANY_ID,
+    GET_BANK_TRANSACTIONS,
+    GET_BANK_TRANSACTIONS_PAGED,
+    TRANSACTIONS_PAGE_1_NEXT_URL,
+)
+
+KEY = checkpoint_key(
+    SANDBOX, "sandbox-partner", transactions, COMPANY_ID, {"bankId": BANK_ID}
+)
+
+
+@pytest.fixture()
+def paged_client(requests_mock) -> ApiClient:
+    requests_mock.register_uri(
+        "GET", f"{transactions}?bankId={BANK_ID}", json=GET_BANK_TRANSACTIONS_PAGED
+    )
+    requests_mock.register_uri(
+        "GET", TRANSACTIONS_PAGE_1_NEXT_URL, json=GET_BANK_TRANSACTIONS
+    )
+    return make_sandbox(requests_mock)
+
+
+@pytest.fixture(params=["memory", "file"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCheckpointStore()
+    return FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+
+
+def test_key_ignores_page_size():
+    assert checkpoint_key(
+        SANDBOX, "p", "/a", "c", {"b": 1, "pageSize": 10}
+    ) == checkpoint_key(SANDBOX, "p", "/a", "c", {"b": "1"})
+    key = checkpoint_key(SANDBOX, "p", "/a", "c", {"b": 1})
+    assert key != checkpoint_key(SANDBOX, "p", "/a", "d", {"b": 1})
+    assert key != checkpoint_key(LIVE, "p", "/a", "c", {"b": 1})
+    assert key != checkpoint_key(SANDBOX, "q", "/a", "c", {"b": 1})
+
+
+def test_clients_on_other_apis_do_not_resume(
+    paged_client: ApiClient, store, requests_mock
+):
+    pages = retrieve_bank_transactions(
+        paged_client, COMPANY_ID, bank_id=BANK_ID, checkpoint=store
+    )
+    next(pages)
+    next(pages)
+    pages.close()
+    requests_mock.reset_mock()
+    other = ApiClient(SANDBOX, LIVE, "sandbox-key", "sandbox-partner")
+    pages = retrieve_bank_transactions(
+        other, COMPANY_ID, bank_id=BANK_ID, checkpoint=store
+    )
+    next(pages)
+    assert requests_mock.request_history[-1].url.startswith(LIVE)
+    assert store.load(KEY) == TRANSACTIONS_PAGE_1_NEXT_URL
+
+
+@pytest.mark.parametrize("options", [{}, {"prefetch": 2}, {"stream": True}])
+def test_checkpoint_saved_and_cleared(paged_client: ApiClient, store, options):
+    pages = retrieve_bank_transactions(
+        paged_client, COMPANY_ID, bank_id=BANK_ID, checkpoint=store, **options
+    )
+    list(next(pages))
+    assert store.load(KEY) is None
+    list(next(pages))
+    assert store.load(KEY) == TRANSACTIONS_PAGE_1_NEXT_URL
+    assert next(pages, None) is None
+    assert store.load(KEY) is None
+
+
+def test_resume(paged_client: ApiClient, store, requests_mock):
+    pages = retrieve_bank_transactions(
+        paged_client, COMPANY_ID, bank_id=BANK_ID, checkpoint=store
+    )
+    next(pages)
+    next(pages)
+    pages.close()
+    requests_mock.reset_mock()
+    resumed = list(
+        iter_bank_transactions(
+            paged_client, COMPANY_ID, bank_id=BANK_ID, checkpoint=store
+        )
+    )
+    assert len(resumed) == len(GET_BANK_TRANSACTIONS["results"])
+    assert [x.url for x in requests_mock.request_history] == [
+        TRANSACTIONS_PAGE_1_NEXT_URL
+    ]
+    assert store.load(KEY) is None
+
+
+def test_next_page_overrides_checkpoint(paged_client: ApiClient, store, requests_mock):
+    store.save(KEY, "https://example.com/not-resumed")
+    resumed = list(
+        iter_bank_transactions(
+            paged_client,
+            COMPANY_ID,
+            bank_id=BANK_ID,
+            checkpoint=store,
+            next_page=TRANSACTIONS_PAGE_1_NEXT_URL,
+        )
+    )
+    assert len(resumed) == len(GET_BANK_TRANSACTIONS["results"])
+    assert [x.url for x in requests_mock.request_history if x.method == "GET"] == [
+        TRANSACTIONS_PAGE_1_NEXT_URL
+    ]
+    assert store.load(KEY) is None
+
+
+def test_clear_without_checkpoint(store):
+    store.clear(KEY)
+    assert store.load(KEY) is None
+
+
+def test_file_store_survives_reopen(tmp_path):
+    path = str(tmp_path / "checkpoints.json")
+    FileCheckpointStore(path).save(KEY, TRANSACTIONS_PAGE_1_NEXT_URL)
+    assert FileCheckpointStore(path).load(KEY) == TRANSACTIONS_PAGE_1_NEXT_URL
+
+
+def test_incomplete_store_rejected():
+    class NoClear(CheckpointStore):
+        def load(self, key):
+            return None  # pragma: no cover
+
+        def save(self, key, next_page):
+            pass  # pragma: no cover
+
+    with pytest.raises(TypeError):
+        NoClear()
+
+
+def test_base_load_has_nothing_to_resume():
+    class Forgetful(CheckpointStore):
+        def load(self, key):
+            return super().load(key)
+
+        def save(self, key, next_page):
+            pass  # pragma: no cover
+
+        def clear(self, key):
+            pass  # pragma: no cover
+
+    assert Forgetful().load(KEY) is None
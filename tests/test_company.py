@@ -12,6 +12,7 @@ from fractal_python.company import (
     delete_company,
     get_companies,
     get_company,
+    iter_companies,
     new_company,
     update_company,
 )
@@ -194,6 +195,12 @@ def test_get_companies_multiple_page(test_client_paged: ApiClient):
     assert len(companies) == 2
 
 
+def test_iter_companies(test_client_paged: ApiClient):
+    companies = list(iter_companies(test_client_paged))
+    assert len(companies) == 2
+    assert all(isinstance(company, Company) for company in companies)
+
+
 def test_get_companies_empty_page(test_client: ApiClient, requests_mock):
     requests_mock.register_uri(
         "GET", "/company/v2/companies", json=dict(results=[], links={})
@@ -0,0 +1,124 @@
+import json
+import threading
+
+import pytest
+
+from fractal_python import api_client
+from fractal_python.api_client import ApiClient
+from fractal_python.concurrency import AdaptiveExecutor, AdaptiveLimit
+from fractal_python.forecasting import get_forecasts
+from tests.test_api_client import TOKEN_RESPONSE
+from tests.test_forecasting import GET_FORECASTS
+
+
+def test_limit_grows_additively():
+    limit = AdaptiveLimit(initial=2, max_limit=4)
+    for _ in range(4):
+        limit.acquire()
+        limit.release(200, 0.1)
+    assert 3 < limit.limit < 4
+    for _ in range(100):
+        limit.acquire()
+        limit.release(200, 0.1)
+    assert limit.limit == 4
+
+
+def test_limit_halves_once_per_round():
+    limit = AdaptiveLimit(initial=8, max_limit=8)
+    for _ in range(8):
+        limit.acquire()
+    for _ in range(8):
+        limit.release(429, 0.1)
+    assert limit.limit == 4
+    assert limit.decreases == 1
+
+
+@pytest.mark.parametrize("status_code", [None, 500, 503])
+def test_limit_cut_on_errors(status_code):
+    limit = AdaptiveLimit(initial=4, min_limit=3)
+    for _ in range(4):
+        limit.acquire()
+        limit.release(status_code, 0.1)
+    assert limit.limit == 3
+
+
+def test_limit_cut_on_latency():
+    limit = AdaptiveLimit(initial=1, max_limit=1)
+    limit.acquire()
+    limit.release(200, 0.1)
+    limit.acquire()
+    limit.release(200, 1.0)
+    assert limit.decreases == 1
+
+
+def test_acquire_waits_for_slot():
+    limit = AdaptiveLimit(initial=1, max_limit=1)
+    limit.acquire()
+    acquired = threading.Event()
+
+    def second():
+        limit.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=second)
+    thread.start()
+    assert not acquired.wait(0.05)
+    limit.release(200, 0.1)
+    assert acquired.wait(5)
+    thread.join()
+
+
+@pytest.fixture()
+def client(requests_mock) -> ApiClient:
+    requests_mock.register_uri("POST", "/token", text=json.dumps(TOKEN_RESPONSE))
+    requests_mock.register_uri("GET", "/forecasting/v2/forecasts", json=GET_FORECASTS)
+    return api_client.sandbox("key", "partner")
+
+
+def _forecasts(client: ApiClient, company_id: str):
+    return company_id, [x for y in get_forecasts(client, company_id) for x in y]
+
+
+def test_executor_map(client: ApiClient):
+    companies = [f"company{i}" for i in range(20)]
+    with AdaptiveExecutor(client, max_concurrency=8) as executor:
+        assert client.concurrency_limit is executor.limit
+        results = list(executor.map(_forecasts, companies))
+    assert [company for company, _ in results] == companies
+    assert all(len(forecasts) == 2 for _, forecasts in results)
+    assert client.concurrency_limit is None
+    report = executor.limit.report()
+    assert report["increases"] > 0
+    assert 1 <= report["settled"] <= 8
+
+
+def test_executor_installs_limit_on_enter(client: ApiClient):
+    executor = AdaptiveExecutor(client)
+    assert client.concurrency_limit is None
+    with pytest.raises(RuntimeError):
+        executor.map(_forecasts, ["company"])
+    with executor:
+        assert client.concurrency_limit is executor.limit
+    assert client.concurrency_limit is None
+
+
+def test_executor_refuses_gated_client(client: ApiClient):
+    with AdaptiveExecutor(client) as first:
+        with pytest.raises(RuntimeError):
+            with AdaptiveExecutor(client):
+                pass  # pragma: no cover
+        assert client.concurrency_limit is first.limit
+    assert client.concurrency_limit is None
+    client.concurrency_limit = AdaptiveLimit()
+    with pytest.raises(RuntimeError):
+        AdaptiveExecutor(client).__enter__()
+
+
+def test_executor_open_and_close_once(client: ApiClient):
+    executor = AdaptiveExecutor(client)
+    executor.close()
+    with executor:
+        with pytest.raises(RuntimeError):
+            executor.__enter__()
+        other = client.concurrency_limit = AdaptiveLimit()
+    assert client.concurrency_limit is other
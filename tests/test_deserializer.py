@@ -0,0 +1,281 @@
+import pickle
+from decimal import Decimal
+from typing import Any, List, Optional, Union
+
+import arrow
+import attr
+import deserialize  # type: ignore
+import pytest
+
+from fractal_python import deserializer as compiled
+from fractal_python.banking.accounts import (
+    BankAccount,
+    BankBalance,
+    BankTransaction,
+)
+from fractal_python.banking.banks import Bank, BankConsent
+from fractal_python.company import Company
+from fractal_python.deserializer import (
+    deserialize_list,
+    deserializer,
+    lazy_parser,
+    project_list,
+    projection,
+)
+from fractal_python.forecasting import (
+    Forecast,
+    ForecastedBalance,
+    ForecastedTransaction,
+)
+from tests.test_bank_data import (
+    GET_ALL_BANK_CONSENTS_1_PAGE,
+    GET_BANK_ACCOUNTS,
+    GET_BANK_BALANCES_RESPONSE,
+    GET_BANK_TRANSACTIONS,
+    GET_BANKS_2_PAGE_1,
+)
+from tests.test_company import GET_COMPANIES_1_PAGE_1
+from tests.test_forecasting import (
+    GET_FORECASTED_BALANCES,
+    GET_FORECASTED_TRANSACTIONS,
+    GET_FORECASTS,
+)
+
+
+@pytest.mark.parametrize(
+    "cls,response",
+    [
+        (Bank, GET_BANKS_2_PAGE_1),
+        (BankConsent, GET_ALL_BANK_CONSENTS_1_PAGE),
+        (BankAccount, GET_BANK_ACCOUNTS),
+        (BankBalance, GET_BANK_BALANCES_RESPONSE),
+        (BankTransaction, GET_BANK_TRANSACTIONS),
+        (Company, GET_COMPANIES_1_PAGE_1),
+        (Forecast, GET_FORECASTS),
+        (ForecastedTransaction, GET_FORECASTED_TRANSACTIONS),
+        (ForecastedBalance, GET_FORECASTED_BALANCES),
+    ],
+)
+def test_matches_deserialize(cls, response):
+    expected = deserialize.deserialize(List[cls], response["results"])
+    assert deserialize_list(cls, response["results"]) == expected
+
+
+def test_compiled_once():
+    assert deserializer(BankTransaction) is deserializer(BankTransaction)
+
+
+@attr.s(auto_attribs=True)
+@deserialize.auto_snake()
+@deserialize.key("name", "label")
+@deserialize.default("count", 0)
+@deserialize.ignore("cached")
+@deserialize.parser("count", int)
+class _Example:
+    name: str
+    count: int
+    nickname: Optional[str]
+    cached: Optional[str] = None
+
+
+def test_decorators():
+    example = deserializer(_Example)({"label": "x", "count": "3"})
+    assert example.name == "x"
+    assert example.count == 3
+    assert example.nickname is None
+    assert not hasattr(example, "cached")
+    assert deserializer(_Example)({"label": "y"}).count == 0
+
+
+def test_missing_required():
+    with pytest.raises(deserialize.DeserializeException):
+        deserializer(_Example)({"count": 1})
+
+
+def test_wrong_type():
+    with pytest.raises(deserialize.DeserializeException):
+        deserializer(_Example)({"label": 1})
+
+
+def test_not_a_list():
+    with pytest.raises(deserialize.DeserializeException):
+        deserialize_list(_Example, None)
+
+
+@pytest.mark.parametrize(
+    "cls,response",
+    [
+        (BankBalance, GET_BANK_BALANCES_RESPONSE),
+        (BankTransaction, GET_BANK_TRANSACTIONS),
+        (BankConsent, GET_ALL_BANK_CONSENTS_1_PAGE),
+        (ForecastedTransaction, GET_FORECASTED_TRANSACTIONS),
+    ],
+)
+def test_lazy_matches_eager(cls, response):
+    lazy = deserialize_list(cls, response["results"], lazy=True)
+    assert lazy == deserialize_list(cls, response["results"])
+    assert all(isinstance(item, cls) for item in lazy)
+
+
+def test_lazy_parses_once():
+    transaction = deserialize_list(
+        BankTransaction, GET_BANK_TRANSACTIONS["results"], lazy=True
+    )[0]
+    assert type(transaction).__name__ == "BankTransaction"
+    assert not hasattr(transaction, "__dict__")
+    parsed = transaction.booking_date
+    assert isinstance(parsed, arrow.Arrow)
+    assert transaction.booking_date is parsed
+    transaction.amount = Decimal("2.50")
+    assert transaction.amount == Decimal("2.50")
+
+
+def test_lazy_pickles_as_model():
+    transaction = deserialize_list(
+        BankTransaction, GET_BANK_TRANSACTIONS["results"], lazy=True
+    )[0]
+    copy = pickle.loads(pickle.dumps(transaction))
+    assert type(copy) is BankTransaction
+    assert copy == transaction
+
+
+@lazy_parser
+def _doubled(value):
+    return value * 2
+
+
+@attr.s(auto_attribs=True, eq=True)
+@deserialize.parser("count", _doubled)
+@deserialize.parser("total", _doubled)
+@deserialize.default("total", 0)
+class _Unslotted:
+    count: int
+    total: int
+
+
+def test_lazy_unslotted():
+    example = deserializer(_Unslotted, lazy=True)({"count": 2})
+    assert type(example).count is type(example).__dict__["count"]
+    assert example.total == 0
+    assert example.count == 4
+    assert example != _Unslotted(5, 0)
+    assert not example != _Unslotted(4, 0)
+    assert example != "count"
+    del example.count
+    with pytest.raises(AttributeError):
+        example.count
+
+
+def test_lazy_slotted_delete():
+    transaction = deserialize_list(
+        BankTransaction, GET_BANK_TRANSACTIONS["results"], lazy=True
+    )[0]
+    del transaction.amount
+    with pytest.raises(AttributeError):
+        transaction.amount
+
+
+@attr.s(auto_attribs=True)
+class _Node:
+    name: Any
+    tags: List[str]
+    anything: List[Any]
+    untyped: List
+    children: List["_Node"]
+    either: Union[int, str]
+
+
+def test_lists_and_unions():
+    node = deserializer(_Node)(
+        {
+            "name": {"x": 1},
+            "tags": ["a"],
+            "anything": [1, "b"],
+            "untyped": [None],
+            "children": [
+                {
+                    "name": "child",
+                    "tags": [],
+                    "anything": [],
+                    "untyped": [],
+                    "children": [],
+                    "either": "two",
+                }
+            ],
+            "either": 1,
+        }
+    )
+    assert node.name == {"x": 1}
+    assert node.anything == [1, "b"]
+    assert node.children[0].either == "two"
+    assert node.either == 1
+
+
+@pytest.mark.parametrize("field,value", [("tags", "a"), ("tags", [1]), ("either", 1.5)])
+def test_lists_and_unions_checked(field, value):
+    record = {
+        "name": None,
+        "tags": [],
+        "anything": [],
+        "untyped": [],
+        "children": [],
+        "either": 1,
+    }
+    record[field] = value
+    with pytest.raises(deserialize.DeserializeException):
+        deserializer(_Node)(record)
+
+
+def test_no_type_hints():
+    class Empty:
+        pass
+
+    with pytest.raises(deserialize.DeserializeException):
+        deserializer(Empty)
+
+
+def test_special_hint_has_no_args():
+    class Special:
+        _special = True
+        __args__ = (int,)
+
+    assert compiled._args(Special) == ()
+
+
+def test_project_list():
+    projected = project_list(
+        BankTransaction, ("id", "amount"), GET_BANK_TRANSACTIONS["results"]
+    )
+    assert projected[0] == {
+        "id": GET_BANK_TRANSACTIONS["results"][0]["id"],
+        "amount": Decimal(GET_BANK_TRANSACTIONS["results"][0]["amount"]),
+    }
+    with pytest.raises(deserialize.DeserializeException):
+        project_list(BankTransaction, ("id",), None)
+    with pytest.raises(ValueError):
+        projection(BankTransaction, ("id", "colour"))
+
+
+class _StaleOnce(dict):
+    r"""Misses the first lookup, as when another thread compiled meanwhile."""
+
+    def __init__(self):
+        super().__init__()
+        self.stale = True
+
+    def __getitem__(self, key):
+        if self.stale:
+            self.stale = False
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+
+def test_compiled_by_another_thread(monkeypatch):
+    deserializers = _StaleOnce()
+    build = deserializers[_Example, False] = object()
+    monkeypatch.setattr(compiled, "_DESERIALIZERS", deserializers)
+    assert deserializer(_Example) is build
+    projections = _StaleOnce()
+    project = projections[_Example, ("name",)] = object()
+    monkeypatch.setattr(compiled, "_PROJECTIONS", projections)
+    assert projection(_Example, ("name",)) is project
@@ -2,9 +2,11 @@ import pytest
 
 from fractal_python.api_client import COMPANY_ID_HEADER, PARTNER_ID_HEADER, ApiClient
 from fractal_python.forecasting import (
+    ForecastEntity,
     get_forecasted_balances,
     get_forecasted_transactions,
     get_forecasts,
+    iter_forecasted_transactions,
 )
 from tests.test_api_client import make_sandbox
 
@@ -176,6 +178,18 @@ def test_get_forecasted_transactions(forecasted_transactions_client: ApiClient):
         for item in sublist
     ]
     assert len(forecasted_transactions) == 4
+    assert not hasattr(forecasted_transactions[0], "__dict__")
+    assert isinstance(forecasted_transactions[0], ForecastEntity)
+
+
+def test_iter_forecasted_transactions(forecasted_transactions_client: ApiClient):
+    forecasted_transactions = list(
+        iter_forecasted_transactions(
+            client=forecasted_transactions_client, company_id="CompanyID1234"
+        )
+    )
+    assert len(forecasted_transactions) == 4
+    assert isinstance(forecasted_transactions[0], ForecastEntity)
 
 
 GET_FORECASTED_BALANCES_PAGED = {
@@ -0,0 +1,98 @@
+import copy
+import json
+
+import attr
+import pytest
+
+from fractal_python.api_client import ApiClient
+from fractal_python.banking import iter_bank_transactions, transactions
+from fractal_python.banking.accounts import (
+    SOURCES,
+    TRANSACTION_STATUS,
+    BankTransaction,
+)
+from fractal_python.deserializer import deserialize_list
+from fractal_python.interning import Interner, intern_string
+from tests.test_api_client import make_sandbox
+from tests.test_bank_data import COMPANY_ID, GET_BANK_TRANSACTIONS
+
+FIRST = GET_BANK_TRANSACTIONS["results"][0]
+
+
+def _repeated_page():
+    results = []
+    for index in range(4):
+        record = copy.deepcopy(FIRST)
+        record["id"] = f"transaction{index}"
+        results.append(record)
+    results.append(copy.deepcopy(GET_BANK_TRANSACTIONS["results"][1]))
+    return {"results": results, "links": {}}
+
+
+@pytest.fixture()
+def repeated_client(requests_mock) -> ApiClient:
+    requests_mock.register_uri("GET", transactions, json=_repeated_page())
+    return make_sandbox(requests_mock)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_shared_within_retrieval(repeated_client: ApiClient, lazy: bool):
+    items = list(iter_bank_transactions(repeated_client, COMPANY_ID, lazy=lazy))
+    assert len({id(x.merchant) for x in items}) == 2
+    assert len({id(x.category) for x in items}) == 2
+    assert items[0].merchant.name == "Dividends"
+
+
+def test_not_shared_between_retrievals(repeated_client: ApiClient):
+    first = next(iter_bank_transactions(repeated_client, COMPANY_ID))
+    second = next(iter_bank_transactions(repeated_client, COMPANY_ID))
+    assert first.merchant == second.merchant
+    assert first.merchant is not second.merchant
+
+
+def test_shared_across_retrievals(repeated_client: ApiClient):
+    interner = Interner()
+    first = next(iter_bank_transactions(repeated_client, COMPANY_ID, intern=interner))
+    second = next(iter_bank_transactions(repeated_client, COMPANY_ID, intern=interner))
+    assert first.merchant is second.merchant
+    assert len(interner) == 4
+    assert interner.misses == 4
+
+
+def test_intern_off(repeated_client: ApiClient):
+    items = list(iter_bank_transactions(repeated_client, COMPANY_ID, intern=False))
+    assert items[0].merchant == items[1].merchant
+    assert items[0].merchant is not items[1].merchant
+
+
+def test_inactive_outside_retrieval():
+    items = deserialize_list(BankTransaction, _repeated_page()["results"])
+    assert items[0].merchant is not items[1].merchant
+
+
+def test_unhashable_content_is_built():
+    interner = Interner()
+    value = {"id": "x", "tags": ["a"]}
+    assert interner.intern(dict, value, dict) == value
+    assert len(interner) == 0
+
+
+def test_enumerated_strings_interned():
+    results = json.loads(json.dumps(_repeated_page()["results"]))
+    first, second = deserialize_list(BankTransaction, results)[:2]
+    assert first.status is TRANSACTION_STATUS[0]
+    assert first.source is SOURCES[0]
+    assert first.currency is second.currency
+    assert first.type is second.type
+
+
+def test_intern_string_leaves_other_values():
+    assert intern_string(None) is None
+    assert intern_string(12) == 12
+
+
+def test_unknown_status_rejected():
+    transaction = deserialize_list(BankTransaction, [FIRST])[0]
+    attr.validate(transaction)
+    with pytest.raises(ValueError):
+        attr.validate(attr.evolve(transaction, status="SETTLED"))
@@ -0,0 +1,66 @@
+import json
+from decimal import Decimal
+
+import arrow
+import pytest
+
+from fractal_python import json_backend
+from fractal_python.api_client import ApiClient
+from fractal_python.company import Company, update_company
+from tests.test_api_client import make_sandbox
+from tests.test_bank_data import GET_BANK_TRANSACTIONS
+
+
+@pytest.fixture(params=list(json_backend.BACKENDS))
+def backend(request):
+    previous = json_backend.backend()
+    yield json_backend.use(request.param)
+    json_backend.use(previous.name)
+
+
+def test_round_trip(backend):
+    text = json_backend.dumps(GET_BANK_TRANSACTIONS)
+    assert json.loads(text) == GET_BANK_TRANSACTIONS
+    assert json_backend.loads(text) == GET_BANK_TRANSACTIONS
+    assert json_backend.loads(text.encode("utf-8")) == GET_BANK_TRANSACTIONS
+
+
+def test_default(backend):
+    assert json.loads(json_backend.dumps({"amount": Decimal("1.50")}, str)) == {
+        "amount": "1.50"
+    }
+
+
+def test_invalid(backend):
+    with pytest.raises(ValueError):
+        json_backend.loads('{"results": [')
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        json_backend.use("unknown")
+
+
+def test_ujson_not_used():
+    pytest.importorskip("ujson")
+    assert "ujson" not in json_backend.BACKENDS
+
+
+def test_prefers_fastest():
+    assert json_backend.backend() is next(iter(json_backend.BACKENDS.values()))
+
+
+def test_update_company_body(backend, requests_mock):
+    client: ApiClient = make_sandbox(requests_mock)
+    requests_mock.register_uri("PUT", "/company/v2/companies/1", status_code=204)
+    created_at = arrow.get("2020-11-13T12:51:40.878Z")
+    update_company(
+        client,
+        Company("Valid", None, None, None, None, None, "123", "1", created_at),
+    )
+    assert json.loads(requests_mock.last_request.text) == {
+        "name": "Valid",
+        "crn": "123",
+        "id": "1",
+        "createdAt": created_at.isoformat(),
+    }
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from fractal_python import api_client
+from fractal_python.banking.api import BANKING_ENDPOINT
+from fractal_python.company import COMPANY_ENDPOINT
+from fractal_python.rate_limit import RateLimiter, TokenBucket
+from tests.test_api_client import TOKEN_RESPONSE
+
+
+@pytest.fixture()
+def clock(mocker):
+    now = [1000.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    mocker.patch("fractal_python.rate_limit.time.monotonic", lambda: now[0])
+    return mocker.patch("fractal_python.rate_limit.time.sleep", side_effect=sleep)
+
+
+def test_bucket_burst_then_rate(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    waits = [bucket.acquire() for _ in range(5)]
+    assert waits == [0, 0, 0, 0.5, 0.5]
+
+
+def test_bucket_refills_up_to_burst(clock):
+    bucket = TokenBucket(rate=10, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock(60)
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0.1]
+
+
+def test_bucket_rejects_zero_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_limiter_endpoint_prefix(clock):
+    limiter = RateLimiter(
+        endpoints={BANKING_ENDPOINT: (1, 1), COMPANY_ENDPOINT: (5, 5)}
+    )
+    banking = f"https://x{BANKING_ENDPOINT}/transactions"
+    company = f"https://x{COMPANY_ENDPOINT}"
+    assert limiter.acquire(banking) == 0
+    assert limiter.acquire(company) == 0
+    assert limiter.acquire(banking) == 1
+    assert limiter.acquire("https://x/forecasting/v2/forecasts") == 0
+    assert limiter.waited_seconds == 1
+
+
+def test_limiter_overall_and_endpoint(clock):
+    limiter = RateLimiter(2, 1, endpoints={BANKING_ENDPOINT: (1, 1)})
+    assert limiter.acquire(f"https://x{BANKING_ENDPOINT}/banks") == 0
+    assert limiter.acquire(f"https://x{BANKING_ENDPOINT}/banks") == 1
+
+
+def test_client_requests_pass_through_limiter(requests_mock, mocker):
+    requests_mock.register_uri("POST", "/token", text=json.dumps(TOKEN_RESPONSE))
+    requests_mock.register_uri("GET", f"{BANKING_ENDPOINT}/banks", json={})
+    limiter = RateLimiter(100)
+    acquire = mocker.spy(limiter, "acquire")
+    client = api_client.sandbox("key", "partner", rate_limiter=limiter)
+    client.call_api(f"{BANKING_ENDPOINT}/banks", "GET")
+    client.call_api(f"{BANKING_ENDPOINT}/banks", "GET")
+    assert acquire.call_count == 2
@@ -0,0 +1,65 @@
+import attr
+import pytest
+
+from fractal_python.api_client import ApiClient
+from fractal_python.banking import ReferenceIndex, banks_endpoint, new_bank
+from fractal_python.banking.accounts import BankTransaction
+from fractal_python.banking.categories import Category, categories
+from fractal_python.banking.merchants import Merchant, merchants
+from fractal_python.deserializer import deserialize_list
+from tests.test_api_client import make_sandbox
+from tests.test_bank_data import BANKS_1_PAGE_1, GET_BANK_TRANSACTIONS
+from tests.test_categories import GET_CATEGORIES
+from tests.test_merchants import GET_MERCHANTS
+
+
+@pytest.fixture()
+def index() -> ReferenceIndex:
+    return ReferenceIndex(
+        banks=[new_bank(6, "Natwest"), new_bank(8, "Barclays")],
+        categories=[Category("categoryID9876", "Tax")],
+        merchants=[
+            Merchant("merchantId579", "HMRC", "", ""),
+            Merchant("m1", "Tesco", "", ""),
+            Merchant("m2", "tesco express", "", ""),
+            Merchant("m3", "Tesla", "", ""),
+            Merchant("m4", "Uber", "", ""),
+        ],
+    )
+
+
+def test_lookups(index: ReferenceIndex):
+    assert index.bank(6).name == "Natwest"
+    assert index.bank(7) is None
+    assert index.merchant("m4").name == "Uber"
+    assert index.category("categoryID9876").name == "Tax"
+
+
+def test_search_merchants(index: ReferenceIndex):
+    assert [x.id for x in index.search_merchants("TES")] == ["m1", "m2", "m3"]
+    assert [x.id for x in index.search_merchants("tesco")] == ["m1", "m2"]
+    assert [x.id for x in index.search_merchants("tes", limit=2)] == ["m1", "m2"]
+    assert index.search_merchants("zzz") == []
+    assert [x.id for x in index.merchants_named("TESCO")] == ["m1"]
+
+
+def test_enrich(index: ReferenceIndex):
+    transactions = deserialize_list(BankTransaction, GET_BANK_TRANSACTIONS["results"])
+    transactions[1] = attr.evolve(transactions[1], merchant=None)
+    rows = list(index.enrich(transactions))
+    assert rows[0].bank.name == "Natwest"
+    assert rows[0].merchant.name == "HMRC"
+    assert rows[0].category.name == "Tax"
+    assert rows[1].bank is None
+    assert rows[1].merchant is None
+
+
+def test_load(requests_mock):
+    client: ApiClient = make_sandbox(requests_mock)
+    requests_mock.register_uri("GET", banks_endpoint, json=BANKS_1_PAGE_1)
+    requests_mock.register_uri("GET", categories, json=GET_CATEGORIES)
+    requests_mock.register_uri("GET", merchants, json=GET_MERCHANTS)
+    index = ReferenceIndex.load(client)
+    assert len(index.banks) == len(BANKS_1_PAGE_1["results"])
+    assert len(index.categories) == len(GET_CATEGORIES["results"])
+    assert [x.name for x in index.search_merchants("g")] == ["Google"]
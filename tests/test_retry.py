@@ -0,0 +1,207 @@
+import json
+import time
+
+import arrow
+import pytest
+import requests
+
+from fractal_python import api_client
+from fractal_python.api_client import ApiClient, DeadlineExceeded
+from fractal_python.banking import retrieve_banks
+from fractal_python.retry import RetryPolicy, RetryStats
+from tests.test_api_client import TOKEN_RESPONSE
+from tests.test_bank_data import BANKS_1_PAGE_1, GET_BANKS_2_PAGE_1
+
+NO_WAIT = RetryPolicy(backoff=0, jitter=False)
+
+
+@pytest.fixture()
+def client(requests_mock, mocker) -> ApiClient:
+    mocker.patch("fractal_python.api_client.time.sleep")
+    requests_mock.register_uri("POST", "/token", text=json.dumps(TOKEN_RESPONSE))
+    return api_client.sandbox("key", "partner", retry=NO_WAIT)
+
+
+@pytest.mark.parametrize(
+    "method,status_code,expected",
+    [
+        ("GET", 429, True),
+        ("GET", 503, True),
+        ("GET", None, True),
+        ("GET", 404, False),
+        ("DELETE", 500, True),
+        ("POST", 429, True),
+        ("POST", 500, False),
+        ("POST", None, False),
+    ],
+)
+def test_retryable(method, status_code, expected):
+    assert RetryPolicy().retryable(method, status_code) == expected
+
+
+def _response(headers) -> requests.Response:
+    response = requests.Response()
+    response.headers.update(headers)
+    return response
+
+
+def test_delay_retry_after_seconds():
+    assert RetryPolicy().delay(1, _response({"Retry-After": "7"})) == 7
+
+
+def test_delay_retry_after_date(freezer):  # skipcq: PYL-W0613
+    when = arrow.utcnow().shift(seconds=30).format("ddd, DD MMM YYYY HH:mm:ss")
+    delay = RetryPolicy().delay(1, _response({"Retry-After": f"{when} GMT"}))
+    assert delay == pytest.approx(30, abs=1)
+
+
+def test_delay_retry_after_unparsable():
+    policy = RetryPolicy(backoff=1, jitter=False)
+    assert policy.delay(2, _response({"Retry-After": "soon"})) == 2
+
+
+def test_delay_exponential():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_delay_jitter():
+    policy = RetryPolicy(backoff=1, max_backoff=5)
+    assert all(0 <= policy.delay(3) <= 4 for _ in range(20))
+
+
+def test_paging_resumes_after_throttle(client: ApiClient, requests_mock):
+    requests_mock.register_uri("GET", "/banking/v2/banks", json=GET_BANKS_2_PAGE_1)
+    requests_mock.register_uri(
+        "GET",
+        "/banking/v2/banks?pageId=2",
+        [
+            {"status_code": 429, "headers": {"Retry-After": "3"}},
+            {"status_code": 503},
+            {"json": BANKS_1_PAGE_1},
+        ],
+    )
+    banks = [bank for page in retrieve_banks(client) for bank in page]
+    assert len(banks) == 8
+    stats = client.retry_stats.snapshot()
+    assert stats["retries"] == 2
+    assert stats["backoff_seconds"] == 3
+    assert stats["requests"] == 4
+
+
+def test_post_not_retried_on_server_error(client: ApiClient, requests_mock):
+    create = requests_mock.register_uri(
+        "POST", "/company/v2/companies", status_code=500
+    )
+    assert client.call_api("/company/v2/companies", "POST").status_code == 500
+    assert create.call_count == 1
+
+
+def test_gives_up_after_max_attempts(client: ApiClient, requests_mock):
+    banks = requests_mock.register_uri("GET", "/banking/v2/banks", status_code=502)
+    assert client.call_api("/banking/v2/banks", "GET").status_code == 502
+    assert banks.call_count == NO_WAIT.max_attempts
+    assert client.retry_stats.gave_up == 1
+
+
+def test_connection_error_retried(client: ApiClient, requests_mock):
+    requests_mock.register_uri(
+        "GET",
+        "/banking/v2/banks",
+        [{"exc": requests.ConnectionError}, {"json": BANKS_1_PAGE_1}],
+    )
+    assert client.call_api("/banking/v2/banks", "GET").status_code == 200
+
+
+def test_read_timeout_retried(client: ApiClient, requests_mock):
+    requests_mock.register_uri(
+        "GET",
+        "/banking/v2/banks",
+        [{"exc": requests.ReadTimeout}, {"json": BANKS_1_PAGE_1}],
+    )
+    assert client.call_api("/banking/v2/banks", "GET").status_code == 200
+
+
+def test_no_retry_past_deadline(client: ApiClient, requests_mock):
+    banks = requests_mock.register_uri(
+        "GET", "/banking/v2/banks", status_code=429, headers={"Retry-After": "30"}
+    )
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        client.call_api("/banking/v2/banks", "GET", deadline=time.monotonic() + 10)
+    assert exc_info.value.next_page == api_client.SANDBOX + "/banking/v2/banks"
+    assert banks.call_count == 1
+
+
+def test_throttled_past_deadline_resumable(client: ApiClient, requests_mock):
+    requests_mock.register_uri("GET", "/banking/v2/banks", json=GET_BANKS_2_PAGE_1)
+    requests_mock.register_uri(
+        "GET",
+        GET_BANKS_2_PAGE_1["links"]["next"],
+        status_code=429,
+        headers={"Retry-After": "10"},
+    )
+    pages = retrieve_banks(client, deadline=2)
+    assert len(next(pages)) == len(GET_BANKS_2_PAGE_1["results"])
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        next(pages)
+    assert exc_info.value.next_page == GET_BANKS_2_PAGE_1["links"]["next"]
+
+
+def test_connection_error_past_deadline(client: ApiClient, requests_mock):
+    client.retry = RetryPolicy(backoff=10, jitter=False)
+    requests_mock.register_uri("GET", "/banking/v2/banks", exc=requests.ConnectionError)
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        next(retrieve_banks(client, deadline=2))
+    assert exc_info.value.next_page is None
+
+
+def test_retry_disabled(requests_mock):
+    requests_mock.register_uri("POST", "/token", text=json.dumps(TOKEN_RESPONSE))
+    banks = requests_mock.register_uri("GET", "/banking/v2/banks", status_code=503)
+    client = api_client.sandbox("key", "partner", retry=None)
+    assert client.call_api("/banking/v2/banks", "GET").status_code == 503
+    assert banks.call_count == 1
+
+
+def test_connection_error_with_retry_disabled(requests_mock):
+    requests_mock.register_uri("POST", "/token", text=json.dumps(TOKEN_RESPONSE))
+    banks = requests_mock.register_uri(
+        "GET", "/banking/v2/banks", exc=requests.ConnectionError
+    )
+    client = api_client.sandbox("key", "partner", retry=None)
+    with pytest.raises(requests.ConnectionError):
+        client.call_api("/banking/v2/banks", "GET")
+    assert banks.call_count == 1
+
+
+def test_budget():
+    policy = RetryPolicy(budget_minimum=2, budget_ratio=0.5)
+    stats = RetryStats()
+    stats.record_retry(0)
+    stats.record_retry(0)
+    assert not stats.within_budget(policy)
+    stats.record_request()
+    stats.record_request()
+    assert stats.within_budget(policy)
+
+
+def test_stats_reset():
+    stats = RetryStats()
+    stats.record_request()
+    stats.record_retry(1.5)
+    assert stats.reset() == {
+        "requests": 1,
+        "retries": 1,
+        "backoff_seconds": 1.5,
+        "gave_up": 0,
+    }
+    assert stats.snapshot()["retries"] == 0
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_paged_retries_exhausted(client: ApiClient, requests_mock, stream: bool):
+    banks = requests_mock.register_uri("GET", "/banking/v2/banks", status_code=503)
+    with pytest.raises(requests.HTTPError) as exc_info:
+        next(retrieve_banks(client, stream=stream))
+    assert exc_info.value.response.status_code == 503
+    assert banks.call_count == NO_WAIT.max_attempts
@@ -0,0 +1,155 @@
+import json
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+import arrow
+import pytest
+
+from fractal_python.api_client import ApiClient
+from fractal_python.banking import (
+    balances,
+    retrieve_bank_balances_sharded,
+    retrieve_bank_transactions_sharded,
+    transactions,
+)
+from fractal_python.sharding import _Windows
+from tests.test_api_client import make_sandbox
+from tests.test_bank_data import (
+    COMPANY_ID,
+    GET_BANK_BALANCES_RESPONSE,
+    GET_BANK_TRANSACTIONS,
+)
+
+START = arrow.get("2020-01-01")
+
+
+def _records(template, date_key, days):
+    records = []
+    for day in days:
+        record = dict(template)
+        record["id"] = f"id{day}"
+        record[date_key] = START.shift(days=day).isoformat()
+        records.append(record)
+    return records
+
+
+def _serve(records, date_key):
+    def callback(request, context):
+        query = parse_qs(urlparse(request.url).query)
+        lower, upper = arrow.get(query["from"][0]), arrow.get(query["to"][0])
+        results = [
+            record
+            for record in reversed(records)
+            if lower <= arrow.get(record[date_key]) <= upper
+        ]
+        return json.dumps({"results": results, "links": {}})
+
+    return callback
+
+
+@pytest.fixture()
+def transactions_client(requests_mock) -> ApiClient:
+    template = GET_BANK_TRANSACTIONS["results"][0]
+    records = _records(template, "bookingDate", [0, 3, 10, 10, 20, 29, 30, 45, 59])
+    records[3]["id"] = "id10b"
+    requests_mock.register_uri("GET", transactions, text=_serve(records, "bookingDate"))
+    return make_sandbox(requests_mock)
+
+
+def test_transactions_sharded(transactions_client: ApiClient, requests_mock):
+    pages = list(
+        retrieve_bank_transactions_sharded(
+            transactions_client,
+            COMPANY_ID,
+            START,
+            START.shift(days=60),
+            window=timedelta(days=10),
+            max_workers=3,
+        )
+    )
+    items = [item for page in pages for item in page]
+    assert [item.id for item in items] == [
+        "id0",
+        "id3",
+        "id10b",
+        "id10",
+        "id20",
+        "id29",
+        "id30",
+        "id45",
+        "id59",
+    ]
+    transaction_calls = [x for x in requests_mock.request_history if x.method == "GET"]
+    assert len(transaction_calls) == 6
+
+
+def test_closing_early_cancels_pending_windows(transactions_client: ApiClient):
+    pages = retrieve_bank_transactions_sharded(
+        transactions_client,
+        COMPANY_ID,
+        START,
+        START.shift(days=60),
+        window=timedelta(days=10),
+        max_workers=3,
+    )
+    assert next(pages)[0].id == "id0"
+    pages.close()
+
+
+def test_transactions_sharded_adaptive(transactions_client: ApiClient, requests_mock):
+    items = [
+        item
+        for page in retrieve_bank_transactions_sharded(
+            transactions_client,
+            COMPANY_ID,
+            START,
+            START.shift(days=60),
+            window=timedelta(days=2),
+            target_size=4,
+            max_workers=1,
+        )
+        for item in page
+    ]
+    assert len(items) == 9
+    transaction_calls = [x for x in requests_mock.request_history if x.method == "GET"]
+    assert len(transaction_calls) < 30
+
+
+def test_balances_sharded(requests_mock):
+    template = GET_BANK_BALANCES_RESPONSE["results"][0]
+    records = _records(template, "date", [5, 1, 14])
+    requests_mock.register_uri("GET", balances, text=_serve(records, "date"))
+    pages = retrieve_bank_balances_sharded(
+        make_sandbox(requests_mock),
+        COMPANY_ID,
+        START,
+        START.shift(days=14),
+        window=timedelta(7),
+    )
+    assert [item.id for page in pages for item in page] == ["id1", "id5", "id14"]
+
+
+def test_sharded_raw(transactions_client: ApiClient):
+    with pytest.raises(ValueError):
+        next(
+            retrieve_bank_transactions_sharded(
+                transactions_client, COMPANY_ID, START, START.shift(days=1), raw=True
+            )
+        )
+
+
+def test_windows_fixed():
+    windows = _Windows(START, START.shift(days=25), timedelta(days=10))
+    taken = iter(windows.take, None)
+    assert [(a.day, b.day) for a, b in taken] == [(1, 11), (11, 21), (21, 26)]
+
+
+def test_windows_adaptive():
+    windows = _Windows(START, START.shift(days=100), timedelta(days=10), 50)
+    first = windows.take()
+    windows.observe(first, 0)
+    second = windows.take()
+    assert second[1] - second[0] == timedelta(days=10)
+    windows.observe(second, 200)
+    third = windows.take()
+    assert third[1] - third[0] == timedelta(days=5)
@@ -0,0 +1,57 @@
+import deserialize  # type: ignore
+import pytest
+
+from fractal_python import forecasting
+from fractal_python.api_client import ApiClient
+from fractal_python.banking import accounts, balances, transactions
+from fractal_python.snapshot import STAGES, CompanySnapshot, get_company_snapshot
+from tests.test_api_client import make_sandbox
+from tests.test_bank_data import (
+    COMPANY_ID,
+    GET_BANK_ACCOUNTS,
+    GET_BANK_BALANCES_RESPONSE,
+    GET_BANK_TRANSACTIONS,
+)
+from tests.test_forecasting import GET_FORECASTED_BALANCES, GET_FORECASTS
+
+
+@pytest.fixture()
+def snapshot_client(requests_mock) -> ApiClient:
+    for path, response in [
+        (accounts, GET_BANK_ACCOUNTS),
+        (balances, GET_BANK_BALANCES_RESPONSE),
+        (transactions, GET_BANK_TRANSACTIONS),
+        (forecasting.forecasts, GET_FORECASTS),
+        (forecasting.balances, GET_FORECASTED_BALANCES),
+    ]:
+        requests_mock.register_uri("GET", path, json=response)
+    return make_sandbox(requests_mock)
+
+
+def test_company_snapshot(snapshot_client: ApiClient, requests_mock):
+    snapshot = get_company_snapshot(snapshot_client, COMPANY_ID, **{"from": "2020"})
+    assert isinstance(snapshot, CompanySnapshot)
+    assert [x.account.id for x in snapshot.accounts] == [
+        "accountId1234",
+        "accountId5678",
+    ]
+    first = snapshot.accounts[0]
+    assert len(first.balances) == len(GET_BANK_BALANCES_RESPONSE["results"])
+    assert len(first.transactions) == len(GET_BANK_TRANSACTIONS["results"])
+    assert len(first.forecasts) == len(GET_FORECASTS["results"])
+    assert len(first.forecasted_balances) == len(GET_FORECASTED_BALANCES["results"])
+    assert set(snapshot.timings) == set(STAGES) | {"total"}
+    assert snapshot.timings["total"] >= snapshot.timings["accounts"]
+    calls = [x for x in requests_mock.request_history if x.method == "GET"]
+    assert len(calls) == 1 + 4 * 2
+    by_path = {
+        x.path: x.qs for x in calls if x.qs.get("accountid") == ["accountid1234"]
+    }
+    assert by_path[transactions.lower()]["from"] == ["2020"]
+    assert "from" not in by_path[forecasting.forecasts.lower()]
+
+
+def test_company_snapshot_error(snapshot_client: ApiClient, requests_mock):
+    requests_mock.register_uri("GET", transactions, json={"links": {}})
+    with pytest.raises(deserialize.DeserializeException):
+        get_company_snapshot(snapshot_client, COMPANY_ID)
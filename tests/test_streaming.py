@@ -0,0 +1,74 @@
+import json
+
+import deserialize  # type: ignore
+import pytest
+import requests
+
+from fractal_python.banking.accounts import BankTransaction
+from fractal_python.deserializer import deserialize_list, deserializer
+from fractal_python.streaming import PageStream
+from tests.test_bank_data import GET_BANK_TRANSACTIONS, GET_BANK_TRANSACTIONS_PAGED
+
+
+def _response(body: str, requests_mock) -> requests.Response:
+    requests_mock.register_uri("GET", "https://example.com/page", text=body)
+    return requests.get("https://example.com/page", stream=True)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_stream_matches_json(chunk_size, requests_mock):
+    body = json.dumps(GET_BANK_TRANSACTIONS_PAGED, indent=2)
+    page = PageStream(
+        _response(body, requests_mock), deserializer(BankTransaction), chunk_size
+    )
+    assert list(page) == deserialize_list(
+        BankTransaction, GET_BANK_TRANSACTIONS_PAGED["results"]
+    )
+    assert page.next_page == GET_BANK_TRANSACTIONS_PAGED["links"]["next"]
+
+
+def test_links_before_results(requests_mock):
+    body = json.dumps({"links": {"next": "next"}, "results": [{"a": 1.5}, {"a": 2}]})
+    page = PageStream(_response(body, requests_mock), chunk_size=3)
+    assert list(page) == [{"a": 1.5}, {"a": 2}]
+    assert page.next_page == "next"
+
+
+def test_finish_skips_unread(requests_mock):
+    body = json.dumps(GET_BANK_TRANSACTIONS)
+    page = PageStream(_response(body, requests_mock), chunk_size=16)
+    next(page)
+    assert page.finish() is None
+    assert list(page) == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    ['{"results": [], "links": {}}', '{"links": null, "count": 0, "results": []}'],
+)
+def test_empty_results(body, requests_mock):
+    page = PageStream(_response(body, requests_mock))
+    assert list(page) == []
+    assert page.next_page is None
+
+
+def test_numbers_split_across_chunks(requests_mock):
+    page = PageStream(
+        _response('{"results": [1, 234, 5.67, -8e2, true]}', requests_mock), None, 1
+    )
+    assert list(page) == [1, 234, 5.67, -800.0, True]
+
+
+@pytest.mark.parametrize("body", ['{"links": {}}', '{"results": null}', "{}"])
+def test_missing_results(body, requests_mock):
+    with pytest.raises(deserialize.DeserializeException):
+        list(PageStream(_response(body, requests_mock)))
+
+
+@pytest.mark.parametrize(
+    "body",
+    ['{"results": [{"a": 1} {"a": 2}]}', '{"results": [', '{"results": [x]}', "[]"],
+)
+def test_malformed(body, requests_mock):
+    with pytest.raises(json.JSONDecodeError):
+        list(PageStream(_response(body, requests_mock), chunk_size=4))
@@ -0,0 +1,105 @@
+import copy
+from decimal import Decimal
+
+import arrow
+import pytest
+
+from fractal_python.api_client import ApiClient
+from fractal_python.banking import accounts, balances, transactions
+from fractal_python.sync import SyncReport, SyncStore, sync_company
+from tests.test_api_client import make_sandbox
+from tests.test_bank_data import (
+    COMPANY_ID,
+    GET_BANK_ACCOUNTS,
+    GET_BANK_BALANCES_RESPONSE,
+    GET_BANK_TRANSACTIONS,
+)
+
+
+@pytest.fixture()
+def sync_client(requests_mock) -> ApiClient:
+    requests_mock.register_uri("GET", accounts, json=GET_BANK_ACCOUNTS)
+    requests_mock.register_uri("GET", balances, json=GET_BANK_BALANCES_RESPONSE)
+    requests_mock.register_uri("GET", transactions, json=GET_BANK_TRANSACTIONS)
+    return make_sandbox(requests_mock)
+
+
+@pytest.fixture()
+def store(tmp_path) -> SyncStore:
+    with SyncStore(str(tmp_path / "sync.db")) as sync_store:
+        yield sync_store
+
+
+def _dated_calls(requests_mock):
+    return [
+        x
+        for x in requests_mock.request_history
+        if x.method == "GET" and x.path != accounts.lower()
+    ]
+
+
+def test_first_sync(sync_client: ApiClient, store: SyncStore, requests_mock):
+    report = sync_company(sync_client, store, COMPANY_ID)
+    assert report == SyncReport(accounts=2, balances=6, transactions=4)
+    assert all("from" not in x.qs for x in _dated_calls(requests_mock))
+    assert [x.id for x in store.bank_accounts(COMPANY_ID)] == [
+        "accountId1234",
+        "accountId5678",
+    ]
+    assert [x.id for x in store.bank_balances(COMPANY_ID)] == [
+        "balanceId9876",
+        "balanceId3456",
+        "balanceId1234",
+    ]
+    stored = list(store.bank_transactions(COMPANY_ID, "accountId1234"))
+    assert len(stored) == 1
+    assert stored[0].booking_date == arrow.get("2020-10-16T00:00Z")
+    assert store.high_water(COMPANY_ID, "accountId1234", "transactions") == arrow.get(
+        "2020-10-16T00:00Z"
+    )
+
+
+def test_incremental_sync(sync_client: ApiClient, store: SyncStore, requests_mock):
+    sync_company(sync_client, store, COMPANY_ID)
+    changed = copy.deepcopy(GET_BANK_TRANSACTIONS)
+    changed["results"][1]["amount"] = "99.99"
+    requests_mock.register_uri("GET", transactions, json=changed)
+    requests_mock.reset_mock()
+    sync_company(sync_client, store, COMPANY_ID)
+    froms = {x.qs["from"][0].upper() for x in _dated_calls(requests_mock)}
+    assert {arrow.get(x) for x in froms} == {
+        arrow.get("2020-10-09T00:00Z"),
+        arrow.get("2020-09-28T00:00Z"),
+    }
+    stored = list(store.bank_transactions(COMPANY_ID, "accountId1234"))
+    assert [x.amount for x in stored] == [Decimal("99.99")]
+
+
+def test_high_water_kept_when_nothing_new(
+    sync_client: ApiClient, store: SyncStore, requests_mock
+):
+    sync_company(sync_client, store, COMPANY_ID)
+    requests_mock.register_uri("GET", transactions, json={"results": [], "links": {}})
+    sync_company(sync_client, store, COMPANY_ID)
+    assert store.high_water(COMPANY_ID, "accountId1234", "transactions") == arrow.get(
+        "2020-10-16T00:00Z"
+    )
+
+
+def test_records_without_dates(sync_client: ApiClient, store: SyncStore, requests_mock):
+    undated = copy.deepcopy(GET_BANK_TRANSACTIONS)
+    for record in undated["results"]:
+        record["bookingDate"] = None
+    requests_mock.register_uri("GET", transactions, json=undated)
+    requests_mock.register_uri("GET", balances, json={"results": [], "links": {}})
+    report = sync_company(sync_client, store, COMPANY_ID)
+    assert report == SyncReport(accounts=2, balances=0, transactions=4)
+    assert store.high_water(COMPANY_ID, "accountId1234", "transactions") is None
+    assert store.high_water(COMPANY_ID, "accountId1234", "balances") is None
+
+
+def test_unknown_kind(store: SyncStore):
+    with pytest.raises(ValueError):
+        store.upsert("statements", COMPANY_ID, "accountId1234", [])
+    with pytest.raises(ValueError):
+        list(store._dated("accounts; DROP TABLE accounts", COMPANY_ID, None))
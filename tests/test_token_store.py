@@ -0,0 +1,150 @@
+import json
+import os
+import stat
+import threading
+import time
+
+import arrow
+import pytest
+
+from fractal_python import api_client
+from fractal_python.token_store import (
+    FileTokenStore,
+    MemoryTokenStore,
+    Token,
+    TokenStore,
+    token_key,
+)
+from tests.test_api_client import TOKEN_RESPONSE
+
+KEY = token_key("https://auth", "secret-key", "partner")
+
+
+@pytest.fixture()
+def file_store(tmp_path) -> FileTokenStore:
+    return FileTokenStore(str(tmp_path / "cache" / "tokens.json"))
+
+
+@pytest.fixture()
+def token() -> Token:
+    return Token("Bearer", "abc", arrow.now().shift(seconds=1800))
+
+
+def test_file_round_trip(file_store: FileTokenStore, token: Token):
+    file_store.save(KEY, token)
+    assert FileTokenStore(file_store.path).load(KEY) == token
+
+
+def test_file_private_and_without_api_key(file_store: FileTokenStore, token: Token):
+    file_store.save(KEY, token)
+    assert stat.S_IMODE(os.stat(file_store.path).st_mode) == 0o600
+    with open(file_store.path) as token_file:
+        assert "secret-key" not in token_file.read()
+
+
+def test_file_missing_or_corrupt(file_store: FileTokenStore):
+    assert file_store.load(KEY) is None
+    os.makedirs(os.path.dirname(file_store.path))
+    with open(file_store.path, "w") as token_file:
+        token_file.write("{not json")
+    assert file_store.load(KEY) is None
+
+
+def test_file_drops_expired_tokens(file_store: FileTokenStore, token: Token):
+    file_store.save("old", Token("Bearer", "old", arrow.now().shift(seconds=-1)))
+    file_store.save(KEY, token)
+    with open(file_store.path) as token_file:
+        assert list(json.load(token_file)) == [KEY]
+
+
+def test_file_lock_is_exclusive(file_store: FileTokenStore):
+    order = []
+
+    def hold():
+        with FileTokenStore(file_store.path).lock(KEY):
+            order.append("second")
+
+    with file_store.lock(KEY):
+        thread = threading.Thread(target=hold)
+        thread.start()
+        time.sleep(0.05)
+        order.append("first")
+    thread.join()
+    assert order == ["first", "second"]
+
+
+@pytest.mark.parametrize("store_type", [MemoryTokenStore, FileTokenStore])
+def test_clients_share_token(requests_mock, tmp_path, store_type):
+    token = requests_mock.register_uri(
+        "POST", "/token", text=json.dumps(TOKEN_RESPONSE)
+    )
+    store = (
+        store_type(str(tmp_path / "tokens.json"))
+        if store_type is FileTokenStore
+        else store_type()
+    )
+    first = api_client.sandbox("key", "partner", token_store=store)
+    second = api_client.sandbox("key", "partner", token_store=store)
+    first._authorise()
+    second._authorise()
+    assert token.call_count == 1
+    assert second.headers["Authorization"] == first.headers["Authorization"]
+    assert second.expires_at == first.expires_at
+
+
+def test_store_token_near_expiry_refreshed(requests_mock, token: Token):
+    requests_mock.register_uri("POST", "/token", text=json.dumps(TOKEN_RESPONSE))
+    store = MemoryTokenStore()
+    client = api_client.sandbox("key", "partner", token_store=store)
+    stale = Token("Bearer", "stale", arrow.now().shift(seconds=10))
+    store.save(client._token_key, stale)
+    client._authorise()
+    assert client.headers["Authorization"] != stale.authorization
+    assert store.load(client._token_key).expires_at == client.expires_at
+
+
+def test_token_saved_while_waiting_for_lock_used(requests_mock, token: Token):
+    class RefreshedElsewhere(MemoryTokenStore):
+        def lock(self, key):
+            self.save(key, token)
+            return super().lock(key)
+
+    token_request = requests_mock.register_uri(
+        "POST", "/token", text=json.dumps(TOKEN_RESPONSE)
+    )
+    client = api_client.sandbox("key", "partner", token_store=RefreshedElsewhere())
+    client._authorise()
+    assert token_request.call_count == 0
+    assert client.headers["Authorization"] == token.authorization
+
+
+def test_incomplete_store_rejected():
+    class LoadOnly(TokenStore):
+        def load(self, key):
+            return None  # pragma: no cover
+
+    with pytest.raises(TypeError):
+        LoadOnly()
+
+
+def test_file_drops_corrupt_tokens(file_store: FileTokenStore, token: Token):
+    os.makedirs(os.path.dirname(file_store.path))
+    with open(file_store.path, "w") as token_file:
+        json.dump({"corrupt": {"expires_at": "never"}, "partial": {}}, token_file)
+    assert file_store.load("partial") is None
+    file_store.save(KEY, token)
+    with open(file_store.path) as token_file:
+        assert list(json.load(token_file)) == [KEY]
+
+
+def test_default_lock_and_load():
+    class Unlocked(TokenStore):
+        def load(self, key):
+            return super().load(key)
+
+        def save(self, key, token):
+            pass  # pragma: no cover
+
+    store = Unlocked()
+    with store.lock(KEY):
+        assert store.load(KEY) is None
@@ -0,0 +1,98 @@
+import copy
+
+import pytest
+
+from fractal_python.api_client import ApiClient
+from fractal_python.banking import iter_bank_transactions, transactions
+from fractal_python.banking.accounts import Merchant
+from fractal_python.deserializer import deserializer
+from fractal_python.validation import (
+    SAMPLED,
+    ValidationPolicy,
+    validate_model,
+    validation_policy,
+)
+from tests.test_api_client import make_sandbox
+from tests.test_bank_data import COMPANY_ID, GET_BANK_TRANSACTIONS
+
+
+def _valid():
+    return copy.deepcopy(GET_BANK_TRANSACTIONS["results"][0])
+
+
+def _page(*records):
+    return {"results": list(records), "links": {}}
+
+
+@pytest.fixture()
+def bad_status(requests_mock) -> ApiClient:
+    record = _valid()
+    record["status"] = "SETTLED"
+    requests_mock.register_uri("GET", transactions, json=_page(_valid(), record))
+    return make_sandbox(requests_mock)
+
+
+def test_off_by_default(bad_status: ApiClient):
+    items = list(iter_bank_transactions(bad_status, COMPANY_ID))
+    assert items[1].status == "SETTLED"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_full_rejects_bad_record(bad_status: ApiClient, lazy: bool):
+    items = iter_bank_transactions(bad_status, COMPANY_ID, lazy=lazy, validation="full")
+    with pytest.raises(ValueError):
+        list(items)
+
+
+def test_full_accepts_the_fixtures(requests_mock):
+    requests_mock.register_uri("GET", transactions, json=GET_BANK_TRANSACTIONS)
+    client = make_sandbox(requests_mock)
+    items = list(iter_bank_transactions(client, COMPANY_ID, validation="full"))
+    assert len(items) == len(GET_BANK_TRANSACTIONS["results"])
+
+
+def test_full_validates_nested_models(requests_mock):
+    record = _valid()
+    record["merchant"]["source"] = "GUESS"
+    requests_mock.register_uri("GET", transactions, json=_page(record))
+    client = make_sandbox(requests_mock)
+    with pytest.raises(ValueError):
+        list(iter_bank_transactions(client, COMPANY_ID, validation="full"))
+
+
+def test_client_policy_overridden_per_call(bad_status: ApiClient):
+    bad_status.validation = validation_policy("full")
+    with pytest.raises(ValueError):
+        list(iter_bank_transactions(bad_status, COMPANY_ID))
+    assert len(list(iter_bank_transactions(bad_status, COMPANY_ID, validation="off")))
+
+
+@pytest.mark.parametrize("rate,fails", [(1.0, True), (0.0, False)])
+def test_sampled(bad_status: ApiClient, rate: float, fails: bool):
+    policy = ValidationPolicy(SAMPLED, rate, seed=1)
+    items = iter_bank_transactions(bad_status, COMPANY_ID, validation=policy)
+    if fails:
+        with pytest.raises(ValueError):
+            list(items)
+    else:
+        assert len(list(items)) == 2
+
+
+def test_raw_not_validated(bad_status: ApiClient):
+    items = list(
+        iter_bank_transactions(bad_status, COMPANY_ID, raw=True, validation="full")
+    )
+    assert items[1]["status"] == "SETTLED"
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        validation_policy("strict")
+
+
+def test_validate_model_lists_and_values():
+    merchant = dict(_valid()["merchant"], source="GUESS")
+    validate_model("not a model")
+    validate_model([deserializer(Merchant)(_valid()["merchant"])])
+    with pytest.raises(ValueError):
+        validate_model([deserializer(Merchant)(merchant)])